@@ -20,10 +20,15 @@ def load_dictionary_view(request: ASGIRequest):
     This will be `/load-dictionary/` on `urls.py`
     """
     key = request.GET.get("key")
-    locale = request.GET.get("locale", "en")
+    # Several locales can be loaded at once with `?locale=en,ja`
+    locales = request.GET.get("locale", "en").split(",")
     if key != settings.LOAD_DICTIONARY_KEY:
         return JsonResponse({"status": "error"}, status=status.HTTP_403_FORBIDDEN)
-    from shiritori.game.tasks import load_dictionary_task
+    from shiritori.game.tasks import load_dictionaries_task, load_dictionary_task
 
-    load_dictionary_task.delay(locale)
+    sync = request.GET.get("sync") == "true"
+    if len(locales) == 1:
+        load_dictionary_task.delay(locales[0], sync)
+    else:
+        load_dictionaries_task.delay(locales, sync)
     return JsonResponse({"status": "ok"}, status=status.HTTP_200_OK)
@@ -1,10 +1,11 @@
 from django.conf import settings
 from rest_framework.routers import DefaultRouter, SimpleRouter
 
-from shiritori.game.views import GameViewSet
+from shiritori.game.views import DictionaryViewSet, GameViewSet
 
 router = DefaultRouter() if settings.DEBUG else SimpleRouter()
 router.register("game", GameViewSet, basename="game")
+router.register("dictionary", DictionaryViewSet, basename="dictionary")
 
 app_name = "api"
 urlpatterns = router.urls
@@ -17,6 +17,9 @@ from django.core.asgi import get_asgi_application
 
 django_app = get_asgi_application()
 
+from shiritori.game.dictionary import blocklist_registry, registry  # noqa: E402
+from shiritori.game.models import GameLocales  # noqa: E402
+
 # Routing
 from shiritori.game.routing import websocket_patterns as game_websocket_patterns  # noqa: E402, E402
 
@@ -28,6 +31,10 @@ sys.path.append(str(BASE_DIR))
 # If DJANGO_SETTINGS_MODULE is unset, default to the local settings
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
 
+# Build the dictionaries while the server starts instead of on the first request of each locale.
+registry.warm(GameLocales.values)
+blocklist_registry.warm(GameLocales.values)
+
 websocket_patterns = [
     *game_websocket_patterns,
 ]
@@ -246,6 +246,17 @@ CELERY_TASK_TIME_LIMIT = 60 * 60 * 20
 CELERY_TASK_SOFT_TIME_LIMIT = 60 * 60 * 24
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html#beat-entries
+CELERY_BEAT_SCHEDULE = {
+    "finish-idle-games": {
+        "task": "shiritori.game.tasks.finish_idle_games_task",
+        "schedule": 60,
+    },
+    "end-correspondence-turns": {
+        "task": "shiritori.game.tasks.end_correspondence_turns_task",
+        "schedule": 60,
+    },
+}
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
 CELERY_WORKER_SEND_TASK_EVENTS = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_send_sent_event
@@ -269,6 +280,12 @@ REST_FRAMEWORK = {
         "djangorestframework_camel_case.parser.CamelCaseJSONParser",
         # Any other parsers
     ),
+    "DEFAULT_THROTTLE_RATES": {
+        # Prefix hints are requested as the player types.
+        "prefix": env("PREFIX_HINT_THROTTLE_RATE", default="10/second"),
+        # Bulk validation requests each stream many words.
+        "validate": env("BULK_VALIDATE_THROTTLE_RATE", default="30/minute"),
+    },
 }
 
 # django-cors-headers - https://github.com/adamchainz/django-cors-headers#setup
@@ -288,3 +305,20 @@ SPECTACULAR_SETTINGS = {
 # ------------------------------------------------------------------------------
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 LOAD_DICTIONARY_KEY = env("LOAD_DICTIONARY_KEY", default="load_dictionary")
+# The largest body and the most words one bulk validation request may send, see `DictionaryViewSet.validate`.
+BULK_VALIDATE_MAX_BYTES = env.int("BULK_VALIDATE_MAX_BYTES", default=1024 * 1024)
+BULK_VALIDATE_MAX_WORDS = env.int("BULK_VALIDATE_MAX_WORDS", default=50_000)
+# Source word lists, one word per line, named `<locale>.txt`.
+DICTIONARY_DIR = BASE_DIR / "dictionaries"
+# Memory-mapped indexes built from the word lists, shared by every process on the host.
+DICTIONARY_INDEX_DIR = env("DICTIONARY_INDEX_DIR", default=str(BASE_DIR / ".dictionary_index"))
+DICTIONARY_INDEX_ENABLED = env.bool("DICTIONARY_INDEX_ENABLED", default=True)
+# Build a locale's indexes on a background thread on its first lookup, lookups use the database until they are ready.
+DICTIONARY_BACKGROUND_LOAD = env.bool("DICTIONARY_BACKGROUND_LOAD", default=True)
+# How often, in seconds, each process checks the cache for a reloaded word list.
+DICTIONARY_RELOAD_CHECK_INTERVAL = env.float("DICTIONARY_RELOAD_CHECK_INTERVAL", default=5)
+# Terms players may not use in names or words, one `<locale>.txt` file per locale.
+# Lines starting with `=` only block the exact name or word, other terms block any text containing them.
+BLOCKLIST_DIR = env("BLOCKLIST_DIR", default=str(BASE_DIR / "blocklists"))
+# Seconds a game may stay suspended, with no player connected, before it is finished.
+IDLE_GAME_TIMEOUT = env.int("IDLE_GAME_TIMEOUT", default=60 * 30)
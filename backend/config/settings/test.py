@@ -46,3 +46,6 @@ DATABASES = {
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 SESSION_COOKIE_DOMAIN = None
+# Tests control the dictionary through the `word` table, only use the index when a test asks for it.
+DICTIONARY_INDEX_ENABLED = False
+DICTIONARY_BACKGROUND_LOAD = False
@@ -0,0 +1,118 @@
+import random
+import typing
+
+from shiritori.game.dictionary import get_blocklist, get_dawg, get_letter_index
+from shiritori.game.models.text_choices import BotDifficulty
+from shiritori.game.utils import last_letter, loses_game
+
+if typing.TYPE_CHECKING:
+    from shiritori.game.models import Game
+
+__all__ = (
+    "BotProfile",
+    "BOT_PROFILES",
+    "bot_random",
+    "choose_bot_word",
+    "bot_think_time",
+)
+
+
+class BotProfile(typing.NamedTuple):
+    # Seconds the bot waits before playing, picked uniformly from this range every turn.
+    think_time: tuple[float, float]
+    # Chance that the bot lets the turn run out instead of playing.
+    miss_chance: float
+    # Words are sampled at random positions of the letter's words, this many at most.
+    samples: int
+    # The bot plays the best of the first `candidates` playable samples.
+    candidates: int
+    max_length: int | None
+    # Prefer words whose last letter starts the fewest words, leaving the next player the fewest options.
+    prefer_rare_letters: bool
+
+
+BOT_PROFILES = {
+    BotDifficulty.EASY: BotProfile(
+        think_time=(8, 15), miss_chance=0.15, samples=8, candidates=1, max_length=5, prefer_rare_letters=False
+    ),
+    BotDifficulty.MEDIUM: BotProfile(
+        think_time=(5, 10), miss_chance=0.05, samples=16, candidates=3, max_length=8, prefer_rare_letters=False
+    ),
+    BotDifficulty.HARD: BotProfile(
+        think_time=(2, 6), miss_chance=0, samples=32, candidates=8, max_length=None, prefer_rare_letters=True
+    ),
+}
+
+
+def bot_random(game_id: str, turn: int) -> random.Random:
+    """
+    Get the random number generator of a bot's turn.
+    It is seeded by the turn, so the turn loop and the move agree on the think time without storing it.
+    """
+    return random.Random(f"{game_id}:{turn}")
+
+
+def bot_think_time(difficulty: str, game_id: str, turn: int) -> float | None:
+    """
+    Get how many seconds the bot waits before playing the given turn.
+    :param difficulty: str - The difficulty of the bot.
+    :param game_id: str - The id of the game.
+    :param turn: int - The current turn of the game.
+    :return: Optional[float] - The think time in seconds, or None if the bot lets the turn run out.
+    """
+    profile = BOT_PROFILES[difficulty]
+    rng = bot_random(game_id, turn)
+    if rng.random() < profile.miss_chance:
+        return None
+    return rng.uniform(*profile.think_time)
+
+
+def choose_bot_word(game: "Game", difficulty: str) -> str | None:
+    """
+    Choose the word a bot plays in the current turn.
+
+    Words are drawn by their position in the locale's DAWG among the words that start with the
+    required letter, so a move costs a handful of graph walks and the used words come from the game's snapshot.
+    :param game: Game - The game the bot is playing.
+    :param difficulty: str - The difficulty of the bot.
+    :return: Optional[str] - The word to play, or None if the bot misses the turn.
+    """
+    profile = BOT_PROFILES[difficulty]
+    rng = bot_random(game.id, game.current_turn)
+    # Draw the same numbers as `bot_think_time` first, so both agree on whether the bot misses the turn.
+    if rng.random() < profile.miss_chance:
+        return None
+    rng.uniform(*profile.think_time)
+    locale, min_length = game.settings.locale, game.settings.word_length
+    if not game.last_word or (dawg := get_dawg(locale)) is None:
+        return None
+    letter = last_letter(game.last_word, locale)
+    if not (total := dawg.count_prefix(letter)):
+        return None
+
+    # The turn is played right after, on the same snapshot of the game.
+    used_words = game.state.used_words
+    blocklist = get_blocklist(locale)
+    candidates = []
+    for _ in range(profile.samples):
+        word = dawg.word_at(rng.randrange(total), letter)
+        if word in used_words or len(word) < min_length or game.settings.is_removed(word) or loses_game(word, locale):
+            continue
+        # A blocked word would be rejected, and the bot would miss its turn.
+        if blocklist is not None and word in blocklist:
+            continue
+        if profile.max_length and len(word) > max(profile.max_length, min_length):
+            continue
+        candidates.append(word)
+        if len(candidates) >= profile.candidates:
+            break
+    if not candidates:
+        return None
+
+    letters = get_letter_index(locale)
+    if profile.prefer_rare_letters and letters is not None:
+        return min(
+            candidates,
+            key=lambda candidate: (letters.count(last_letter(candidate, locale), min_length), -len(candidate)),
+        )
+    return max(candidates, key=len)
@@ -6,7 +6,14 @@ from djangorestframework_camel_case.settings import api_settings
 from djangorestframework_camel_case.util import camelize
 
 from shiritori.game import tasks
-from shiritori.game.converters import aconvert_game_to_json, adisconnect_player, aget_game, aget_player_from_cookie
+from shiritori.game.converters import (
+    aconvert_game_to_json,
+    adisconnect_player,
+    aget_game,
+    aget_player_from_cookie,
+    aget_timer_sync,
+    ais_correspondence_game,
+)
 from shiritori.game.models import Game, GameStatus, Player
 from shiritori.game.serializers import ShiritoriGameSerializer
 
@@ -24,7 +31,7 @@ class CamelizedWebSocketConsumer(AsyncJsonWebsocketConsumer):
 class GameLobbyConsumer(CamelizedWebSocketConsumer):
     @staticmethod
     def get_all_waiting_games():
-        all_waiting_games = Game.objects.filter(status=GameStatus.WAITING)
+        all_waiting_games = Game.objects.filter(status=GameStatus.WAITING).select_related("settings")
         return ShiritoriGameSerializer(all_waiting_games, many=True).data
 
     async def connect(self):
@@ -73,7 +80,12 @@ class GameConsumer(CamelizedWebSocketConsumer):
             else None
         )
         self_player.is_connected = True
+        if task_id := self_player.disconnect_task_id:
+            self_player.disconnect_task_id = None
+            await sync_to_async(tasks.cancel_player_disconnect)(task_id)
         await self_player.asave()  # type: ignore
+        if game.suspended_at:
+            await sync_to_async(game.resume)()
         await self.channel_layer.group_add(self.game_group_name, self.channel_name)
 
         await self.channel_layer.group_send(
@@ -103,8 +115,11 @@ class GameConsumer(CamelizedWebSocketConsumer):
         if not self.scope["session"].session_key:
             return
         player = await adisconnect_player(game_id, self.scope["session"].session_key)
+        # Players of correspondence games come and go between their turns, they are kept in the game.
+        if player and not await ais_correspondence_game(game_id):
+            await sync_to_async(tasks.schedule_player_disconnect)(player.id)
+            await sync_to_async(Game.suspend_if_idle)(game_id)
         if player:
-            tasks.player_disconnect_task.delay(player.id)
             await self.channel_layer.group_send(
                 game_id,
                 {
@@ -116,10 +131,16 @@ class GameConsumer(CamelizedWebSocketConsumer):
             )
         await self.channel_layer.group_discard(self.game_group_name, self.channel_name)
 
+    async def receive_json(self, content, **kwargs):
+        # Clients that think their countdown drifted ask for the deadline again, only they get the answer.
+        if content.get("type") == "timer_sync":
+            game_id = self.scope["url_route"]["kwargs"]["game_id"]
+            await self.send_json({"type": "game_timer_sync", "data": await aget_timer_sync(game_id)})
+
     async def game_updated(self, event):
         await self.send_json(event)
 
-    async def game_timer_updated(self, event):
+    async def game_timer_sync(self, event):
         await self.send_json(event)
 
     async def player_connected(self, event):
@@ -143,11 +164,5 @@ class GameConsumer(CamelizedWebSocketConsumer):
     async def game_start_countdown_start(self, event):
         await self.send_json(event)
 
-    async def game_start_countdown(self, event):
-        await self.send_json(event)
-
     async def game_start_countdown_cancel(self, event):
         await self.send_json(event)
-
-    async def game_start_countdown_end(self, event):
-        await self.send_json(event)
@@ -1,11 +1,13 @@
+import datetime
 from typing import Any
 
 from asgiref.sync import sync_to_async
+from django.utils import timezone
 from djangorestframework_camel_case.settings import api_settings
 from djangorestframework_camel_case.util import camelize
 from rest_framework.utils.serializer_helpers import ReturnDict
 
-from shiritori.game.models import Game, GameStatus, GameWord, Player
+from shiritori.game.models import Game, GameMode, GameStatus, GameWord, Player
 from shiritori.game.serializers import ShiritoriGameSerializer, ShiritoriGameWordSerializer, ShiritoriPlayerSerializer
 
 __all__ = (
@@ -13,12 +15,16 @@ __all__ = (
     "convert_game_to_json",
     "convert_player_to_json",
     "convert_gameword_to_json",
+    "convert_to_epoch_ms",
+    "convert_timer_sync",
     "aconvert_game_to_json",
     "aconvert_games_to_json",
     "aconvert_player_to_json",
     "aconvert_gameword_to_json",
     "aget_player_from_cookie",
     "adisconnect_player",
+    "aget_timer_sync",
+    "ais_correspondence_game",
 )
 
 
@@ -38,6 +44,24 @@ def convert_gameword_to_json(gameword: GameWord) -> ReturnDict[GameWord] | Retur
     return ShiritoriGameWordSerializer(instance=gameword).data
 
 
+def convert_to_epoch_ms(value: datetime.datetime | None) -> int | None:
+    return round(value.timestamp() * 1000) if value else None
+
+
+def convert_timer_sync(turn_deadline: datetime.datetime | None) -> dict:
+    """
+    Get what clients need to count a turn down on their own.
+    Both times are milliseconds since the epoch, clients correct their clock by the difference
+    between `server_time` and their own time when they receive it.
+    :param turn_deadline: datetime - When the current turn runs out, None if no turn is running.
+    :return: dict - The turn deadline and the server's current time.
+    """
+    return {
+        "turn_deadline": convert_to_epoch_ms(turn_deadline),
+        "server_time": convert_to_epoch_ms(timezone.now()),
+    }
+
+
 @sync_to_async
 def aconvert_game_to_json(game: Game) -> ReturnDict[Game] | ReturnDict:
     return convert_game_to_json(game)
@@ -78,9 +102,15 @@ async def adisconnect_player(game_id: str, session_key: str) -> Player | None:
 
 
 async def aget_game(game_id: str) -> Game | None:
-    return (
-        await Game.objects.filter(id=game_id)
-        .exclude(status=GameStatus.FINISHED)
-        .prefetch_related("player_set", "gameword_set", "settings")
-        .afirst()
-    )
+    return await Game.objects.filter(id=game_id).exclude(status=GameStatus.FINISHED).select_related("settings").afirst()
+
+
+async def aget_timer_sync(game_id: str) -> dict:
+    turn_deadline = await Game.objects.filter(id=game_id).values_list("turn_deadline", flat=True).afirst()
+    return convert_timer_sync(turn_deadline)
+
+
+async def ais_correspondence_game(game_id: str) -> bool:
+    return await Game.objects.filter(
+        id=game_id, status=GameStatus.PLAYING, settings__mode=GameMode.CORRESPONDENCE
+    ).aexists()
@@ -0,0 +1,63 @@
+from .blocklist import (
+    Blocklist,
+    BlocklistRegistry,
+    announce_blocklist_reload,
+    blocklist_registry,
+    get_blocked_words,
+    get_blocklist,
+)
+from .bloom import BloomFilter
+from .dawg import Dawg
+from .files import (
+    dictionary_checksum,
+    get_blocklist_path,
+    get_dictionary_path,
+    get_index_path,
+    iter_dictionary_words,
+    iter_words,
+    open_dictionary,
+)
+from .fuzzy import FuzzyIndex
+from .index import WordIndex
+from .letters import LetterIndex
+from .registry import (
+    DictionaryRegistry,
+    LocaleDictionary,
+    announce_dictionary_reload,
+    get_dawg,
+    get_dictionary,
+    get_fuzzy_index,
+    get_letter_index,
+    get_word_index,
+    registry,
+)
+
+__all__ = (
+    "Blocklist",
+    "BlocklistRegistry",
+    "BloomFilter",
+    "Dawg",
+    "DictionaryRegistry",
+    "FuzzyIndex",
+    "LetterIndex",
+    "LocaleDictionary",
+    "WordIndex",
+    "announce_blocklist_reload",
+    "announce_dictionary_reload",
+    "blocklist_registry",
+    "dictionary_checksum",
+    "get_blocked_words",
+    "get_blocklist",
+    "get_blocklist_path",
+    "get_dawg",
+    "get_dictionary",
+    "get_dictionary_path",
+    "get_fuzzy_index",
+    "get_index_path",
+    "get_letter_index",
+    "get_word_index",
+    "iter_dictionary_words",
+    "iter_words",
+    "open_dictionary",
+    "registry",
+)
@@ -0,0 +1,192 @@
+import collections
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+
+from django.conf import settings
+
+from shiritori.game.dictionary.files import file_checksum, get_blocklist_path
+from shiritori.game.dictionary.registry import VERSION_LENGTH, DictionaryRegistry, get_dictionary
+from shiritori.game.utils import normalize_word
+
+__all__ = (
+    "Blocklist",
+    "BlocklistRegistry",
+    "blocklist_registry",
+    "announce_blocklist_reload",
+    "get_blocked_words",
+    "get_blocklist",
+)
+
+logger = logging.getLogger(__name__)
+
+BLOCKLIST_ANNOUNCE_CACHE_KEY = "blocklist:checksum:{locale}"
+# Lines starting with this only block the exact name or word.
+EXACT_PREFIX = "="
+COMMENT_PREFIX = "#"
+# Digits and symbols commonly swapped for letters, folded before matching so they can't be used to get around the list.
+LOOKALIKES = str.maketrans("013457@$", "oieastas")
+
+# The blocked dictionary words of each locale and letter, with the dictionary and blocklist versions they were found in.
+_blocked_words: dict[tuple[str, str], tuple[tuple[str, str], frozenset[str]]] = {}
+
+
+def fold(text: str | None, locale: str | None = None) -> str:
+    """Normalize text the way blocked terms and the text checked against them are compared."""
+    return (normalize_word(text, locale) or "").translate(LOOKALIKES)
+
+
+class Blocklist:
+    """
+    The blocked terms of one version of a locale's blocklist, matched with an Aho-Corasick automaton.
+
+    The automaton is a trie of the terms whose states also link to the longest proper suffix that is
+    a trie path, so scanning never backtracks: one pass over the text finds any term it contains,
+    however many terms the list has. Instances are never modified, a reload builds a new one.
+    """
+
+    __slots__ = ("locale", "checksum", "exact", "terms", "_transitions", "_fallbacks", "_matches")
+
+    def __init__(self, locale: str, checksum: str, terms: Iterable[str]):
+        self.locale = locale
+        self.checksum = checksum
+        # State 0 is the root, `_matches[state]` is a term ending at the state or at one of its fallbacks.
+        self._transitions: list[dict[str, int]] = [{}]
+        self._fallbacks: list[int] = [0]
+        self._matches: list[str | None] = [None]
+        exact, contained = set(), set()
+        for term in terms:
+            if term.startswith(EXACT_PREFIX):
+                if folded := fold(term[len(EXACT_PREFIX) :].strip(), locale):
+                    exact.add(folded)
+            elif folded := fold(term, locale):
+                contained.add(folded)
+        self.exact = frozenset(exact)
+        self.terms = frozenset(contained)
+        for term in self.terms:
+            self._insert(term)
+        self._link()
+
+    @classmethod
+    def build(cls, locale: str, checksum: str | None = None) -> "Blocklist":
+        """
+        Read the locale's blocklist file and build its automaton.
+        :param locale: str - The locale to build.
+        :param checksum: str - The checksum of the file, if it is already known.
+        :return: Blocklist - The blocklist.
+        """
+        path = get_blocklist_path(locale)
+        checksum = checksum or file_checksum(path)
+        with open(path, encoding="utf-8") as f:
+            terms = [line.strip() for line in f if line.strip() and not line.startswith(COMMENT_PREFIX)]
+        blocklist = cls(locale, checksum, terms)
+        logger.info("Built %s blocklist version %s, %s terms", locale, blocklist.version, len(blocklist))
+        return blocklist
+
+    def _insert(self, term: str) -> None:
+        state = 0
+        for character in term:
+            if (next_state := self._transitions[state].get(character)) is None:
+                next_state = len(self._transitions)
+                self._transitions.append({})
+                self._fallbacks.append(0)
+                self._matches.append(None)
+                self._transitions[state][character] = next_state
+            state = next_state
+        self._matches[state] = term
+
+    def _link(self) -> None:
+        # Breadth first, so the fallback of a state is always linked before the state itself.
+        queue = collections.deque(self._transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self._transitions[state].items():
+                fallback = self._fallbacks[state]
+                while fallback and character not in self._transitions[fallback]:
+                    fallback = self._fallbacks[fallback]
+                self._fallbacks[next_state] = self._transitions[fallback].get(character, 0)
+                if self._matches[next_state] is None:
+                    self._matches[next_state] = self._matches[self._fallbacks[next_state]]
+                queue.append(next_state)
+
+    @property
+    def version(self) -> str:
+        return self.checksum[:VERSION_LENGTH]
+
+    def __repr__(self):
+        return f"<Blocklist {self.locale} {self.version}>"
+
+    def __len__(self) -> int:
+        return len(self.terms) + len(self.exact)
+
+    def find(self, text: str | None) -> str | None:
+        """
+        Find a blocked term in the given text.
+        :param text: str - The name or word to check, it is normalized first.
+        :return: Optional[str] - The first blocked term found, or None if the text is allowed.
+        """
+        if not (text := fold(text, self.locale)):
+            return None
+        if text in self.exact:
+            return text
+        state = 0
+        for character in text:
+            while state and character not in self._transitions[state]:
+                state = self._fallbacks[state]
+            state = self._transitions[state].get(character, 0)
+            if match := self._matches[state]:
+                return match
+        return None
+
+    def __contains__(self, text: object) -> bool:
+        return isinstance(text, str) and self.find(text) is not None
+
+
+class BlocklistRegistry(DictionaryRegistry):
+    """
+    The blocklists loaded by this process, one per locale, reloaded like the dictionaries.
+    A locale without a blocklist file blocks nothing.
+    """
+
+    name = "blocklist"
+    announce_key = BLOCKLIST_ANNOUNCE_CACHE_KEY
+
+    def enabled(self) -> bool:
+        return bool(settings.BLOCKLIST_DIR)
+
+    def source_path(self, locale: str) -> Path:
+        return get_blocklist_path(locale)
+
+    def build(self, locale: str, checksum: str) -> Blocklist:
+        return Blocklist.build(locale, checksum)
+
+
+blocklist_registry = BlocklistRegistry()
+
+
+def announce_blocklist_reload(locale: str, *, background: bool = True) -> None:
+    """Tell every process that the locale's blocklist changed, see `DictionaryRegistry.announce`."""
+    blocklist_registry.announce(locale, background=background)
+
+
+def get_blocklist(locale: str) -> Blocklist | None:
+    """Get this process's blocklist for the given locale, if it has one."""
+    return blocklist_registry.get(locale)
+
+
+def get_blocked_words(locale: str, letter: str) -> frozenset[str]:
+    """
+    Get the words of the locale's dictionary that start with the letter and that its blocklist blocks.
+    The words of a letter are scanned once per version of the dictionary and of the blocklist, so counting the
+    playable words under a prefix only goes through the few blocked ones.
+    :param locale: str - The locale of the dictionary and the blocklist.
+    :param letter: str - The first letter of the words.
+    :return: frozenset[str] - The blocked words, empty if the locale has no dictionary or no blocklist.
+    """
+    if (blocklist := get_blocklist(locale)) is None or (dictionary := get_dictionary(locale)) is None:
+        return frozenset()
+    versions = (dictionary.version, blocklist.version)
+    if (cached := _blocked_words.get((locale, letter))) is None or cached[0] != versions:
+        words = frozenset(word for word in dictionary.dawg.words_starting_with(letter) if word in blocklist)
+        cached = _blocked_words[(locale, letter)] = (versions, words)
+    return cached[1]
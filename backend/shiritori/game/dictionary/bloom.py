@@ -0,0 +1,113 @@
+import math
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from shiritori.game.dictionary.files import atomic_write
+
+__all__ = ("BloomFilter",)
+
+BLOOM_MAGIC = b"SHBF"
+BLOOM_FORMAT_VERSION = 1
+# magic, format version, bit count, hash count, word count
+BLOOM_HEADER = struct.Struct("<4sIIII")
+FALSE_POSITIVE_RATE = 0.01
+FNV_PRIME = 0x01000193
+# Offset bases of the two FNV-1a hashes, the first one is the standard basis.
+FNV_SEEDS = (0x811C9DC5, 0x050C5D1F)
+
+
+def _fnv1a(data: bytes, seed: int) -> int:
+    value = seed
+    for byte in data:
+        value = ((value ^ byte) * FNV_PRIME) & 0xFFFFFFFF
+    return value
+
+
+def _fnv1a_many(words: list[bytes], seed: int) -> np.ndarray:
+    """Hash every word at once, one byte column at a time."""
+    lengths = np.fromiter(map(len, words), dtype=np.intp, count=len(words))
+    width = int(lengths.max(initial=0))
+    columns = np.frombuffer(b"".join(word.ljust(width, b"\0") for word in words), dtype=np.uint8)
+    columns = columns.reshape(len(words), width)
+    values = np.full(len(words), seed, dtype=np.uint32)
+    for column in range(width):
+        hashed = (values ^ columns[:, column]) * np.uint32(FNV_PRIME)
+        values = np.where(lengths > column, hashed, values)
+    return values
+
+
+class BloomFilter:
+    """
+    A Bloom filter of a locale's words, small enough for clients to download and check words offline.
+
+    The file is the bundle served to clients as is: a little-endian header (``SHBF``, format version,
+    bit count ``m``, hash count ``k``, word count) followed by ``m / 8`` bytes of bits, bit ``i`` being
+    ``byte[i >> 3] & (1 << (i & 7))``. A word is the UTF-8 bytes of the normalized word, its bits are
+    ``(h1 + i * h2) mod 2**32 mod m`` for ``i`` in ``0..k-1``, where ``h1`` and ``h2`` are 32-bit
+    FNV-1a hashes with the offset bases in `FNV_SEEDS`, and ``h2`` has its lowest bit set.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, bit_count, hash_count, word_count = BLOOM_HEADER.unpack_from(self._mmap, 0)
+        if magic != BLOOM_MAGIC or version != BLOOM_FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a Bloom filter.")
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.word_count = word_count
+
+    @classmethod
+    def write(cls, words: Iterable[str], path: str | os.PathLike) -> int:
+        """
+        Build a Bloom filter of the given words and write it to the given path.
+        :param words: Iterable[str] - The words to add, they should already be normalized.
+        :param path: str - The path to write the filter to.
+        :return: int - The number of words in the filter.
+        """
+        encoded = [word.encode("utf-8") for word in sorted(set(filter(None, words)))]
+        count = len(encoded)
+        bit_count = max(math.ceil(-count * math.log(FALSE_POSITIVE_RATE) / math.log(2) ** 2 / 8) * 8, 8)
+        hash_count = max(round(bit_count / max(count, 1) * math.log(2)), 1)
+
+        first, second = (_fnv1a_many(encoded, seed).astype(np.uint64) for seed in FNV_SEEDS)
+        second |= 1
+        steps = np.arange(hash_count, dtype=np.uint64)
+        positions = ((first[:, None] + steps * second[:, None]) & 0xFFFFFFFF) % np.uint64(bit_count)
+        positions = positions.ravel()
+        bits = np.zeros(bit_count // 8, dtype=np.uint8)
+        np.bitwise_or.at(bits, positions >> np.uint64(3), np.left_shift(1, positions & np.uint64(7)).astype(np.uint8))
+
+        with atomic_write(path) as f:
+            f.write(BLOOM_HEADER.pack(BLOOM_MAGIC, BLOOM_FORMAT_VERSION, bit_count, hash_count, count))
+            f.write(bits.tobytes())
+        return count
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        data = word.encode("utf-8")
+        first, second = (_fnv1a(data, seed) for seed in FNV_SEEDS)
+        second |= 1
+        for step in range(self.hash_count):
+            position = ((first + step * second) & 0xFFFFFFFF) % self.bit_count
+            if not self._mmap[BLOOM_HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def to_bytes(self) -> bytes:
+        """Get the whole file, header included, as served to clients."""
+        return self._mmap[:]
+
+    def close(self) -> None:
+        self._mmap.close()
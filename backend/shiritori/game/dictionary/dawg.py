@@ -0,0 +1,273 @@
+import bisect
+import mmap
+import os
+import struct
+import typing
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+from shiritori.game.dictionary.files import atomic_write
+
+__all__ = ("Dawg",)
+
+DAWG_MAGIC = b"SHDG"
+DAWG_FORMAT_VERSION = 1
+# magic, format version, node count, edge count
+DAWG_HEADER = struct.Struct("=4sIII")
+
+
+class _BuildNode:
+    __slots__ = ("final", "edges", "id", "count")
+
+    def __init__(self):
+        self.final = False
+        self.edges: dict[str, "_BuildNode"] = {}
+        self.id: int | None = None
+        self.count = 0
+
+    def signature(self) -> tuple:
+        return self.final, tuple((label, child.id) for label, child in self.edges.items())
+
+
+class _DawgBuilder:
+    """
+    Builds a minimal DAWG from sorted words in a single pass (Daciuk et al., 2000).
+    Only the path of the previous word is kept unminimized, so building never needs a full trie.
+    """
+
+    def __init__(self):
+        self.root = _BuildNode()
+        self.register: dict[tuple, _BuildNode] = {}
+        self.unchecked: list[tuple[_BuildNode, str, _BuildNode]] = []
+        self.previous = ""
+
+    def add(self, word: str) -> None:
+        if word == self.previous:
+            return
+        if word < self.previous:
+            raise ValueError("Words must be added in sorted order.")
+        common = 0
+        for a, b in zip(word, self.previous):
+            if a != b:
+                break
+            common += 1
+        self._minimize(common)
+        node = self.unchecked[-1][2] if self.unchecked else self.root
+        for label in word[common:]:
+            child = _BuildNode()
+            node.edges[label] = child
+            self.unchecked.append((node, label, child))
+            node = child
+        node.final = True
+        self.previous = word
+
+    def _minimize(self, down_to: int) -> None:
+        while len(self.unchecked) > down_to:
+            parent, label, child = self.unchecked.pop()
+            signature = child.signature()
+            if (existing := self.register.get(signature)) is not None:
+                parent.edges[label] = existing
+                continue
+            child.id = len(self.register) + 1  # 0 is reserved for the root
+            child.count = child.final + sum(grandchild.count for grandchild in child.edges.values())
+            self.register[signature] = child
+
+    def finish(self) -> list[_BuildNode]:
+        self._minimize(0)
+        self.root.id = 0
+        self.root.count = self.root.final + sum(child.count for child in self.root.edges.values())
+        nodes = [self.root, *self.register.values()]
+        nodes.sort(key=lambda node: node.id)
+        return nodes
+
+
+class Dawg:
+    """
+    A minimal directed acyclic word graph, memory-mapped from disk.
+
+    Nodes and edges are stored as flat arrays so the structure can be mapped
+    without deserializing it. Every node also stores how many words can be reached
+    from it, which makes prefix counts and ranking words by position cheap.
+    Edge labels are sorted code points, so words are always produced in sorted order.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, node_count, edge_count = DAWG_HEADER.unpack_from(self._mmap, 0)
+        if magic != DAWG_MAGIC or version != DAWG_FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a DAWG.")
+        view = memoryview(self._mmap)
+        offset = DAWG_HEADER.size
+        self._views = []
+        for name, length, fmt in (
+            ("_first_edge", node_count + 1, "I"),
+            ("_counts", node_count, "I"),
+            ("_labels", edge_count, "I"),
+            ("_targets", edge_count, "I"),
+            ("_finals", node_count, "B"),
+        ):
+            size = length * struct.calcsize(fmt)
+            array_view = view[offset : offset + size].cast(fmt)
+            setattr(self, name, array_view)
+            self._views.append(array_view)
+            offset += size
+        view.release()
+        self.node_count = node_count
+        self.edge_count = edge_count
+
+    @classmethod
+    def write(cls, words: Iterable[str], path: str | os.PathLike) -> int:
+        """
+        Build a DAWG from the given words and write it to the given path.
+        :param words: Iterable[str] - The words to add, they should already be normalized.
+        :param path: str - The path to write the DAWG to.
+        :return: int - The number of words in the DAWG.
+        """
+        builder = _DawgBuilder()
+        for word in sorted(set(filter(None, words))):
+            builder.add(word)
+        nodes = builder.finish()
+
+        first_edge, counts, labels, targets, finals = array("I"), array("I"), array("I"), array("I"), array("B")
+        for node in nodes:
+            first_edge.append(len(labels))
+            counts.append(node.count)
+            finals.append(node.final)
+            for label, child in sorted(node.edges.items()):
+                labels.append(ord(label))
+                targets.append(child.id)
+        first_edge.append(len(labels))
+
+        with atomic_write(path) as f:
+            f.write(DAWG_HEADER.pack(DAWG_MAGIC, DAWG_FORMAT_VERSION, len(nodes), len(labels)))
+            for values in (first_edge, counts, labels, targets, finals):
+                values.tofile(f)
+        return nodes[0].count
+
+    def __len__(self) -> int:
+        return self._counts[0]
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        node = self._walk(word)
+        return node >= 0 and bool(self._finals[node])
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return self.iter_prefix("")
+
+    def _child(self, node: int, label: str) -> int:
+        low, high = self._first_edge[node], self._first_edge[node + 1]
+        code = ord(label)
+        position = bisect.bisect_left(self._labels, code, low, high)
+        if position < high and self._labels[position] == code:
+            return self._targets[position]
+        return -1
+
+    def _walk(self, prefix: str) -> int:
+        node = 0
+        for label in prefix:
+            node = self._child(node, label)
+            if node < 0:
+                break
+        return node
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Check whether any word starts with the given prefix."""
+        return self._walk(prefix) >= 0
+
+    def count_prefix(self, prefix: str, min_length: int = 0) -> int:
+        """
+        Count the words that start with the given prefix.
+        :param prefix: str - The prefix of the words.
+        :param min_length: int - Only count words at least this long.
+        :return: int - The number of words.
+        """
+        node = self._walk(prefix)
+        if node < 0:
+            return 0
+        count = self._counts[node]
+        # The words that are too short all end within a few edges of the prefix, walk those and subtract them.
+        if (depth := min_length - len(prefix)) > 0:
+            stack = [(node, 0)]
+            while stack:
+                node, length = stack.pop()
+                count -= self._finals[node]
+                if length + 1 < depth:
+                    stack.extend(
+                        (self._targets[edge], length + 1)
+                        for edge in range(self._first_edge[node], self._first_edge[node + 1])
+                    )
+        return count
+
+    def iter_prefix(self, prefix: str) -> typing.Iterator[str]:
+        """Iterate over the words that start with the given prefix, in sorted order."""
+        node = self._walk(prefix)
+        if node < 0:
+            return
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if self._finals[node]:
+                yield word
+            for edge in range(self._first_edge[node + 1] - 1, self._first_edge[node] - 1, -1):
+                stack.append((self._targets[edge], word + chr(self._labels[edge])))
+
+    def words_starting_with(self, letter: str) -> typing.Iterator[str]:
+        """Iterate over the words that start with the given letter."""
+        return self.iter_prefix(letter)
+
+    def word_at(self, position: int, prefix: str = "") -> str:
+        """
+        Get a word by its position among the words that start with the given prefix.
+        :param position: int - The position of the word, in sorted order.
+        :param prefix: str - Only count words that start with this prefix.
+        :return: str - The word at the given position.
+        :raises IndexError: If there is no word at the given position.
+        """
+        node = self._walk(prefix)
+        if node < 0 or not 0 <= position < self._counts[node]:
+            raise IndexError("Word position out of range.")
+        labels = [prefix]
+        while True:
+            if self._finals[node]:
+                if position == 0:
+                    return "".join(labels)
+                position -= 1
+            for edge in range(self._first_edge[node], self._first_edge[node + 1]):
+                target = self._targets[edge]
+                if position < self._counts[target]:
+                    labels.append(chr(self._labels[edge]))
+                    node = target
+                    break
+                position -= self._counts[target]
+
+    def index(self, word: str) -> int:
+        """
+        Get the position of a word in sorted order, the inverse of `word_at`.
+        :raises ValueError: If the word is not in the DAWG.
+        """
+        node, position = 0, 0
+        for label in word:
+            if self._finals[node]:
+                position += 1
+            low, high = self._first_edge[node], self._first_edge[node + 1]
+            code = ord(label)
+            edge = bisect.bisect_left(self._labels, code, low, high)
+            if edge >= high or self._labels[edge] != code:
+                raise ValueError(f"{word!r} is not in the DAWG.")
+            for sibling in range(low, edge):
+                position += self._counts[self._targets[sibling]]
+            node = self._targets[edge]
+        if not self._finals[node]:
+            raise ValueError(f"{word!r} is not in the DAWG.")
+        return position
+
+    def close(self) -> None:
+        for view in self._views:
+            view.release()
+        self._mmap.close()
@@ -0,0 +1,112 @@
+import contextlib
+import gzip
+import hashlib
+import lzma
+import os
+import tempfile
+import typing
+from pathlib import Path
+
+from django.conf import settings
+
+from shiritori.game.utils import normalize_word
+
+__all__ = (
+    "DICTIONARY_EXTENSIONS",
+    "atomic_write",
+    "dictionary_checksum",
+    "file_checksum",
+    "get_blocklist_path",
+    "get_dictionary_path",
+    "get_index_path",
+    "iter_dictionary_words",
+    "iter_words",
+    "open_dictionary",
+)
+
+# Word lists may be stored compressed, the first one found is used.
+DICTIONARY_EXTENSIONS = (".txt", ".txt.gz", ".txt.xz")
+
+
+def get_dictionary_path(locale: str) -> Path:
+    """Get the path of the source word list for the given locale."""
+    directory = Path(settings.DICTIONARY_DIR)
+    for extension in DICTIONARY_EXTENSIONS:
+        if (path := directory / f"{locale}{extension}").exists():
+            return path
+    return directory / f"{locale}{DICTIONARY_EXTENSIONS[0]}"
+
+
+def get_blocklist_path(locale: str) -> Path:
+    """Get the path of the blocked terms for the given locale."""
+    return Path(settings.BLOCKLIST_DIR) / f"{locale}.txt"
+
+
+def file_checksum(path: str | os.PathLike) -> str:
+    """
+    Get the SHA-256 of a file, read in blocks.
+    :param path: str - The file to hash.
+    :return: str - The hex digest of the file.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def dictionary_checksum(locale: str) -> str:
+    """Get the SHA-256 of the given locale's word list file."""
+    return file_checksum(get_dictionary_path(locale))
+
+
+def open_dictionary(path: str | os.PathLike) -> typing.TextIO:
+    """Open a word list for reading, decompressing it if needed."""
+    path = Path(path)
+    match path.suffix:
+        case ".gz":
+            return gzip.open(path, "rt", encoding="utf-8")
+        case ".xz":
+            return lzma.open(path, "rt", encoding="utf-8")
+        case _:
+            return open(path, encoding="utf-8")
+
+
+def iter_words(path: str | os.PathLike, locale: str | None = None) -> typing.Iterator[str]:
+    """
+    Stream the normalized words of a word list, one line at a time.
+    Lines may list a word and its reading separated by a tab, the reading is what the game plays on.
+    :param path: str - The word list to read.
+    :param locale: str - The locale of the words.
+    :return: Iterator[str] - The words, skipping blank lines.
+    """
+    with open_dictionary(path) as f:
+        for line in f:
+            if word := normalize_word(line.strip().rpartition("\t")[2], locale):
+                yield word
+
+
+def iter_dictionary_words(locale: str) -> typing.Iterator[str]:
+    """Stream the normalized words of the given locale's word list, see `iter_words`."""
+    yield from iter_words(get_dictionary_path(locale), locale)
+
+
+def get_index_path(locale: str, extension: str = "idx") -> Path:
+    """Get the path of a built dictionary structure for the given locale."""
+    return Path(settings.DICTIONARY_INDEX_DIR) / f"{locale}.{extension}"
+
+
+@contextlib.contextmanager
+def atomic_write(path: str | os.PathLike) -> typing.Iterator[typing.BinaryIO]:
+    """
+    Write a file to a temporary path and move it into place once it is complete,
+    so processes that already have the old file mapped keep a valid view of it.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,153 @@
+import mmap
+import os
+import struct
+import typing
+import zlib
+from array import array
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import numpy as np
+
+from shiritori.game.dictionary.files import atomic_write
+
+if typing.TYPE_CHECKING:
+    from shiritori.game.dictionary.dawg import Dawg
+
+__all__ = ("FuzzyIndex",)
+
+FUZZY_MAGIC = b"SHFZ"
+FUZZY_FORMAT_VERSION = 1
+# magic, format version, entry count
+FUZZY_HEADER = struct.Struct("=4sII")
+
+
+def _deletes(word: str) -> set[str]:
+    """The word itself and every string one deletion away from it."""
+    return {word, *(word[:position] + word[position + 1 :] for position in range(len(word)))}
+
+
+def _key(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+# How likely each kind of edit is to be the typo, the likeliest first: swapped letters, a doubled letter typed once or
+# a single one typed twice, another missing or extra letter, then a wrong letter.
+TRANSPOSITION, DOUBLING, INSERTION_OR_DELETION, SUBSTITUTION = range(4)
+
+
+def _edit_kind(typo: str, word: str) -> int | None:
+    """
+    Find the edit that turns the typo into the word.
+    :param typo: str - The word as typed.
+    :param word: str - The word it may be a typo of.
+    :return: Optional[int] - The kind of edit, None if the words are equal or more than one edit apart.
+    """
+    if abs(len(typo) - len(word)) > 1 or typo == word:
+        return None
+    start = 0
+    while start < min(len(typo), len(word)) and typo[start] == word[start]:
+        start += 1
+    if len(typo) != len(word):
+        shorter, longer = sorted((typo, word), key=len)
+        if shorter[start:] != longer[start + 1 :]:
+            return None
+        # The extra letter repeats one of its neighbours.
+        is_doubling = longer[start] in longer[max(start - 1, 0) : start] + longer[start + 1 : start + 2]
+        return DOUBLING if is_doubling else INSERTION_OR_DELETION
+    if typo[start + 1 :] == word[start + 1 :]:
+        return SUBSTITUTION
+    # An adjacent transposition swaps the first mismatch with the next character.
+    if (
+        start + 1 < len(typo)
+        and typo[start] == word[start + 1]
+        and typo[start + 1] == word[start]
+        and typo[start + 2 :] == word[start + 2 :]
+    ):
+        return TRANSPOSITION
+    return None
+
+
+class FuzzyIndex:
+    """
+    A symmetric delete index (SymSpell) for words one edit away, memory-mapped from disk.
+
+    Every word and the strings one deletion away from it are hashed to a 32-bit key and stored
+    next to the word's position in the DAWG, sorted by key. Two words are at most one edit apart
+    only if they share one of those strings, so looking a word up is a binary search per deletion
+    of it. Hash collisions only add candidates, which are checked before they are suggested.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = FUZZY_HEADER.unpack_from(self._mmap, 0)
+        if magic != FUZZY_MAGIC or version != FUZZY_FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a fuzzy index.")
+        self._count = count
+        self._keys = np.frombuffer(self._mmap, dtype=np.uint32, count=count, offset=FUZZY_HEADER.size)
+        self._positions = np.frombuffer(self._mmap, dtype=np.uint32, count=count, offset=FUZZY_HEADER.size + 4 * count)
+
+    @classmethod
+    def write(cls, words: Iterable[str], path: str | os.PathLike) -> int:
+        """
+        Build the index for the given words and write it to the given path.
+        :param words: Iterable[str] - The words to index, they should already be normalized.
+        :param path: str - The path to write the index to.
+        :return: int - The number of entries in the index.
+        """
+        keys, positions = array("I"), array("I")
+        # Positions are the sorted order of the words, the same order `Dawg.word_at` uses.
+        for position, word in enumerate(sorted(set(filter(None, words)))):
+            for text in _deletes(word):
+                keys.append(_key(text))
+                positions.append(position)
+        keys = np.frombuffer(keys, dtype=np.uint32)
+        positions = np.frombuffer(positions, dtype=np.uint32)
+        order = np.argsort(keys, kind="stable")
+
+        with atomic_write(path) as f:
+            f.write(FUZZY_HEADER.pack(FUZZY_MAGIC, FUZZY_FORMAT_VERSION, len(keys)))
+            f.write(keys[order].tobytes())
+            f.write(positions[order].tobytes())
+        return len(keys)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def candidates(self, word: str) -> set[int]:
+        """
+        Get the positions of the words that may be one edit away from the given word.
+        :param word: str - The word to look up.
+        :return: set[int] - The DAWG positions of the candidates, not checked yet.
+        """
+        keys = np.fromiter(map(_key, _deletes(word)), dtype=np.uint32)
+        starts = np.searchsorted(self._keys, keys, side="left")
+        ends = np.searchsorted(self._keys, keys, side="right")
+        return {int(position) for start, end in zip(starts, ends) for position in self._positions[start:end]}
+
+    def suggest(
+        self, word: str, dawg: "Dawg", *, accept: Callable[[str], bool] | None = None, limit: int = 3
+    ) -> list[str]:
+        """
+        Suggest the words one edit away from the given word.
+        :param word: str - The misspelled word, it should already be normalized.
+        :param dawg: Dawg - The DAWG built from the same word list.
+        :param accept: Callable[[str], bool] - Only suggest words this returns True for.
+        :param limit: int - The maximum number of suggestions.
+        :return: list[str] - The suggestions, by how likely their edit is to be a typo and then alphabetically.
+        """
+        if not word:
+            return []
+        ranked = []
+        for position in self.candidates(word):
+            candidate = dawg.word_at(position)
+            if (kind := _edit_kind(word, candidate)) is not None and (accept is None or accept(candidate)):
+                ranked.append((kind, candidate))
+        return [candidate for _, candidate in sorted(ranked)[:limit]]
+
+    def close(self) -> None:
+        del self._keys, self._positions
+        self._mmap.close()
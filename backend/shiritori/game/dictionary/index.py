@@ -0,0 +1,92 @@
+import array
+import mmap
+import os
+import struct
+import typing
+from collections.abc import Iterable
+from pathlib import Path
+
+from shiritori.game.dictionary.files import atomic_write
+
+__all__ = ("WordIndex",)
+
+INDEX_MAGIC = b"SHWI"
+INDEX_FORMAT_VERSION = 1
+# magic, format version, word count
+INDEX_HEADER = struct.Struct("=4sII")
+
+
+class WordIndex:
+    """
+    A sorted, memory-mapped word list.
+
+    The file is laid out as a small header, an array of ``count + 1`` offsets
+    and the UTF-8 encoded words sorted by their byte value. Because the file is
+    mapped read-only every process on the host shares the same pages through the
+    page cache, and a lookup is a binary search over the offsets.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = INDEX_HEADER.unpack_from(self._mmap, 0)
+        if magic != INDEX_MAGIC or version != INDEX_FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a word index.")
+        self._count = count
+        offsets_end = INDEX_HEADER.size + (count + 1) * 4
+        self._offsets = memoryview(self._mmap)[INDEX_HEADER.size : offsets_end].cast("I")
+        self._data_start = offsets_end
+
+    @classmethod
+    def write(cls, words: Iterable[str], path: str | os.PathLike) -> int:
+        """
+        Write a word index to the given path.
+        :param words: Iterable[str] - The words to index, they should already be normalized.
+        :param path: str - The path to write the index to.
+        :return: int - The number of words in the index.
+        """
+        encoded = sorted({word.encode("utf-8") for word in words if word})
+        offsets = array.array("I", [0])
+        for word in encoded:
+            offsets.append(offsets[-1] + len(word))
+
+        with atomic_write(path) as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_FORMAT_VERSION, len(encoded)))
+            offsets.tofile(f)
+            f.writelines(encoded)
+        return len(encoded)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        return self._find(word.encode("utf-8")) is not None
+
+    def __iter__(self) -> typing.Iterator[str]:
+        for position in range(self._count):
+            yield self._word_bytes(position).decode("utf-8")
+
+    def _word_bytes(self, position: int) -> bytes:
+        start = self._data_start + self._offsets[position]
+        end = self._data_start + self._offsets[position + 1]
+        return self._mmap[start:end]
+
+    def _find(self, target: bytes) -> int | None:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._word_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._word_bytes(low) == target:
+            return low
+        return None
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._mmap.close()
@@ -0,0 +1,106 @@
+import os
+import random
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from shiritori.game.dictionary.files import atomic_write
+
+__all__ = ("LetterIndex",)
+
+LETTER_INDEX_FORMAT_VERSION = 1
+# Words longer than this are counted as if they had this length,
+# minimum word lengths are far below it.
+MAX_TRACKED_LENGTH = 32
+
+
+def _length_column(min_length: int) -> int:
+    return min(max(min_length, 0), MAX_TRACKED_LENGTH)
+
+
+class LetterIndex:
+    """
+    Word counts of a locale grouped by letter.
+
+    ``lengths[letter, n]`` is the number of words that start with the letter and are at least ``n``
+    characters long. It is a small dense array, so answering how many words are left for a letter is
+    an array lookup plus the words the game already used.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        with np.load(self.path, allow_pickle=False) as data:
+            if int(data["version"]) != LETTER_INDEX_FORMAT_VERSION:
+                raise ValueError(f"{self.path} is not a letter index.")
+            alphabet = data["alphabet"]
+            histogram = data["histogram"]
+        self.letters = tuple(map(chr, alphabet))
+        self._positions = {letter: position for position, letter in enumerate(self.letters)}
+        # Sum the histogram from the longest words down, so each column counts the words at least that long.
+        self.lengths: np.ndarray = np.cumsum(histogram[:, ::-1], axis=1)[:, ::-1]
+
+    @classmethod
+    def write(cls, words: Iterable[str], path: str | os.PathLike) -> int:
+        """
+        Count the given words by letter and write the index to the given path.
+        :param words: Iterable[str] - The words to count, they should already be normalized.
+        :param path: str - The path to write the index to.
+        :return: int - The number of words counted.
+        """
+        words = sorted(set(filter(None, words)))
+        alphabet = sorted({ord(word[0]) for word in words})
+        positions = {code: position for position, code in enumerate(alphabet)}
+        firsts = np.fromiter((positions[ord(word[0])] for word in words), dtype=np.intp, count=len(words))
+        lengths = np.fromiter((len(word) for word in words), dtype=np.intp, count=len(words))
+
+        histogram = np.zeros((len(alphabet), MAX_TRACKED_LENGTH + 1), dtype=np.uint32)
+        np.add.at(histogram, (firsts, np.minimum(lengths, MAX_TRACKED_LENGTH)), 1)
+
+        with atomic_write(path) as f:
+            np.savez(
+                f,
+                version=np.array(LETTER_INDEX_FORMAT_VERSION),
+                alphabet=np.array(alphabet, dtype=np.uint32),
+                histogram=histogram,
+            )
+        return len(words)
+
+    def __len__(self) -> int:
+        return int(self.lengths[:, 0].sum()) if self.letters else 0
+
+    def __contains__(self, letter: object) -> bool:
+        return letter in self._positions
+
+    def count(self, letter: str, min_length: int = 0) -> int:
+        """
+        Count the words that start with the given letter.
+        :param letter: str - The first letter of the words.
+        :param min_length: int - Only count words at least this long.
+        :return: int - The number of words.
+        """
+        if (position := self._positions.get(letter)) is None:
+            return 0
+        return int(self.lengths[position, _length_column(min_length)])
+
+    def remaining(self, letter: str, used_words: Iterable[str | None], min_length: int = 0) -> int:
+        """
+        Count the words that can still be played after the given letter.
+        :param letter: str - The letter the next word has to start with.
+        :param used_words: Iterable[str] - The words the game already used, missed turns may be None.
+        :param min_length: int - The minimum word length of the game.
+        :return: int - The number of words that were not used yet.
+        """
+        used = sum(1 for word in set(used_words) if word and word[0] == letter and len(word) >= min_length)
+        return max(self.count(letter, min_length) - used, 0)
+
+    def random_letter(self, min_length: int = 0, *, rng: random.Random | None = None) -> str | None:
+        """
+        Pick a letter to start a game with, weighted by the number of words that start with it.
+        :param min_length: int - Only count words at least this long.
+        :param rng: Random - The random number generator to use, the `random` module by default.
+        :return: Optional[str] - The letter, or None if no word is long enough.
+        """
+        if not self.letters or not (weights := self.lengths[:, _length_column(min_length)]).any():
+            return None
+        return (rng or random).choices(self.letters, weights=weights.tolist())[0]
@@ -0,0 +1,294 @@
+import contextlib
+import fcntl
+import logging
+import re
+import threading
+import time
+import typing
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+
+from shiritori.game.dictionary.bloom import BloomFilter
+from shiritori.game.dictionary.dawg import Dawg
+from shiritori.game.dictionary.files import (
+    dictionary_checksum,
+    file_checksum,
+    get_dictionary_path,
+    get_index_path,
+    iter_dictionary_words,
+)
+from shiritori.game.dictionary.fuzzy import FuzzyIndex
+from shiritori.game.dictionary.index import WordIndex
+from shiritori.game.dictionary.letters import LetterIndex
+
+__all__ = (
+    "LocaleDictionary",
+    "DictionaryRegistry",
+    "registry",
+    "announce_dictionary_reload",
+    "get_dictionary",
+    "get_word_index",
+    "get_dawg",
+    "get_letter_index",
+    "get_fuzzy_index",
+)
+
+logger = logging.getLogger(__name__)
+
+ANNOUNCE_CACHE_KEY = "dictionary:checksum:{locale}"
+# Built files are named `<locale>.<version>.<extension>`, the version being a prefix of the word list checksum.
+VERSION_LENGTH = 12
+# The structures built for every version, by file extension, in the order `LocaleDictionary` takes them.
+STRUCTURES = {"idx": WordIndex, "dawg": Dawg, "letters": LetterIndex, "fuzzy": FuzzyIndex, "bloom": BloomFilter}
+
+
+class LocaleDictionary:
+    """
+    The memory-mapped structures built from one version of a locale's word list.
+    Instances are never modified, a reload builds a new one and swaps it in.
+    """
+
+    __slots__ = ("locale", "checksum", "index", "dawg", "letters", "fuzzy", "bloom")
+
+    def __init__(
+        self,
+        locale: str,
+        checksum: str,
+        index: WordIndex,
+        dawg: Dawg,
+        letters: LetterIndex,
+        fuzzy: FuzzyIndex,
+        bloom: BloomFilter,
+    ):
+        self.locale = locale
+        self.checksum = checksum
+        self.index = index
+        self.dawg = dawg
+        self.letters = letters
+        self.fuzzy = fuzzy
+        self.bloom = bloom
+
+    @property
+    def version(self) -> str:
+        return self.checksum[:VERSION_LENGTH]
+
+    def __repr__(self):
+        return f"<LocaleDictionary {self.locale} {self.version}>"
+
+    @classmethod
+    def build(cls, locale: str, checksum: str | None = None) -> "LocaleDictionary":
+        """
+        Build the files for the locale's current word list and map them.
+        Files another process already built for the same version are reused.
+        :param locale: str - The locale to build.
+        :param checksum: str - The checksum of the word list, if it is already known.
+        :return: LocaleDictionary - The loaded dictionary.
+        """
+        checksum = checksum or dictionary_checksum(locale)
+        version = checksum[:VERSION_LENGTH]
+        paths = {extension: get_index_path(locale, f"{version}.{extension}") for extension in STRUCTURES}
+        if not all(path.exists() for path in paths.values()):
+            with _build_lock(locale):
+                for extension, structure in STRUCTURES.items():
+                    if not paths[extension].exists():
+                        structure.write(iter_dictionary_words(locale), paths[extension])
+            _remove_old_versions(locale, version)
+            logger.info("Built %s dictionary version %s", locale, version)
+        return cls(locale, checksum, *(structure(paths[extension]) for extension, structure in STRUCTURES.items()))
+
+
+@contextlib.contextmanager
+def _build_lock(locale: str) -> typing.Iterator[None]:
+    """Only let one process on the host build a locale at a time."""
+    path = get_index_path(locale, "lock")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _remove_old_versions(locale: str, version: str) -> None:
+    # Processes that still map an old file keep their view of it after it is unlinked.
+    extensions = "|".join(STRUCTURES)
+    pattern = re.compile(rf"{re.escape(locale)}\.(?P<version>[0-9a-f]{{{VERSION_LENGTH}}})\.({extensions})")
+    for path in get_index_path(locale).parent.iterdir():
+        if (match := pattern.fullmatch(path.name)) and match["version"] != version:
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+
+
+class DictionaryRegistry:
+    """
+    The dictionaries loaded by this process, one per locale.
+
+    The first lookup for a locale starts loading it on a background thread, with `DICTIONARY_BACKGROUND_LOAD`,
+    and lookups fall back to the database until it is ready. Servers `warm` their locales when they start,
+    so a build is rarely waited for. After that the process checks the shared cache at most every
+    `DICTIONARY_RELOAD_CHECK_INTERVAL` seconds for a newer word list announced by another process.
+    A new version is built on a background thread while lookups keep using the current one, and is
+    swapped in with a single assignment once it is ready.
+
+    Subclasses reuse the reloading for other per-locale files by overriding `enabled`, `source_path`
+    and `build`, loaded objects only need a `checksum` attribute.
+    """
+
+    name = "dictionary"
+    announce_key = ANNOUNCE_CACHE_KEY
+
+    def __init__(self):
+        self._dictionaries: dict[str, LocaleDictionary | None] = {}
+        self._announced: dict[str, str | None] = {}
+        self._checked_at: dict[str, float] = {}
+        self._reloading: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, locale: str) -> LocaleDictionary | None:
+        """
+        Get the dictionary for the given locale.
+        Returns None if indexes are disabled, the locale has no word list, could not be built or is still
+        being built, in which case callers should fall back to the database.
+        """
+        if not self.enabled():
+            return None
+        if locale not in self._dictionaries:
+            self.warm([locale], background=settings.DICTIONARY_BACKGROUND_LOAD)
+            return self._dictionaries.get(locale)
+        self._check_announcements(locale)
+        return self._dictionaries[locale]
+
+    def warm(self, locales: typing.Iterable[str], *, background: bool = True) -> None:
+        """
+        Start loading the given locales that are not loaded yet, instead of on their first lookup.
+        :param locales: Iterable[str] - The locales to load.
+        :param background: bool - Load on background threads instead of the calling one.
+        """
+        if not self.enabled():
+            return
+        for locale in locales:
+            if locale in self._dictionaries:
+                continue
+            with self._lock:
+                self._announced.setdefault(locale, cache.get(self.announce_key.format(locale=locale)))
+                self._checked_at.setdefault(locale, time.monotonic())
+            self.reload(locale, background=background)
+
+    def enabled(self) -> bool:
+        return settings.DICTIONARY_INDEX_ENABLED
+
+    def source_path(self, locale: str) -> Path:
+        """Get the file the locale's entry is built from."""
+        return get_dictionary_path(locale)
+
+    def build(self, locale: str, checksum: str) -> LocaleDictionary:
+        """Build the locale's entry from the current version of its source file."""
+        return LocaleDictionary.build(locale, checksum)
+
+    def _check_announcements(self, locale: str) -> None:
+        now = time.monotonic()
+        if now - self._checked_at.get(locale, 0) < settings.DICTIONARY_RELOAD_CHECK_INTERVAL:
+            return
+        self._checked_at[locale] = now
+        announced = cache.get(self.announce_key.format(locale=locale))
+        if announced != self._announced.get(locale):
+            self._announced[locale] = announced
+            self.reload(locale)
+
+    def reload(self, locale: str, *, background: bool = True) -> threading.Thread | None:
+        """
+        Load the current version of the locale's source file and swap it in.
+        Lookups keep using the previous version until the new one is ready.
+        :param locale: str - The locale to reload.
+        :param background: bool - Build on a background thread instead of the calling one.
+        :return: Optional[Thread] - The thread building the new version, if one was started.
+        """
+        with self._lock:
+            if locale in self._reloading:
+                return None
+            self._reloading.add(locale)
+        if not background:
+            self._swap(locale)
+            return None
+        thread = threading.Thread(target=self._swap, args=(locale,), name=f"{self.name}-reload-{locale}", daemon=True)
+        thread.start()
+        return thread
+
+    def _swap(self, locale: str) -> None:
+        try:
+            current = self._dictionaries.get(locale)
+            path = self.source_path(locale)
+            if not path.exists():
+                self._dictionaries[locale] = None
+                return
+            checksum = file_checksum(path)
+            if current is not None and current.checksum == checksum:
+                return
+            # The previous version is not closed, in-flight lookups may still hold it.
+            # Its mappings are released once the last reference to it is gone.
+            self._dictionaries[locale] = self.build(locale, checksum)
+        except (OSError, ValueError):
+            logger.exception("Could not reload the %s %s, keeping the current version", locale, self.name)
+            # A locale that could not be loaded at all is not retried on every lookup, only when it is announced.
+            self._dictionaries.setdefault(locale, None)
+        finally:
+            with self._lock:
+                self._reloading.discard(locale)
+
+    def announce(self, locale: str, *, background: bool = True) -> None:
+        """
+        Tell every process that the locale's source file changed.
+        The checksum is published through the shared cache and picked up by each process on its next check,
+        this process starts reloading right away.
+        :param locale: str - The locale that changed.
+        :param background: bool - Reload on a background thread. Commands reload on the calling thread, a process
+            that exits while a background thread is building leaves the build unfinished.
+        """
+        path = self.source_path(locale)
+        checksum = file_checksum(path) if path.exists() else None
+        cache.set(self.announce_key.format(locale=locale), checksum, timeout=None)
+        if self.enabled():
+            self.reload(locale, background=background)
+
+    def clear(self) -> None:
+        """Forget every entry loaded by this process."""
+        with self._lock:
+            self._dictionaries.clear()
+            self._announced.clear()
+            self._checked_at.clear()
+
+
+registry = DictionaryRegistry()
+
+
+def announce_dictionary_reload(locale: str, *, background: bool = True) -> None:
+    """Tell every process that the locale's word list changed, see `DictionaryRegistry.announce`."""
+    registry.announce(locale, background=background)
+
+
+def get_dictionary(locale: str) -> LocaleDictionary | None:
+    """Get this process's dictionary for the given locale, see `DictionaryRegistry.get`."""
+    return registry.get(locale)
+
+
+def get_word_index(locale: str) -> WordIndex | None:
+    """Get the sorted word index for the given locale, if one is available."""
+    return dictionary.index if (dictionary := registry.get(locale)) else None
+
+
+def get_dawg(locale: str) -> Dawg | None:
+    """Get the DAWG for the given locale, if one is available."""
+    return dictionary.dawg if (dictionary := registry.get(locale)) else None
+
+
+def get_letter_index(locale: str) -> LetterIndex | None:
+    """Get the letter index for the given locale, if one is available."""
+    return dictionary.letters if (dictionary := registry.get(locale)) else None
+
+
+def get_fuzzy_index(locale: str) -> FuzzyIndex | None:
+    """Get the fuzzy index for the given locale, if one is available."""
+    return dictionary.fuzzy if (dictionary := registry.get(locale)) else None
@@ -1,20 +1,28 @@
 import typing
 
-from shiritori.game.converters import convert_game_to_json, convert_gameword_to_json, convert_player_to_json
+from django.utils import timezone
+
+from shiritori.game.converters import (
+    convert_game_to_json,
+    convert_gameword_to_json,
+    convert_player_to_json,
+    convert_timer_sync,
+    convert_to_epoch_ms,
+)
 from shiritori.game.utils import send_message_to_layer
 
 if typing.TYPE_CHECKING:
+    import datetime
+
     from shiritori.game.models import Game, GameWord, Player
 
 __all__ = (
     "EventDict",
     "send_lobby_update",
     "send_game_updated",
-    "send_game_timer_updated",
+    "send_game_timer_sync",
     "send_game_start_countdown_start",
-    "send_game_start_countdown",
     "send_game_start_countdown_cancel",
-    "send_game_start_countdown_end",
     "send_player_joined",
     "send_player_left",
     "send_player_updated",
@@ -27,10 +35,8 @@ class EventDict(typing.TypedDict):
     type: typing.Literal[
         "game_created",
         "game_updated",
-        "game_timer_updated",
+        "game_timer_sync",
         "game_start_countdown_start",
-        "game_start_countdown",
-        "game_start_countdown_end",
         "game_start_countdown_cancel",
         "player_connected",
         "player_disconnected",
@@ -72,12 +78,13 @@ def send_game_updated(game: typing.Union["Game", dict]):
     )
 
 
-def send_game_timer_updated(game_id: str, turn_time_left: int):
+def send_game_timer_sync(game_id: str, turn_deadline: "datetime.datetime | None"):
+    """Sent once per turn, clients count the turn down themselves until the next one."""
     send_message_to_layer(
         game_id,
         {
-            "type": "game_timer_updated",
-            "data": turn_time_left,
+            "type": "game_timer_sync",
+            "data": convert_timer_sync(turn_deadline),
         },
     )
 
@@ -141,22 +148,16 @@ def send_player_disconnected(game_id: str, player_id: str):
     )
 
 
-def send_game_start_countdown_start(game_id: str):
+def send_game_start_countdown_start(game_id: str, starts_at: "datetime.datetime"):
+    """Sent once, clients count down to the start themselves, correcting their clock by `server_time`."""
     send_message_to_layer(
         game_id,
         {
             "type": "game_start_countdown_start",
-            "data": None,
-        },
-    )
-
-
-def send_game_start_countdown(game_id: str, time_left: int):
-    send_message_to_layer(
-        game_id,
-        {
-            "type": "game_start_countdown",
-            "data": time_left,
+            "data": {
+                "starts_at": convert_to_epoch_ms(starts_at),
+                "server_time": convert_to_epoch_ms(timezone.now()),
+            },
         },
     )
 
@@ -169,13 +170,3 @@ def send_game_start_countdown_cancel(game_id: str):
             "data": None,
         },
     )
-
-
-def send_game_start_countdown_end(game_id: str):
-    send_message_to_layer(
-        game_id,
-        {
-            "type": "game_start_countdown_end",
-            "data": None,
-        },
-    )
@@ -0,0 +1,75 @@
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from django.core.management import BaseCommand
+
+from shiritori.game.dictionary import Dawg, WordIndex, get_index_path, iter_dictionary_words
+from shiritori.game.models import Word
+
+
+class Command(BaseCommand):
+    help = "Compares the memory and lookup latency of the dictionary representations"
+
+    def add_arguments(self, parser):
+        parser.add_argument("locale", nargs="?", type=str, default="en")
+        parser.add_argument("--lookups", type=int, default=10_000, help="Number of lookups to time")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        locale = options["locale"]
+        words = list(iter_dictionary_words(locale))
+        rng = random.Random(options["seed"])
+        # Half of the lookups hit, the other half miss.
+        samples = rng.choices(words, k=options["lookups"] // 2)
+        samples += [word[::-1] + "q" for word in samples]
+        rng.shuffle(samples)
+        self.stdout.write(f"{locale}: {len(words)} words, {len(samples)} lookups")
+        self.stdout.write(f"{'structure':<12}{'memory':>14}{'lookup':>14}")
+
+        # Read the file again so the set owns its strings, as it would in a worker.
+        tracemalloc.start()
+        word_set = frozenset(iter_dictionary_words(locale))
+        set_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self.report("frozenset", f"{set_memory / 1024 ** 2:.1f} MB", self.time_lookups(word_set.__contains__, samples))
+        del word_set
+
+        index_path = get_index_path(locale, "bench.idx")
+        WordIndex.write(words, index_path)
+        index = WordIndex(index_path)
+        self.report("sorted mmap", self.file_size(index_path), self.time_lookups(index.__contains__, samples))
+        index.close()
+        index_path.unlink()
+
+        dawg_path = get_index_path(locale, "bench.dawg")
+        Dawg.write(words, dawg_path)
+        dawg = Dawg(dawg_path)
+        self.report("dawg", self.file_size(dawg_path), self.time_lookups(dawg.__contains__, samples))
+        dawg.close()
+        dawg_path.unlink()
+
+        if Word.objects.filter(locale=locale).exists():
+            # Query the table directly, `Word.validate` would use the index.
+            def query(word: str) -> bool:
+                return Word.objects.filter(locale=locale, word=word).exists()
+
+            self.report("word table", "database", self.time_lookups(query, samples[:1000]))
+        else:
+            self.report("word table", "database", "not loaded")
+
+    @staticmethod
+    def file_size(path) -> str:
+        return f"{path.stat().st_size / 1024 ** 2:.1f} MB mmap"
+
+    @staticmethod
+    def time_lookups(lookup: Callable[[str], bool], samples: list[str]) -> str:
+        start = time.perf_counter()
+        for word in samples:
+            lookup(word)
+        elapsed = time.perf_counter() - start
+        return f"{elapsed / len(samples) * 1_000_000:.2f} us"
+
+    def report(self, name: str, memory: str, latency: str) -> None:
+        self.stdout.write(f"{name:<12}{memory:>14}{latency:>14}")
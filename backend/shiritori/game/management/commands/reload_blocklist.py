@@ -0,0 +1,18 @@
+from django.core.management import BaseCommand
+
+from shiritori.game.dictionary import announce_blocklist_reload, get_blocklist_path
+
+
+class Command(BaseCommand):
+    help = "Reloads the blocklists of the given locales in every process"
+
+    def add_arguments(self, parser):
+        parser.add_argument("locale", nargs="+", type=str, default=["en"])
+
+    def handle(self, *args, **options):
+        for locale in options["locale"]:
+            announce_blocklist_reload(locale, background=False)
+            if get_blocklist_path(locale).exists():
+                self.stdout.write(self.style.SUCCESS(f"Reloading {locale} blocklist"))
+            else:
+                self.stdout.write(self.style.WARNING(f"{locale} has no blocklist, nothing is blocked"))
@@ -0,0 +1,56 @@
+import asyncio
+import signal
+
+from django.core.management import BaseCommand
+
+from shiritori.game.dictionary import blocklist_registry, registry
+from shiritori.game.models import GameLocales
+from shiritori.game.timers import (
+    CLAIM_INTERVAL,
+    DEFAULT_CONCURRENCY,
+    LEASE_DURATION,
+    TurnTimerService,
+    default_owner,
+)
+
+
+class Command(BaseCommand):
+    help = "Runs the turn timers of every playing game until stopped"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--owner",
+            type=str,
+            default=default_owner(),
+            help="Id stored on the games this service drives, give each service on a host its own",
+        )
+        parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Ticks running at once")
+        parser.add_argument(
+            "--claim-interval", type=float, default=CLAIM_INTERVAL, help="Seconds between looks for new games"
+        )
+        parser.add_argument(
+            "--lease-duration",
+            type=float,
+            default=LEASE_DURATION,
+            help="Seconds before another service takes over the games of one that stopped",
+        )
+
+    def handle(self, *args, **options):
+        # Bots play from the dictionaries, they are ready before the first game is ticked.
+        registry.warm(GameLocales.values, background=False)
+        blocklist_registry.warm(GameLocales.values, background=False)
+        self.stdout.write(f"Running turn timers as {options['owner']}")
+        asyncio.run(self.run(options))
+
+    @staticmethod
+    async def run(options) -> None:
+        service = TurnTimerService(
+            options["owner"],
+            concurrency=options["concurrency"],
+            claim_interval=options["claim_interval"],
+            lease_duration=options["lease_duration"],
+        )
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, service.stop)
+        await service.run()
@@ -1,6 +1,13 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from django.core.management import BaseCommand
+from django.db import connections
 
+from shiritori.game.dictionary import announce_dictionary_reload
 from shiritori.game.models import Word
+from shiritori.game.models.word import DictionaryLoadResult, DictionarySyncResult
 
 
 class Command(BaseCommand):
@@ -9,9 +16,44 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         # Add a locale argument that can support multiple locales
         parser.add_argument("locale", nargs="+", type=str, default=["en"])
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes used to import several locales in parallel",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Only apply the words added to or removed from the word list since the last sync",
+        )
+        parser.add_argument("--force", action="store_true", help="Sync even if the word list checksum is unchanged")
 
     def handle(self, *args, **options):
-        for locale in options["locale"]:
-            self.stdout.write(f"Updating {locale} dictionary")
-            Word.load_dictionary(locale)
-            self.stdout.write(self.style.SUCCESS(f"Successfully updated {locale} dictionary"))
+        locales = options["locale"]
+        workers = min(options["workers"], len(locales))
+        update = partial(Word.sync_dictionary, force=options["force"]) if options["sync"] else Word.load_dictionary
+        self.stdout.write(f"Updating {', '.join(locales)} dictionaries")
+        if workers > 1:
+            # Forked workers must not share the parent's database connection.
+            connections.close_all()
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                results = list(executor.map(update, locales))
+        else:
+            results = [update(locale) for locale in locales]
+        for result in results:
+            if getattr(result, "changed", True):
+                # Built before the command exits, the other processes on the host map the finished files.
+                announce_dictionary_reload(result.locale, background=False)
+            self.stdout.write(
+                self.style.SUCCESS(f"Successfully updated {result.locale} dictionary: {self.describe(result)}")
+            )
+
+    @staticmethod
+    def describe(result: DictionaryLoadResult | DictionarySyncResult) -> str:
+        if isinstance(result, DictionaryLoadResult):
+            return f"{result.read} words read, {result.inserted} added"
+        if not result.changed:
+            return f"unchanged at version {result.version}"
+        return f"version {result.version}, {result.inserted} added, {result.deleted} removed"
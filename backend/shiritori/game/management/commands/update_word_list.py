@@ -0,0 +1,34 @@
+from django.core.management import BaseCommand
+
+from shiritori.game.dictionary import iter_words
+from shiritori.game.models import GameLocales, WordList
+
+
+class Command(BaseCommand):
+    help = "Creates or updates a word list games can add to their settings"
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", type=str)
+        parser.add_argument("--locale", type=str, choices=GameLocales.values, default=GameLocales.EN)
+        parser.add_argument("--add", type=str, help="File of words, one per line, the list allows")
+        parser.add_argument("--remove", type=str, help="File of words, one per line, the list removes")
+        parser.add_argument("--discard", type=str, help="File of words, one per line, to take out of the list")
+
+    def handle(self, *args, **options):
+        word_list, created = WordList.objects.get_or_create(
+            name=options["name"], defaults={"locale": options["locale"]}
+        )
+        if word_list.locale != options["locale"]:
+            self.stderr.write(self.style.ERROR(f"{word_list} already exists for another locale"))
+            return
+        if options["add"]:
+            added = word_list.add_words(iter_words(options["add"], word_list.locale))
+            self.stdout.write(f"{added} words added")
+        if options["remove"]:
+            removed = word_list.add_words(iter_words(options["remove"], word_list.locale), removal=True)
+            self.stdout.write(f"{removed} words removed")
+        if options["discard"]:
+            discarded = word_list.discard_words(iter_words(options["discard"], word_list.locale))
+            self.stdout.write(f"{discarded} words discarded")
+        action = "Created" if created else "Updated"
+        self.stdout.write(self.style.SUCCESS(f"{action} {word_list} at version {word_list.version}"))
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0005_game_current_round_player_order_player_unique_order"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DictionaryVersion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("locale", models.CharField(choices=[("en", "English")], max_length=10, unique=True)),
+                ("checksum", models.CharField(max_length=64)),
+                ("version", models.PositiveIntegerField(default=0)),
+                ("word_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "dictionary_version",
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:39
+
+import unicodedata
+
+from django.db import migrations, models
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+
+def normalize_words(apps, _):
+    # Lookups are exact matches from now on, so stored words must use the same
+    # normalization as `normalize_word`. Only rows that are not already normalized are touched.
+    Word = apps.get_model("game", "Word")
+    not_normalized = Word.objects.filter(~Q(word=Lower("word")) | Q(word__regex=r"[^\x00-\x7f]"))
+    for word in not_normalized.iterator():
+        normalized = unicodedata.normalize("NFKC", word.word.lower())
+        if normalized == word.word:
+            continue
+        if Word.objects.filter(locale=word.locale, word=normalized).exists():
+            word.delete()
+        else:
+            word.word = normalized
+            word.save(update_fields=["word"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0006_dictionaryversion"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="word",
+            name="unique_word_locale",
+        ),
+        migrations.RunPython(normalize_words, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="word",
+            name="word_word_6db7bd_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="word",
+            name="word_locale_6dbaa7_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="word",
+            name="word_word_4bc093_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="word",
+            constraint=models.UniqueConstraint(fields=("locale", "word"), name="unique_word_locale"),
+        ),
+    ]
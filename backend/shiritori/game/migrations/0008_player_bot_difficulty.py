@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0007_normalized_word_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="bot_difficulty",
+            field=models.CharField(
+                blank=True, choices=[("EASY", "easy"), ("MEDIUM", "medium"), ("HARD", "hard")], max_length=6, null=True
+            ),
+        ),
+    ]
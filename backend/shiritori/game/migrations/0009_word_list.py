@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+import shiritori.utils.id_generator
+import shiritori.utils.nano_id_field
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0008_player_bot_difficulty"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WordList",
+            fields=[
+                (
+                    "id",
+                    shiritori.utils.nano_id_field.NanoIdField(
+                        default=shiritori.utils.id_generator.generate_id,
+                        editable=False,
+                        max_length=21,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("name", models.SlugField(unique=True)),
+                ("locale", models.CharField(choices=[("en", "English")], default="en", max_length=10)),
+                ("version", models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                "db_table": "word_list",
+            },
+        ),
+        migrations.CreateModel(
+            name="WordListEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("word", models.CharField(max_length=255)),
+                ("is_removal", models.BooleanField(default=False)),
+                (
+                    "word_list",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="entries", to="game.wordlist"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "word_list_entry",
+            },
+        ),
+        migrations.AddField(
+            model_name="gamesettings",
+            name="word_lists",
+            field=models.ManyToManyField(blank=True, related_name="game_settings", to="game.wordlist"),
+        ),
+        migrations.AddConstraint(
+            model_name="wordlistentry",
+            constraint=models.UniqueConstraint(fields=("word_list", "word"), name="unique_word_list_word"),
+        ),
+    ]
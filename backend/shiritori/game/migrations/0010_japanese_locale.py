@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0009_word_list"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dictionaryversion",
+            name="locale",
+            field=models.CharField(choices=[("en", "English"), ("ja", "Japanese")], max_length=10, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="gamesettings",
+            name="locale",
+            field=models.CharField(choices=[("en", "English"), ("ja", "Japanese")], default="en", max_length=10),
+        ),
+        migrations.AlterField(
+            model_name="word",
+            name="locale",
+            field=models.CharField(choices=[("en", "English"), ("ja", "Japanese")], default="en", max_length=10),
+        ),
+        migrations.AlterField(
+            model_name="wordlist",
+            name="locale",
+            field=models.CharField(choices=[("en", "English"), ("ja", "Japanese")], default="en", max_length=10),
+        ),
+    ]
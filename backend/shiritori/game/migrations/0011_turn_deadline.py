@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:10
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def set_deadlines(apps, _):
+    # Turns in progress keep the time they had left.
+    Game = apps.get_model("game", "Game")
+    now = timezone.now()
+    for game in Game.objects.filter(status="PLAYING").only("id", "turn_time_left").iterator():
+        Game.objects.filter(id=game.id).update(turn_deadline=now + timedelta(seconds=game.turn_time_left))
+
+
+def set_time_left(apps, _):
+    Game = apps.get_model("game", "Game")
+    now = timezone.now()
+    for game in Game.objects.filter(turn_deadline__isnull=False).only("id", "turn_deadline").iterator():
+        seconds = max(int((game.turn_deadline - now).total_seconds()), 0)
+        Game.objects.filter(id=game.id).update(turn_time_left=seconds)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0010_japanese_locale"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="turn_deadline",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(set_deadlines, set_time_left),
+        migrations.RemoveField(
+            model_name="game",
+            name="turn_time_left",
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0011_turn_deadline"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="disconnect_task_id",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0012_player_disconnect_task_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="starts_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
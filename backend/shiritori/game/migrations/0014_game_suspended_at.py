@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0013_game_starts_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="suspended_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(fields=["status", "suspended_at"], name="game_status_faba82_idx"),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0014_game_suspended_at"),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name="game",
+            old_name="task_id",
+            new_name="lease_owner",
+        ),
+        migrations.AddField(
+            model_name="game",
+            name="lease_expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(fields=["status", "lease_expires_at"], name="game_status_49ca0b_idx"),
+        ),
+    ]
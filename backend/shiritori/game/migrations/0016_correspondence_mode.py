@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:25
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0015_game_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesettings",
+            name="correspondence_turn_hours",
+            field=models.IntegerField(
+                default=24,
+                validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(168)],
+            ),
+        ),
+        migrations.AddField(
+            model_name="gamesettings",
+            name="mode",
+            field=models.CharField(
+                choices=[("REALTIME", "Real time"), ("CORRESPONDENCE", "Correspondence")],
+                default="REALTIME",
+                max_length=15,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(fields=["status", "turn_deadline"], name="game_status_401ef5_idx"),
+        ),
+    ]
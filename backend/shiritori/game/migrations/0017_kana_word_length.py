@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:52
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0016_correspondence_mode"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="gamesettings",
+            name="word_length",
+            field=models.IntegerField(
+                default=3,
+                validators=[django.core.validators.MinValueValidator(2), django.core.validators.MaxValueValidator(5)],
+            ),
+        ),
+    ]
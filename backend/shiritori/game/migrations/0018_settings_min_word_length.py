@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("game", "0017_kana_word_length"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="gamesettings",
+            constraint=models.CheckConstraint(
+                check=models.Q(("word_length__gte", 3), ("locale__in", ["ja"]), _connector="OR"),
+                name="game_settings_min_word_length",
+                violation_error_message="Words must be at least 3 characters long.",
+            ),
+        ),
+    ]
@@ -1,17 +1,30 @@
-from .game import Game
+from .dictionary_version import DictionaryVersion
+from .game import Game, PrefixHint
 from .game_settings import GameSettings
+from .game_state import GameState, PlayerState, WordState
 from .game_word import GameWord
 from .player import Player
-from .text_choices import GameLocales, GameStatus, PlayerType
+from .text_choices import BotDifficulty, GameLocales, GameMode, GameStatus, PlayerType
 from .word import Word
+from .word_list import WordList, WordListEntry, WordOverlay
 
 __all__ = (
     "Game",
+    "PrefixHint",
     "Player",
     "Word",
+    "WordList",
+    "WordListEntry",
+    "WordOverlay",
+    "DictionaryVersion",
     "GameWord",
     "GameSettings",
+    "GameState",
+    "PlayerState",
+    "WordState",
     "GameStatus",
     "GameLocales",
+    "GameMode",
     "PlayerType",
+    "BotDifficulty",
 )
@@ -0,0 +1,21 @@
+from django.db import models
+
+from shiritori.game.models.text_choices import GameLocales
+
+
+class DictionaryVersion(models.Model):
+    """
+    The version of the word list that was last synced into the `word` table for a locale.
+    """
+
+    locale = models.CharField(max_length=10, choices=GameLocales.choices, unique=True)
+    checksum = models.CharField(max_length=64)
+    version = models.PositiveIntegerField(default=0)
+    word_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "dictionary_version"
+
+    def __str__(self):
+        return f"{self.locale} v{self.version}"
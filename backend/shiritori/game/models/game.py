@@ -1,21 +1,49 @@
 import contextlib
+import itertools
+import logging
+import math
 import random
+import typing
 from collections.abc import Iterable
+from datetime import timedelta
+from functools import cached_property
 from typing import Optional, Union
 
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
-from django.db.models import Count, F, Q, QuerySet, Sum
-from django.db.models.functions import Length, Right
+from django.db.models import Count, Exists, OuterRef, Q, QuerySet, Sum
+from django.db.models.functions import Length
+from django.utils import timezone
 
+from shiritori.game.bot import bot_think_time, choose_bot_word
+from shiritori.game.dictionary import get_blocked_words, get_blocklist, get_dawg, get_letter_index
 from shiritori.game.models.game_settings import GameSettings
+from shiritori.game.models.game_state import GameState, PlayerState
 from shiritori.game.models.game_word import GameWord
 from shiritori.game.models.player import Player
-from shiritori.game.models.text_choices import GameStatus, PlayerType
-from shiritori.game.utils import generate_random_letter, wait
+from shiritori.game.models.text_choices import BotDifficulty, GameMode, GameStatus, PlayerType
+from shiritori.game.models.word import Word
+from shiritori.game.utils import generate_random_letter, last_letter, loses_game, normalize_word
 from shiritori.utils import NanoIdField
 from shiritori.utils.abstract_model import AbstractModel
 
+logger = logging.getLogger(__name__)
+
+# Seconds between the host starting the game and its first turn.
+START_COUNTDOWN = 3
+
+
+class PrefixHint(typing.NamedTuple):
+    prefix: str
+    # The number of words the prefix can still lead to in the game.
+    count: int
+    is_word: bool
+    words: list[str]
+
+    @property
+    def valid(self) -> bool:
+        return self.count > 0
+
 
 class Game(AbstractModel):
     id = NanoIdField(max_length=5)
@@ -32,13 +60,25 @@ class Game(AbstractModel):
         null=True,
         blank=True,
     )
-    turn_time_left = models.IntegerField(default=0)
+    # When the current turn runs out, remaining time is computed from it so the game is only written on turn changes.
+    turn_deadline = models.DateTimeField(null=True, blank=True)
+    # When a game that is counting down starts, cleared if the countdown is cancelled.
+    starts_at = models.DateTimeField(null=True, blank=True)
+    # Set while no player is connected, the turn timer stops until one comes back.
+    suspended_at = models.DateTimeField(null=True, blank=True)
     last_word = models.CharField(max_length=255, null=True, blank=True, default=generate_random_letter)
-    task_id = models.CharField(max_length=255, null=True, blank=True)
+    # The turn timer service driving the game, another one takes over once the lease expires without being renewed.
+    lease_owner = models.CharField(max_length=255, null=True, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ("-created_at",)
         db_table = "game"
+        indexes = [
+            models.Index(fields=["status", "suspended_at"]),
+            models.Index(fields=["status", "lease_expires_at"]),
+            models.Index(fields=["status", "turn_deadline"]),
+        ]
 
     def __str__(self) -> str:
         return f"Game {self.id}"
@@ -63,6 +103,85 @@ class Game(AbstractModel):
         """
         return Game.get_start_able_games().filter(id=game_id)
 
+    @staticmethod
+    def suspend_if_idle(game_id: str) -> bool:
+        """
+        Suspend a playing game once no human player is connected to it, its turn timer is released
+        so the game costs nothing until someone comes back.
+        :param game_id: str - The id of the game.
+        :return: bool - Whether the game was suspended.
+        """
+        connected = Player.objects.filter(game=OuterRef("pk"), is_connected=True, bot_difficulty__isnull=True)
+        idle = Game.objects.filter(
+            id=game_id, status=GameStatus.PLAYING, suspended_at__isnull=True, settings__mode=GameMode.REALTIME
+        )
+        return bool(
+            idle.exclude(Exists(connected)).update(suspended_at=timezone.now(), lease_owner=None, lease_expires_at=None)
+        )
+
+    def resume(self) -> bool:
+        """
+        Resume a suspended game, the current turn starts over and the turn timer service claims it again.
+        :return: bool - Whether the game was suspended.
+        """
+        if self.suspended_at is None or self.status != GameStatus.PLAYING:
+            return False
+        self.suspended_at = None
+        self.reset_turn_time()
+        self.save(update_fields=["suspended_at", "turn_deadline"])
+        return True
+
+    @staticmethod
+    def end_expired_correspondence_turns() -> int:
+        """
+        End the correspondence turns whose deadline passed.
+        Correspondence games have no turn timer, this is run periodically and only loads the games it ends.
+        A game whose turn can't be ended is logged and left for the next run, the other games are still ended.
+        :return: int - The number of turns ended.
+        """
+        expired = Game.objects.select_related("settings").filter(
+            status=GameStatus.PLAYING, settings__mode=GameMode.CORRESPONDENCE, turn_deadline__lte=timezone.now()
+        )
+        count = 0
+        for game in expired.iterator():
+            try:
+                game.end_turn()
+            except Exception:
+                logger.exception("Could not end the correspondence turn of game %s", game.id)
+                continue
+            count += 1
+        return count
+
+    @staticmethod
+    def finish_idle_games(timeout: float) -> int:
+        """
+        Finish the games that stayed suspended for too long, all in one query.
+        :param timeout: float - The seconds a game may stay suspended.
+        :return: int - The number of games finished.
+        """
+        expired = timezone.now() - timedelta(seconds=timeout)
+        return Game.objects.filter(status=GameStatus.PLAYING, suspended_at__lt=expired).update(
+            status=GameStatus.FINISHED
+        )
+
+    @cached_property
+    def state(self) -> GameState:
+        """
+        The snapshot of the game's players and words, loaded on first use.
+        It lasts for one operation on the game: the operations start from a fresh one and keep it up to date
+        with what they write, so the game can be serialized right after without querying again.
+        Players and words saved through the game's relations drop it, see `invalidate_state`.
+        """
+        return GameState.load(self)
+
+    def invalidate_state(self) -> None:
+        """Drop the snapshot of the game's players and words, the next read loads it again."""
+        self.__dict__.pop("state", None)
+
+    def refresh_from_db(self, using: str | None = None, fields: Iterable[str] | None = None, **kwargs) -> None:
+        super().refresh_from_db(using, fields, **kwargs)
+        self.invalidate_state()
+
     @property
     def players(self) -> "QuerySet[Player]":
         qs = self.player_set.all().exclude(type=PlayerType.SPECTATOR)
@@ -91,20 +210,24 @@ class Game(AbstractModel):
         return self.players.filter(is_connected=True).last()
 
     @current_player.setter
-    def current_player(self, value: "Player") -> None:
+    def current_player(self, value: Union["Player", PlayerState]) -> None:
         self.player_set.filter().update(is_current=False)
+        self.player_set.filter(pk=value.pk).update(is_current=True)
         value.is_current = True
-        value.save(update_fields=["is_current"])
+        if "state" in self.__dict__:
+            self.state.set_current_player(value.pk)
 
     @property
     def winner(self) -> Optional["Player"]:
         return self.player_set.filter(type=PlayerType.WINNER).first()
 
     @winner.setter
-    def winner(self, value: "Player") -> None:
+    def winner(self, value: Union["Player", PlayerState]) -> None:
         self.player_set.filter(type=PlayerType.WINNER).update(type=PlayerType.HUMAN)
+        self.player_set.filter(pk=value.pk).update(type=PlayerType.WINNER)
         value.type = PlayerType.WINNER
-        value.save(update_fields=["type"])
+        if "state" in self.__dict__:
+            self.state.set_winner(value.pk)
 
     @property
     def player_count(self) -> int:
@@ -122,6 +245,22 @@ class Game(AbstractModel):
     def longest_word(self) -> Optional["GameWord"]:
         return self.gameword_set.order_by(Length("word").desc()).first()
 
+    @property
+    def turn_seconds_left(self) -> float:
+        """The time left in the current turn, to the microsecond."""
+        if self.turn_deadline is None:
+            return 0.0
+        return max((self.turn_deadline - timezone.now()).total_seconds(), 0.0)
+
+    @property
+    def turn_time_left(self) -> int:
+        """The whole seconds left in the current turn, as shown to players."""
+        return math.ceil(self.turn_seconds_left)
+
+    @turn_time_left.setter
+    def turn_time_left(self, seconds: int | float) -> None:
+        self.turn_deadline = timezone.now() + timedelta(seconds=seconds)
+
     @property
     def is_finished(self) -> bool:
         return self.status == GameStatus.FINISHED
@@ -145,14 +284,56 @@ class Game(AbstractModel):
         return self.settings.max_turns * self.player_count
 
     @property
-    def used_letters(self) -> QuerySet[str]:
-        return (
-            self.gameword_set.annotate(
-                last_letter=Right("word", 1),
-            )
-            .values_list("last_letter", flat=True)
-            .distinct()
+    def used_letters(self) -> list[str]:
+        """The letters the words played so far end with, see `last_letter`."""
+        words = self.gameword_set.filter(word__isnull=False).values_list("word", flat=True)
+        return sorted({last_letter(word, self.settings.locale) for word in words})
+
+    @property
+    def remaining_word_count(self) -> int | None:
+        """
+        The number of dictionary words that can still be played after the last word.
+        None if the letter index of the game's locale is not available.
+        """
+        if not self.last_word or (letters := get_letter_index(self.settings.locale)) is None:
+            return None
+        letter = last_letter(self.last_word, self.settings.locale)
+        used_words = {word for word in self.state.used_words if word.startswith(letter)}
+        # The words only the word lists add are not in the dictionary's count, they are left to the overlay count.
+        remaining = letters.remaining(letter, self._dictionary_words(used_words), self.settings.word_length)
+        return max(remaining + self._overlay_word_count(letter, used_words), 0)
+
+    def _dictionary_words(self, words: Iterable[str]) -> set[str]:
+        """The words that are in the dictionary of the game's locale, the words only the word lists add are not."""
+        return {word for word, is_valid in Word.validate_many(words, self.settings.locale) if is_valid}
+
+    def _overlay_word_count(self, prefix: str, used_words: set[str]) -> int:
+        """
+        The number of playable words the settings' word lists add for the prefix, minus the ones they remove.
+        The blocked words they add are not playable.
+        Only the lists' changes to the dictionary are walked, it costs the size of the lists and not of the dictionary.
+        """
+        min_length = self.settings.word_length
+        changes = self.settings.dictionary_changes()
+        blocklist = get_blocklist(self.settings.locale)
+        added = sum(
+            1
+            for word in changes.additions
+            if word.startswith(prefix)
+            and len(word) >= min_length
+            and word not in used_words
+            and (blocklist is None or word not in blocklist)
+        )
+        removed = sum(
+            1
+            for word in changes.removals
+            if word.startswith(prefix) and len(word) >= min_length and word not in used_words
         )
+        return added - removed
+
+    @property
+    def is_dead_end(self) -> bool:
+        return self.remaining_word_count == 0
 
     def save(
         self,
@@ -177,30 +358,105 @@ class Game(AbstractModel):
             update_fields.append("settings")
         super().save(force_insert, force_update, using, update_fields)
 
-    def join(self, player: Union["Player", str], session_key: str = None) -> "Player":
+    def join(self, player: Union["Player", str], session_key: str | None = None) -> "Player":
         """Add a player to the game."""
+        self.invalidate_state()
         if self.is_started or self.is_finished:
             raise ValidationError("Game has already started or is finished.")
+        name = player if isinstance(player, str) else player.name
+        if (blocklist := get_blocklist(self.settings.locale)) is not None and name in blocklist:
+            raise ValidationError("Name is not allowed.")
         if isinstance(player, str):
             player = Player(
                 name=player,
                 game=self,
                 type=PlayerType.HUMAN,
                 session_key=session_key,
-                is_host=self.player_count == 0,
+                is_host=self.state.player_count == 0,
             )
         else:
             player.game = self
             player.type = PlayerType.HUMAN
-            player.is_host = self.player_count == 0
+            player.is_host = self.state.player_count == 0
             if not player.session_key:
                 player.session_key = session_key
         player.save(update_fields=["name", "game", "type", "session_key", "is_host"])
         return player
 
+    def prefix_hint(self, prefix: str, limit: int = 5) -> PrefixHint | None:
+        """
+        Check whether a prefix can still lead to a word that is playable in the current turn.
+        Answered from the locale's DAWG and the game's state, only the word lists' versions are queried.
+        :param prefix: str - The prefix the player typed so far.
+        :param limit: int - The maximum number of words to suggest.
+        :return: Optional[PrefixHint] - The hint, or None if the DAWG of the game's locale is not available.
+        """
+        if (dawg := get_dawg(self.settings.locale)) is None:
+            return None
+        prefix, min_length = normalize_word(prefix, self.settings.locale), self.settings.word_length
+        if not prefix or (self.last_word and prefix[0] != last_letter(self.last_word, self.settings.locale)):
+            return PrefixHint(prefix or "", 0, False, [])
+        used_words = {word for word in self.state.used_words if word.startswith(prefix)}
+        if len(prefix) == 1 and (letters := get_letter_index(self.settings.locale)) is not None:
+            # Counting the short words below a single letter walks thousands of paths, the letter index has the count.
+            total = letters.count(prefix, min_length)
+        else:
+            total = dawg.count_prefix(prefix, min_length)
+        used_in_dictionary = {word for word in self._dictionary_words(used_words) if len(word) >= min_length}
+        # The word lists' removals and the used words are already left out of the count.
+        blocked = {
+            word
+            for word in get_blocked_words(self.settings.locale, prefix[0])
+            if word.startswith(prefix)
+            and len(word) >= min_length
+            and word not in used_words
+            and not self.settings.is_removed(word)
+        }
+        count = max(total - len(used_in_dictionary) - len(blocked) + self._overlay_word_count(prefix, used_words), 0)
+        blocklist = get_blocklist(self.settings.locale)
+        is_word = (
+            len(prefix) >= min_length
+            and self.settings.is_valid_word(prefix)
+            and prefix not in used_words
+            and (blocklist is None or prefix not in blocklist)
+        )
+        playable = (
+            word
+            for word in dawg.iter_prefix(prefix)
+            if len(word) >= min_length
+            and word not in used_words
+            and word not in blocked
+            and not self.settings.is_removed(word)
+        )
+        return PrefixHint(prefix, count, is_word, list(itertools.islice(playable, limit)))
+
+    def add_bot(self, difficulty: str = BotDifficulty.MEDIUM, session_key: str | None = None) -> "Player":
+        """
+        Add a bot to the game.
+        :param difficulty: str - The difficulty of the bot.
+        :param session_key: str - The session key of the player adding the bot, only the host can add bots.
+        :return: Player - The bot.
+        :raises ValidationError: If the game has already started or the player is not the host.
+        """
+        self.invalidate_state()
+        if self.is_started or self.is_finished:
+            raise ValidationError("Game has already started or is finished.")
+        if session_key and (not (host := self.state.host) or host.session_key != session_key):
+            raise ValidationError("Only the host can add bots.")
+        names = set(self.player_set.values_list("name", flat=True))
+        name = next(name for number in itertools.count(1) if (name := f"{difficulty.title()}Bot{number}") not in names)
+        return Player.objects.create(
+            name=name,
+            game=self,
+            type=PlayerType.BOT,
+            bot_difficulty=difficulty,
+            is_host=not names,
+        )
+
     def leave(self, player: Union["Player", str], *, was_deleted: bool = False) -> None:
         """
         Remove a player from the game.
+        Costs the same number of queries however many players are left, they are read once from the snapshot.
 
         player: Union[Player, str] - The player to remove.
         was_deleted: bool - Whether the player was already deleted or not.
@@ -209,8 +465,10 @@ class Game(AbstractModel):
         with transaction.atomic():
             if isinstance(player, str):
                 player = self.player_set.get(session_key=player)
-            with contextlib.suppress(Exception):
-                player.delete()
+            if not was_deleted:
+                with contextlib.suppress(Exception):
+                    player.delete()
+            self.invalidate_state()
             if player.is_host:
                 try:
                     self.recalculate_host()
@@ -221,35 +479,45 @@ class Game(AbstractModel):
                     self.calculate_current_player(save=False)
                 except ValidationError:
                     self.status = GameStatus.FINISHED
-            if self.player_count == 0:
+            if self.status == GameStatus.WAITING and self.state.player_count < 2:
+                self.cancel_start()
+            if self.state.player_count == 0:
                 self.delete()
             else:
                 self.save(update_fields=["status"])
 
     def prepare_start(
-        self, session_key: str = None, game_settings: Optional["GameSettings"] = None, *, save: bool = True
+        self, session_key: str | None = None, game_settings: Optional["GameSettings"] = None, *, save: bool = True
     ) -> None:
         """
-        Prepares to start the game.
+        Prepares to start the game, it starts once the countdown from now is over.
         :param session_key: str - The session key of the player starting the game.
         :param game_settings: GameSettings - The settings to use for the game.
         :param save: bool - Whether to save the game after starting.
         :return: None
         :raises ValidationError: If there are less than 2 players in the game.
         """
+        self.invalidate_state()
         if self.status != GameStatus.WAITING:
             raise ValidationError("Cannot start a game that is not waiting.")
-        if session_key and self.host.session_key != session_key:
+        if session_key and self.state.host.session_key != session_key:
             raise ValidationError("Only the host can start the game.")
-        if self.player_count < 2:
+        if self.state.player_count < 2:
             raise ValidationError("Cannot start a game with less than 2 players.")
+        if self.starts_at and self.starts_at > timezone.now():
+            raise ValidationError("The game is already starting.")
         self.shuffle_player_order()
         self.calculate_current_player(save=False)
         if game_settings:
             self.settings = game_settings
-        self.turn_time_left = self.settings.turn_time
+        if self.settings.is_correspondence and any(player.is_bot for player in self.state.players):
+            raise ValidationError("Bots can't play correspondence games.")
+        self.reset_turn_time()
+        if self.is_dead_end:
+            self.last_word = generate_random_letter(self.settings.locale, self.settings.word_length)
+        self.starts_at = timezone.now() + timedelta(seconds=START_COUNTDOWN)
         if save:
-            update_fields = ["turn_time_left"]
+            update_fields = ["turn_deadline", "last_word", "starts_at"]
             if game_settings:
                 update_fields.append("settings")
             self.save(update_fields=update_fields)
@@ -257,11 +525,26 @@ class Game(AbstractModel):
     def start(self) -> None:
         """
         Start the game.
+        The first turn starts now, not when the countdown before it started.
         """
         self.status = GameStatus.PLAYING
-        self.save(update_fields=["status"])
+        self.starts_at = None
+        self.reset_turn_time()
+        self.save(update_fields=["status", "starts_at", "turn_deadline"])
+
+    def cancel_start(self) -> None:
+        """
+        Cancel the countdown of a game that is about to start, its scheduled start then does nothing.
+        """
+        from shiritori.game.events import send_game_start_countdown_cancel
+
+        if self.starts_at is None:
+            return
+        self.starts_at = None
+        self.save(update_fields=["starts_at"])
+        send_game_start_countdown_cancel(self.id)
 
-    def restart(self, session_key: str = None) -> None:
+    def restart(self, session_key: str | None = None) -> None:
         """
         Restart the game.
         """
@@ -271,16 +554,28 @@ class Game(AbstractModel):
                 raise ValidationError("Only the host can restart the game.")
         self.players.update(is_current=False, order=None)
         self.gameword_set.all().delete()
+        self.invalidate_state()
         self.status = GameStatus.WAITING
         self.current_turn = 0
-        self.turn_time_left = 0
-        self.task_id = None
-        self.last_word = generate_random_letter()
-        self.save(update_fields=["status", "current_turn", "turn_time_left", "task_id", "last_word"])
+        self.turn_deadline = None
+        self.lease_owner = None
+        self.lease_expires_at = None
+        self.last_word = generate_random_letter(self.settings.locale, self.settings.word_length)
+        self.save(
+            update_fields=["status", "current_turn", "turn_deadline", "lease_owner", "lease_expires_at", "last_word"]
+        )
 
-    def finish(self):
+    def finish(self, loser: Optional["Player"] = None):
+        """
+        Finish the game, the player with the highest score wins.
+        :param loser: Player - A player who lost by the rules, they can't win whatever their score.
+        """
         self.status = GameStatus.FINISHED
-        self.winner = self.leaderboard.first()
+        leaderboard = self.state.leaderboard
+        if loser is not None:
+            leaderboard = [player for player in leaderboard if player.pk != loser.pk]
+        if leaderboard:
+            self.winner = leaderboard[0]
         self.save(update_fields=["status", "last_word", "current_turn"])
 
     def calculate_current_player(self, *, save: bool = True) -> None:
@@ -290,16 +585,17 @@ class Game(AbstractModel):
         :return: None
         :raises ValidationError: If there are no players in the game.
         """
-        player_count = self.player_count
+        player_count = self.state.player_count
         if player_count == 0:
             raise ValidationError("Cannot calculate current player when there are no players.")
         if player_count == 1:
             raise ValidationError("Cannot calculate current player when there is only 1 player.")
 
-        if self.next_player and self.next_player.is_connected is False:
+        next_player = self.state.next_player
+        if not self.state.takes_turns(next_player):
             self.skip_turn()
         else:
-            self.current_player = self.next_player
+            self.current_player = next_player
 
         if save:
             self.save()
@@ -312,15 +608,16 @@ class Game(AbstractModel):
             raise ValidationError("Cannot shuffle player order when game has started.")
         if self.is_finished:
             raise ValidationError("Cannot shuffle player order when game is finished.")
-        if self.player_count < 2:
+        if self.state.player_count < 2:
             raise ValidationError("Cannot shuffle player order when there are less than 2 players.")
-        self.players.update(order=None)
-        players = list(self.players.all())
+        players = self.state.players
         random.shuffle(players)
         for index, player in enumerate(players):
             player.order = index
-            # Let it be known, that for some reason bulk_update does not work here. ¯\_(ツ)_/¯
-            player.save(update_fields=["order"])
+        # Orders are unique per game and a conditional constraint can't be deferred, a single update moving
+        # the orders around could collide with an order that is not moved yet. Clear them first.
+        self.players.update(order=None)
+        Player.objects.bulk_update([Player(id=player.id, order=player.order) for player in players], ["order"])
 
     def recalculate_host(self, *, save: bool = True) -> None:
         """
@@ -329,19 +626,15 @@ class Game(AbstractModel):
         :return: None
         :raises ValidationError: If there are no players in the game.
         """
-        host = self.host
-        players = self.players
-        first_player = players.first()
-
         # If no players raise ValidationError
-        if not players.exists():
+        if not (players := self.state.players):
             raise ValidationError("Cannot recalculate host when there are no players.")
 
-        if not host:
-            if first := first_player:
-                first.is_host = True
-                if save:
-                    first.save(update_fields=["is_host"])
+        if not self.state.host:
+            first = players[0]
+            first.is_host = True
+            if save:
+                self.player_set.filter(pk=first.pk).update(is_host=True)
 
     def can_take_turn(self, session_key: str) -> None:
         """
@@ -357,9 +650,9 @@ class Game(AbstractModel):
         """
         if self.status != GameStatus.PLAYING:
             raise ValidationError("Game is not in progress.")
-        if self.current_player.session_key != session_key:
+        if (current_player := self.state.current_player) is None or current_player.session_key != session_key:
             raise ValidationError("It is not your turn.")
-        if self.turn_time_left <= 0:
+        if self.turn_seconds_left <= 0:
             raise ValidationError("Turn time has expired.")
 
     def take_turn(self, session_key: str, word: str | None, *, save: bool = True) -> None:
@@ -371,6 +664,7 @@ class Game(AbstractModel):
         :return: None
         :raises ValidationError: If the player cannot take a turn.
         """
+        self.invalidate_state()
         self.can_take_turn(session_key)
         self._handle_turn(word, save=save)
 
@@ -382,8 +676,11 @@ class Game(AbstractModel):
         :return: None
         """
         with transaction.atomic():
-            self.create_word(word)
-            if self.current_turn + 1 > self.max_turns:
+            game_word = self.create_word(word)
+            if loses_game(game_word.word, self.settings.locale):
+                self.finish(loser=self.state.get_player(game_word.player_id))
+            # End the game early once no word can follow the last one.
+            elif self.current_turn + 1 > self.state.max_turns or (word and self.is_dead_end):
                 self.finish()
             self.update_turn()
             self.calculate_current_player(save=False)
@@ -394,20 +691,39 @@ class Game(AbstractModel):
                         "current_turn",
                         "current_round",
                         "last_word",
-                        "turn_time_left",
+                        "turn_deadline",
                     ]
                 )
 
+    def play_bot_turn(self, difficulty: str) -> bool:
+        """
+        Play the current turn for a bot.
+        Costs no more queries than a human turn, the word comes from the in-memory dictionary.
+        :param difficulty: str - The difficulty of the current player, which must be a bot.
+        :return: bool - Whether the bot played a word, if not the turn is left to run out.
+        """
+        self.invalidate_state()
+        if not (word := choose_bot_word(self, difficulty)):
+            return False
+        try:
+            self._handle_turn(word)
+        except ValidationError:
+            # The dictionary changed under the bot, let the turn run out.
+            return False
+        return True
+
     def create_word(self, word: str) -> GameWord:
         """
         Create a word for the current turn.
         :param word: The word the player submitted.
         """
-        timed_out = self.turn_time_left <= 0
-        duration = self.settings.turn_time - self.turn_time_left
+        seconds_left = self.turn_seconds_left
+        timed_out = seconds_left <= 0
+        # Correspondence turns are scored like real time ones, a day long turn is not a day long penalty.
+        duration = min(self.settings.turn_duration.total_seconds() - seconds_left, self.settings.turn_time)
         game_word = GameWord.create(
             game=self,
-            player=self.current_player,
+            player=self.state.current_player,
             word=word,
             duration=duration,
             timed_out=timed_out,
@@ -423,15 +739,15 @@ class Game(AbstractModel):
         :return: None
         """
         self.current_turn += 1
-        if self.current_player == self.last_player:
+        if self.state.current_player == self.state.last_player:
             self.current_round += 1
 
     def reset_turn_time(self):
         """
-        Reset the turn time back to the default turn time.
+        Start the turn clock over, the turn ends the game's turn time from now.
         :return: None
         """
-        self.turn_time_left = self.settings.turn_time
+        self.turn_deadline = timezone.now() + self.settings.turn_duration
 
     def skip_turn(self):
         """
@@ -442,14 +758,14 @@ class Game(AbstractModel):
 
         :return: None
         """
-        connected_players = self.players.filter(is_connected=True)
+        active_players = self.state.active_players
         try:
-            current_player_index = list(connected_players).index(self.current_player)
+            current_player_index = active_players.index(self.state.current_player)
         except ValueError as error:
             raise ValidationError("Current player is not connected.") from error
-        if connected_players.count() >= 2:
-            next_index = (current_player_index + 1) % connected_players.count()
-            self.current_player = connected_players[next_index]
+        if len(active_players) >= 2:
+            next_index = (current_player_index + 1) % len(active_players)
+            self.current_player = active_players[next_index]
 
     def end_turn(self) -> None:
         """
@@ -461,29 +777,49 @@ class Game(AbstractModel):
 
         :return: None
         """
+        self.invalidate_state()
         self._handle_turn(None)
 
     @staticmethod
-    def run_turn_loop(game_id: str, task_id: str):
-        """
-        Runs the turn loop for a game.
-
-        This will be run from a celery task.
-
-        :param game_id: The id of the game to run the turn loop for.
-        :param task_id: The id of the task running the turn loop.
-
-        """
-        from shiritori.game.events import send_game_timer_updated
-
-        qs: QuerySet["Game"] = Game.objects.filter(id=game_id)
-        while qs.filter(Q(status=GameStatus.PLAYING) & Q(task_id=task_id)).exists():
-            if qs.filter(turn_time_left__gt=0).exists():
-                qs.update(turn_time_left=F("turn_time_left") - 1)
-                wait()  # sleep for 1.25 seconds to allow for any networking issues
-            else:
-                # if the game timer is 0, end the turn
-                # and start the next turn
-                qs.first().end_turn()
-            if game := qs.values("id", "turn_time_left").first():
-                send_game_timer_updated(game["id"], game["turn_time_left"])
+    def tick_turn(game_id: str, owner: str) -> float | None:
+        """
+        Check the turn timer of a game.
+        The turn is ended once its deadline passed and a bot that is done thinking plays,
+        so the game is only written when the turn changes. Players count the turn down themselves,
+        they are sent the deadline when the turn starts.
+        :param game_id: The id of the game.
+        :param owner: The id of the timer driving the game, other timers' games are left alone.
+        :return: Optional[float] - Seconds until the next check,
+            or None if the game is no longer playing under the owner.
+        """
+        game = Game.objects.select_related("settings").filter(id=game_id, status=GameStatus.PLAYING, lease_owner=owner)
+        if (game := game.first()) is None:
+            return None
+        if game.turn_seconds_left <= 0:
+            game.end_turn()
+        elif (bot_turn := game._bot_turn()) and bot_turn[1] <= 0:
+            # A bot that finds no word lets the turn run out.
+            game.play_bot_turn(bot_turn[0])
+        if game.is_finished:
+            return 0
+        # Nothing happens before the deadline or the bot playing, a word played in between wakes the timer early.
+        delay = game.turn_seconds_left
+        if (bot_turn := game._bot_turn()) and bot_turn[1] > 0:
+            delay = min(delay, bot_turn[1])
+        return delay
+
+    def _bot_turn(self) -> tuple[str, float] | None:
+        """
+        Get the difficulty of the current player if it is a bot, and how long until it is done thinking.
+        The timer ticks once when the bot is ready and then at the deadline, so a bot that finds no word
+        lets the turn run out.
+        :return: Optional[tuple[str, float]] - The difficulty of the bot and the seconds until it plays,
+            zero or less once it is ready. None if no bot should play this turn.
+        """
+        difficulty = self.player_set.filter(is_current=True).values_list("bot_difficulty", flat=True).first()
+        if difficulty is None or self.turn_deadline is None:
+            return None
+        if (think_time := bot_think_time(difficulty, self.id, self.current_turn)) is None:
+            return None
+        turn_time = self.settings.turn_time
+        return difficulty, min(think_time, turn_time - 1) - (turn_time - self.turn_seconds_left)
@@ -1,26 +1,127 @@
+from datetime import timedelta
+from functools import cached_property
+
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
-from shiritori.game.models.text_choices import GameLocales
+from shiritori.game.dictionary import get_dictionary
+from shiritori.game.models.text_choices import GameLocales, GameMode
+from shiritori.game.models.word import Word
+from shiritori.game.models.word_list import WordList, WordOverlay
+from shiritori.game.utils import KANA_LOCALES, normalize_word
 from shiritori.utils.abstract_model import NanoIdModel
 
+MIN_WORD_LENGTH = 3
+# A kana is a syllable, two of them make a word as long as three letters.
+KANA_MIN_WORD_LENGTH = 2
+
+# The words a set of word lists changes in a locale's dictionary, by locale and the lists' ids and versions, with
+# the dictionary version they were checked against. Games with the same lists share them until one of them changes.
+_dictionary_changes: dict[tuple[str, tuple[tuple[str, int], ...]], tuple[str, WordOverlay]] = {}
+
 
 class GameSettings(NanoIdModel):
     locale = models.CharField(max_length=10, choices=GameLocales.choices, default=GameLocales.EN)
-    word_length = models.IntegerField(default=3, validators=[MinValueValidator(3), MaxValueValidator(5)])
+    word_length = models.IntegerField(
+        default=MIN_WORD_LENGTH, validators=[MinValueValidator(KANA_MIN_WORD_LENGTH), MaxValueValidator(5)]
+    )
     turn_time = models.IntegerField(default=60, validators=[MinValueValidator(5), MaxValueValidator(120)])
     max_turns = models.IntegerField(default=10, validators=[MinValueValidator(5), MaxValueValidator(20)])
+    word_lists = models.ManyToManyField(WordList, blank=True, related_name="game_settings")
+    mode = models.CharField(max_length=15, choices=GameMode.choices, default=GameMode.REALTIME)
+    # Used instead of `turn_time` in correspondence games.
+    correspondence_turn_hours = models.IntegerField(
+        default=24, validators=[MinValueValidator(1), MaxValueValidator(24 * 7)]
+    )
 
     class Meta:
         db_table = "game_settings"
+        constraints = [
+            # The field allows the kana minimum, the other locales count letters and need longer words.
+            models.CheckConstraint(
+                name="game_settings_min_word_length",
+                check=models.Q(word_length__gte=MIN_WORD_LENGTH) | models.Q(locale__in=sorted(KANA_LOCALES)),
+                violation_error_message=f"Words must be at least {MIN_WORD_LENGTH} characters long.",
+            ),
+        ]
 
     @staticmethod
     def get_default_settings() -> dict:
         all_fields = GameSettings._meta.get_fields()  # noqa - protected access
-        fields = filter(lambda f: hasattr(f, "default") and f.name != "id", all_fields)
+        fields = filter(lambda f: hasattr(f, "default") and f.name != "id" and not f.many_to_many, all_fields)
         # inspect the fields and create a dict of the defaults.
         return {field.name: field.default for field in fields}
 
     @classmethod
     def from_defaults(cls) -> "GameSettings":
         return cls.objects.create(**cls.get_default_settings())
+
+    @staticmethod
+    def min_word_length(locale: str) -> int:
+        """The shortest word length a game of the locale can be set to."""
+        return KANA_MIN_WORD_LENGTH if locale in KANA_LOCALES else MIN_WORD_LENGTH
+
+    @property
+    def is_correspondence(self) -> bool:
+        return self.mode == GameMode.CORRESPONDENCE
+
+    @property
+    def turn_duration(self) -> timedelta:
+        """How long a turn lasts, in seconds in real time games and in hours in correspondence games."""
+        if self.is_correspondence:
+            return timedelta(hours=self.correspondence_turn_hours)
+        return timedelta(seconds=self.turn_time)
+
+    @cached_property
+    def word_list_versions(self) -> tuple[tuple[str, int], ...]:
+        """The id and version of the word lists these settings use, one query."""
+        if not self.pk:
+            return ()
+        return tuple(self.word_lists.order_by("id").values_list("id", "version"))
+
+    @cached_property
+    def overlays(self) -> list[WordOverlay]:
+        """The overlays of the word lists these settings use."""
+        return WordList.get_overlays(self.word_list_versions)
+
+    def dictionary_changes(self) -> WordOverlay:
+        """
+        The words the word lists actually change in the locale's dictionary: the additions it does not have, and the
+        removals it has. Checked against the dictionary once per version of the lists and of the dictionary.
+        :return: WordOverlay - The added and removed words.
+        """
+        if not self.word_list_versions:
+            return WordOverlay(frozenset(), frozenset())
+        key = (self.locale, self.word_list_versions)
+        version = dictionary.version if (dictionary := get_dictionary(self.locale)) is not None else None
+        if version is not None and (cached := _dictionary_changes.get(key)) is not None and cached[0] == version:
+            return cached[1]
+        added, removed = set(), set()
+        for overlay in self.overlays:
+            added.update(overlay.additions)
+            removed.update(overlay.removals)
+        valid = dict(Word.validate_many(added | removed, self.locale))
+        changes = WordOverlay(
+            frozenset(word for word in added - removed if not valid[word]),
+            frozenset(word for word in removed if valid[word]),
+        )
+        # Without a built dictionary the words are checked against the database, which has no version to cache by.
+        if version is not None:
+            _dictionary_changes[key] = (version, changes)
+        return changes
+
+    def is_removed(self, word: str) -> bool:
+        """Check whether one of the word lists removes the given normalized word."""
+        return any(word in overlay.removals for overlay in self.overlays)
+
+    def is_valid_word(self, word: str) -> bool:
+        """
+        Check whether a word can be played under these settings.
+        The locale's dictionary is consulted first, then the words the lists add, then the words they remove.
+        :param word: str - The word to check.
+        :return: bool - Whether the word is valid.
+        """
+        word = normalize_word(word, self.locale)
+        if not Word.validate(word, self.locale) and not any(word in overlay.additions for overlay in self.overlays):
+            return False
+        return not self.is_removed(word)
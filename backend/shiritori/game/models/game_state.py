@@ -0,0 +1,215 @@
+import typing
+from dataclasses import dataclass, field
+
+from shiritori.game.models.game_word import GameWord
+from shiritori.game.models.player import Player
+from shiritori.game.models.text_choices import PlayerType
+from shiritori.game.utils import last_letter
+
+if typing.TYPE_CHECKING:
+    from shiritori.game.models.game import Game
+
+__all__ = (
+    "GameState",
+    "PlayerState",
+    "WordState",
+)
+
+PLAYER_STATE_FIELDS = (
+    "id",
+    "name",
+    "type",
+    "is_current",
+    "is_host",
+    "is_connected",
+    "session_key",
+    "order",
+    "bot_difficulty",
+)
+WORD_STATE_FIELDS = ("id", "word", "score", "duration", "player_id")
+
+
+@dataclass(slots=True, eq=False)
+class PlayerState:
+    """A player of a `GameState`, their score is summed from the game's words instead of being queried."""
+
+    id: str
+    name: str
+    type: str
+    is_current: bool
+    is_host: bool
+    is_connected: bool
+    session_key: str | None
+    order: int | None
+    bot_difficulty: str | None
+    total_score: float = 0
+
+    def __eq__(self, other: object) -> bool:
+        # The same player whether it comes from a snapshot or from the database.
+        if isinstance(other, (PlayerState, Player)):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.pk)
+
+    @property
+    def pk(self) -> str:
+        return self.id
+
+    @property
+    def score(self) -> int:
+        return int(round(self.total_score, 0))
+
+    @property
+    def is_bot(self) -> bool:
+        return self.bot_difficulty is not None
+
+
+@dataclass(slots=True, frozen=True)
+class WordState:
+    """A word of a `GameState`."""
+
+    id: str
+    word: str | None
+    score: float
+    duration: float
+    player_id: str | None
+
+    @property
+    def pk(self) -> str:
+        return self.id
+
+
+@dataclass(slots=True)
+class GameState:
+    """
+    A snapshot of a game's players and words, loaded in two queries.
+
+    Everything the game derives from them is answered from memory, so a turn or a serialization of the game
+    costs the same number of queries however many players and words it has. The game's own fields, its status
+    and current turn for instance, are read from the game itself and never go stale. The game keeps the
+    snapshot up to date with its own writes, see `Game.state`.
+    """
+
+    game: "Game"
+    # Every player but the spectators, in the order they joined.
+    players_by_id: dict[str, PlayerState]
+    words: list[WordState] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, game: "Game") -> "GameState":
+        """
+        Load the snapshot of a game.
+        :param game: Game - The game, its settings are only read when `max_turns` is, select them with the game.
+        :return: GameState - The snapshot.
+        """
+        players = Player.objects.filter(game_id=game.pk).exclude(type=PlayerType.SPECTATOR)
+        state = cls(game, {row["id"]: PlayerState(**row) for row in players.values(*PLAYER_STATE_FIELDS)})
+        for row in GameWord.objects.filter(game_id=game.pk).values(*WORD_STATE_FIELDS):
+            state._append_word(WordState(**row))
+        return state
+
+    def _append_word(self, word: WordState) -> None:
+        self.words.append(word)
+        if player := self.players_by_id.get(word.player_id):
+            player.total_score += word.score
+
+    def add_word(self, game_word: GameWord) -> None:
+        """
+        Add a word that was just saved.
+        :param game_word: GameWord - The word.
+        """
+        self._append_word(
+            WordState(game_word.id, game_word.word, game_word.score, game_word.duration, game_word.player_id)
+        )
+
+    def set_current_player(self, player_id: str) -> None:
+        for player in self.players_by_id.values():
+            player.is_current = player.id == player_id
+
+    def set_winner(self, player_id: str) -> None:
+        for player in self.players_by_id.values():
+            if player.id == player_id:
+                player.type = PlayerType.WINNER
+            elif player.type == PlayerType.WINNER:
+                player.type = PlayerType.HUMAN
+
+    def get_player(self, player_id: str | None) -> PlayerState | None:
+        return self.players_by_id.get(player_id)
+
+    @property
+    def players(self) -> list[PlayerState]:
+        """The players in the order they play once the game started, in the order they joined before."""
+        players = list(self.players_by_id.values())
+        if self.game.is_started:
+            players.sort(key=lambda player: (player.order is None, player.order or 0))
+        return players
+
+    @property
+    def host(self) -> PlayerState | None:
+        return next((player for player in self.players_by_id.values() if player.is_host), None)
+
+    @property
+    def current_player(self) -> PlayerState | None:
+        return next((player for player in self.players_by_id.values() if player.is_current), None)
+
+    @property
+    def next_player(self) -> PlayerState | None:
+        if not (players := self.players):
+            return None
+        return players[self.game.current_turn % len(players)]
+
+    def takes_turns(self, player: PlayerState) -> bool:
+        """
+        Whether the player's turns are played, the turns of disconnected players are skipped.
+        Correspondence players are offline between their turns, they keep their turns.
+        """
+        return player.is_connected or self.game.settings.is_correspondence
+
+    @property
+    def last_player(self) -> PlayerState | None:
+        return next((player for player in reversed(self.players) if self.takes_turns(player)), None)
+
+    @property
+    def active_players(self) -> list[PlayerState]:
+        """The players whose turns are played, in turn order."""
+        return [player for player in self.players if self.takes_turns(player)]
+
+    @property
+    def winner(self) -> PlayerState | None:
+        return next((player for player in self.players_by_id.values() if player.type == PlayerType.WINNER), None)
+
+    @property
+    def player_count(self) -> int:
+        return len(self.players_by_id)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def last_used_word(self) -> WordState | None:
+        return self.words[-1] if self.words else None
+
+    @property
+    def longest_word(self) -> WordState | None:
+        return max(self.words, key=lambda word: len(word.word or ""), default=None)
+
+    @property
+    def leaderboard(self) -> list[PlayerState]:
+        return sorted(self.players, key=lambda player: player.total_score, reverse=True)
+
+    @property
+    def max_turns(self) -> int:
+        return self.game.settings.max_turns * self.player_count
+
+    @property
+    def used_words(self) -> set[str]:
+        return {word.word for word in self.words if word.word}
+
+    @property
+    def used_letters(self) -> list[str]:
+        """The letters the words played so far end with, see `last_letter`, sorted like `Game.used_letters`."""
+        locale = self.game.settings.locale
+        return sorted({last_letter(word.word, locale) for word in self.words if word.word})
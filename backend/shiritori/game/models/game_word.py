@@ -3,12 +3,13 @@ import typing
 from django.core.exceptions import ValidationError
 from django.db import models
 
-from shiritori.game.models.word import Word
-from shiritori.game.utils import calculate_score, case_insensitive_equal, normalize_word
+from shiritori.game.dictionary import get_blocklist, get_dictionary
+from shiritori.game.utils import calculate_score, case_insensitive_equal, last_letter, normalize_word
 from shiritori.utils.abstract_model import NanoIdModel
 
 if typing.TYPE_CHECKING:
     from shiritori.game.models.game import Game
+    from shiritori.game.models.game_state import PlayerState
     from shiritori.game.models.player import Player
 
 
@@ -43,26 +44,46 @@ class GameWord(NanoIdModel):
             ),
         ]
 
+    def save(self, *args, **kwargs) -> None:
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        # Keep the snapshot of the game the word was saved through in step, see `Game.state`.
+        if GameWord.game.is_cached(self) and "state" in self.game.__dict__:
+            if adding:
+                self.game.state.add_word(self)
+            else:
+                self.game.invalidate_state()
+
+    def delete(self, *args, **kwargs) -> tuple[int, dict[str, int]]:
+        result = super().delete(*args, **kwargs)
+        if GameWord.game.is_cached(self):
+            self.game.invalidate_state()
+        return result
+
     @classmethod
     def create(
-        cls, game: "Game", player: "Player", word: str | None, duration: int | float, timed_out: bool = False
+        cls,
+        game: "Game",
+        player: typing.Union["Player", "PlayerState", None],
+        word: str | None,
+        duration: int | float,
+        timed_out: bool = False,
     ) -> typing.Self:
         """
         Build a new GameWord instance.
         :param game: Game - The game the word is for.
-        :param player: Player - The player that entered the word.
+        :param player: Player - The player that entered the word, or their state in the game's snapshot.
         :param word: str - The word that was entered.
         :param duration: int - The duration it took to enter the word.
         :param timed_out: bool - Whether the word was entered because the timer ran out.
         :return: GameWord - The new GameWord instance.
         """
-        word = normalize_word(word)
-        current_used_letters = game.used_letters
-        is_new_letter = word and word[-1] not in current_used_letters
+        word = normalize_word(word, game.settings.locale)
+        is_new_letter = bool(word) and last_letter(word, game.settings.locale) not in game.state.used_letters
         calculated_score = calculate_score(word, duration, is_new_letter)
         game_word = cls(
             game=game,
-            player=player,
+            player_id=player.pk if player else None,
             word=word,
             duration=duration,
             score=calculated_score,
@@ -76,22 +97,55 @@ class GameWord(NanoIdModel):
         """
         Validates that the word meets the following criteria:
 
-        1. The word starts with the last word's last letter.
+        1. The word starts with the last word's last letter, see `last_letter`.
         2. The word is not already in the game.
         3. The word length is greater than or equal to the game's word length.
-        4. The word is in the dictionary for the game's locale.
+        4. The word is in the dictionary for the game's locale, or added by one of its word lists,
+           and none of its word lists removes it.
+        5. The word is not blocked by the blocklist of the game's locale.
 
         :return: bool - Whether the word is valid.
+        :raises ValidationError: If raise_exception is set and the word is invalid.
+            Words missing from the dictionary carry playable `suggestions` in the error's params.
         """
-        error_message = None
-        if self.game.last_word and not case_insensitive_equal(self.word[0], self.game.last_word[-1]):
+        locale = self.game.settings.locale
+        error_message, code, params = None, None, None
+        if self.game.last_word and not case_insensitive_equal(self.word[0], last_letter(self.game.last_word, locale)):
             error_message = "Word must start with the last letter of the previous word."
-        if self.game.gameword_set.filter(word__iexact=self.word).exists():
+        if self.word in self.game.state.used_words:
             error_message = "Word already used."
         if len(self.word) < self.game.settings.word_length:
             error_message = f"Word must be at least {self.game.settings.word_length} characters long."
-        if not Word.validate(self.word, self.game.settings.locale):
-            error_message = "Word not found in dictionary."
+        if not self.game.settings.is_valid_word(self.word):
+            error_message, code = "Word not found in dictionary.", "not_in_dictionary"
+        if (blocklist := get_blocklist(locale)) is not None and self.word in blocklist:
+            error_message, code = "Word is not allowed.", "blocked"
+        if code == "not_in_dictionary" and raise_exception:
+            params = {"suggestions": self.suggest()}
         if error_message and raise_exception:
-            raise ValidationError(error_message)
+            raise ValidationError(error_message, code=code, params=params)
         return error_message is None
+
+    def suggest(self, limit: int = 3) -> list[str]:
+        """
+        Suggest playable words one typo away from this word.
+        They start with the last word's last letter, are long enough, are not blocked and were not used in the game yet.
+        :param limit: int - The maximum number of suggestions.
+        :return: list[str] - The suggestions, empty if the locale's fuzzy index is not available.
+        """
+        locale = self.game.settings.locale
+        if not self.word or (dictionary := get_dictionary(locale)) is None:
+            return []
+        blocklist = get_blocklist(locale)
+        letter = last_letter(self.game.last_word, locale) if self.game.last_word else ""
+        min_length = self.game.settings.word_length
+        used_words = self.game.state.used_words
+
+        def accept(word: str) -> bool:
+            if not word.startswith(letter) or len(word) < min_length or word in used_words:
+                return False
+            if self.game.settings.is_removed(word):
+                return False
+            return blocklist is None or word not in blocklist
+
+        return dictionary.fuzzy.suggest(self.word, dictionary.dawg, accept=accept, limit=limit)
@@ -5,7 +5,7 @@ from django.db import models
 from django.db.models import QuerySet
 
 from shiritori.game.models.game_word import GameWord
-from shiritori.game.models.text_choices import PlayerType
+from shiritori.game.models.text_choices import BotDifficulty, PlayerType
 from shiritori.utils.abstract_model import AbstractModel, NanoIdModel
 
 
@@ -28,6 +28,10 @@ class Player(AbstractModel, NanoIdModel):
     is_connected = models.BooleanField(default=True)
     session_key = models.CharField(max_length=255, null=True, blank=True)
     order = models.IntegerField(null=True, blank=True)
+    # Only set for bots, a bot keeps it when its type changes to winner.
+    bot_difficulty = models.CharField(max_length=6, choices=BotDifficulty.choices, null=True, blank=True)
+    # The scheduled job that removes the player once their disconnect grace period is over.
+    disconnect_task_id = models.CharField(max_length=255, null=True, blank=True)
 
     class Meta:
         db_table = "player"
@@ -75,11 +79,29 @@ class Player(AbstractModel, NanoIdModel):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs) -> None:
+        super().save(*args, **kwargs)
+        self._invalidate_game_state()
+
+    def delete(self, *args, **kwargs) -> tuple[int, dict[str, int]]:
+        result = super().delete(*args, **kwargs)
+        self._invalidate_game_state()
+        return result
+
+    def _invalidate_game_state(self) -> None:
+        # Only the game instance the player was saved through knows about it, others reload their state on refresh.
+        if Player.game.is_cached(self) and self.game is not None:
+            self.game.invalidate_state()
+
     @property
     def score(self):
         result = self.gameword_set.aggregate(models.Sum("score")).get("score__sum") or 0
         return int(round(result, 0))
 
+    @property
+    def is_bot(self) -> bool:
+        return self.bot_difficulty is not None
+
     @property
     def words(self) -> "QuerySet[GameWord]":
         return self.gameword_set.all()
@@ -9,6 +9,13 @@ class GameStatus(models.TextChoices):
 
 class GameLocales(models.TextChoices):
     EN = "en", "English"
+    JA = "ja", "Japanese"
+
+
+class GameMode(models.TextChoices):
+    REALTIME = "REALTIME", "Real time"
+    # Turns last hours or days, players come back to the game when it is their turn.
+    CORRESPONDENCE = "CORRESPONDENCE", "Correspondence"
 
 
 class PlayerType(models.TextChoices):
@@ -16,3 +23,9 @@ class PlayerType(models.TextChoices):
     BOT = "BOT", "bot"
     SPECTATOR = "SPECTATOR", "spectator"
     WINNER = "WINNER", "winner"
+
+
+class BotDifficulty(models.TextChoices):
+    EASY = "EASY", "easy"
+    MEDIUM = "MEDIUM", "medium"
+    HARD = "HARD", "hard"
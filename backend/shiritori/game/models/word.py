@@ -1,8 +1,61 @@
-from django.conf import settings
-from django.db import models
+import typing
+from collections.abc import Iterable, Iterator
 
+from django.db import connection, models, transaction
+
+from shiritori.game.dictionary import dictionary_checksum, get_word_index, iter_dictionary_words
+from shiritori.game.models.dictionary_version import DictionaryVersion
 from shiritori.game.models.text_choices import GameLocales
-from shiritori.game.utils import chunk_list
+from shiritori.game.utils import chunk_list, normalize_word
+
+STAGING_TABLE = "word_staging"
+# The ids of the words a sync deletes and the words it inserts, numbered so they can be applied in key ranges.
+REMOVED_TABLE = "word_removed"
+ADDED_TABLE = "word_added"
+SYNC_BATCH_SIZE = 1000
+VALIDATE_BATCH_SIZE = 1000
+
+
+class DictionaryLoadResult(typing.NamedTuple):
+    locale: str
+    read: int
+    inserted: int
+
+
+class DictionarySyncResult(typing.NamedTuple):
+    locale: str
+    version: int
+    inserted: int
+    deleted: int
+    changed: bool
+
+
+class WordCopyStream:
+    """
+    A read-only file-like object that feeds words to `COPY ... FROM STDIN`.
+    Words are pulled from the iterable as the database asks for more data,
+    so only one buffer is held in memory at a time.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self._words = iter(words)
+        self._buffer = ""
+        self.count = 0
+
+    def read(self, size: int = -1) -> str:
+        parts, length = [self._buffer], len(self._buffer)
+        while size < 0 or length < size:
+            if (word := next(self._words, None)) is None:
+                break
+            line = word.replace("\\", "\\\\").replace("\t", "\\t") + "\n"
+            parts.append(line)
+            length += len(line)
+            self.count += 1
+        data = "".join(parts)
+        if size < 0:
+            size = len(data)
+        self._buffer = data[size:]
+        return data[:size]
 
 
 class Word(models.Model):
@@ -11,36 +64,192 @@ class Word(models.Model):
 
     class Meta:
         db_table = "word"
-        indexes = [
-            models.Index(fields=["word", "locale"]),
-            models.Index(fields=["locale"]),
-            models.Index(fields=["word"]),
-        ]
+        # Words are stored normalized, so every lookup is an exact match on (locale, word)
+        # and this index also serves queries filtering by locale alone.
         constraints = [
-            models.UniqueConstraint(name="unique_word_locale", fields=["word", "locale"]),
+            models.UniqueConstraint(name="unique_word_locale", fields=["locale", "word"]),
         ]
 
     def __str__(self):
         return f"{self.word} ({self.locale})"
 
+    def save(self, *args, **kwargs) -> None:
+        self.word = normalize_word(self.word, self.locale)
+        super().save(*args, **kwargs)
+
     @classmethod
     def validate(cls, word: str, locale: GameLocales | str = GameLocales.EN) -> bool:
-        """Validate that the word is in the dictionary for the given locale."""
-        return cls.objects.filter(word__iexact=word, locale=locale).exists()
+        """
+        Validate that the word is in the dictionary for the given locale.
+        Uses the memory-mapped dictionary index when one is available,
+        otherwise falls back to querying the database.
+        """
+        if (index := get_word_index(locale)) is not None:
+            return normalize_word(word, locale) in index
+        return cls.objects.filter(locale=locale, word=normalize_word(word, locale)).exists()
+
+    @classmethod
+    def validate_many(
+        cls, words: Iterable[str], locale: GameLocales | str = GameLocales.EN
+    ) -> Iterator[tuple[str, bool]]:
+        """
+        Validate a stream of words in a single pass.
+        Words are checked against the memory-mapped dictionary index when one is available,
+        otherwise each batch of words is checked with one query.
+        :param words: Iterable[str] - The words to validate, consumed lazily.
+        :param locale: str - The locale of the dictionary.
+        :return: Iterator[tuple[str, bool]] - Each word as given, with whether it is in the dictionary.
+        """
+        if (index := get_word_index(locale)) is not None:
+            for word in words:
+                yield word, normalize_word(word, locale) in index
+            return
+        for batch in chunk_list(words, VALIDATE_BATCH_SIZE):
+            normalized = [normalize_word(word, locale) for word in batch]
+            found = set(
+                cls.objects.filter(locale=locale, word__in=set(filter(None, normalized))).values_list("word", flat=True)
+            )
+            yield from zip(batch, (word in found for word in normalized))
+
+    @classmethod
+    def load_dictionary(cls, locale: GameLocales | str = GameLocales.EN) -> DictionaryLoadResult:
+        """
+        Load the dictionary for the given locale.
+        The word list is streamed from disk, so memory use does not grow with its size.
+        On PostgreSQL the words are copied into a staging table and upserted from there,
+        other databases insert them in batches.
+        :param locale: str - The locale to load.
+        :return: DictionaryLoadResult - How many words were read and how many were new.
+        """
+        words = iter_dictionary_words(locale)
+        if connection.vendor == "postgresql":
+            return cls._copy_dictionary(locale, words)
+        return cls._bulk_create_dictionary(locale, words)
+
+    @classmethod
+    def sync_dictionary(
+        cls, locale: GameLocales | str = GameLocales.EN, *, force: bool = False
+    ) -> DictionarySyncResult:
+        """
+        Make the `word` table match the dictionary file for the given locale.
+        The file's checksum is stored with a version number, an unchanged file is a no-op.
+        Otherwise only the words that were added to or removed from the file are written.
+        :param locale: str - The locale to sync.
+        :param force: bool - Compare the words even if the checksum has not changed.
+        :return: DictionarySyncResult - The new version and how many words were inserted and deleted.
+        """
+        checksum = dictionary_checksum(locale)
+        current = DictionaryVersion.objects.filter(locale=locale).first()
+        if current and current.checksum == checksum and not force:
+            return DictionarySyncResult(locale, current.version, 0, 0, False)
+
+        with transaction.atomic():
+            words = iter_dictionary_words(locale)
+            if connection.vendor == "postgresql":
+                inserted, deleted = cls._copy_sync_dictionary(locale, words)
+            else:
+                inserted, deleted = cls._batch_sync_dictionary(locale, words)
+            version, _ = DictionaryVersion.objects.select_for_update().get_or_create(
+                locale=locale, defaults={"checksum": checksum}
+            )
+            version.checksum = checksum
+            version.version += 1
+            version.word_count = cls.objects.filter(locale=locale).count()
+            version.save()
+        return DictionarySyncResult(locale, version.version, inserted, deleted, True)
 
     @staticmethod
-    def load_dictionary(locale: GameLocales | str = GameLocales.EN) -> list["Word"]:
-        """Load the dictionary for the given locale."""
-        with open(f"{settings.BASE_DIR}/dictionaries/{locale}.txt", encoding="utf-8") as f:
-            words = f.read().splitlines()
-        created_words = []
-        # Batch insert the words into the database in chunks of 1000
-        for chunk in chunk_list(words, 1000):
-            created_words.extend(
-                Word.objects.bulk_create(
-                    [Word(word=word, locale=locale) for word in chunk],
-                    batch_size=1000,
-                    ignore_conflicts=True,
+    def _copy_to_staging(cursor, words: Iterable[str], *, indexed: bool = False) -> int:
+        stream = WordCopyStream(words)
+        cursor.execute(f"CREATE TEMPORARY TABLE {STAGING_TABLE} (word varchar(255) NOT NULL) ON COMMIT DROP")
+        cursor.copy_expert(f"COPY {STAGING_TABLE} (word) FROM STDIN", stream)
+        if indexed:
+            cursor.execute(f"CREATE INDEX ON {STAGING_TABLE} (word)")
+            cursor.execute(f"ANALYZE {STAGING_TABLE}")
+        return stream.count
+
+    @classmethod
+    def _copy_sync_dictionary(cls, locale: str, words: Iterable[str]) -> tuple[int, int]:
+        table = cls._meta.db_table
+        with connection.cursor() as cursor:
+            cls._copy_to_staging(cursor, words, indexed=True)
+            # The differences are computed once, then applied in bounded batches by their number. The sync is one
+            # transaction, the temporary tables only live until it commits, so the row locks are held until the end.
+            removed = cls._create_diff_table(
+                cursor,
+                REMOVED_TABLE,
+                f"SELECT row_number() OVER (ORDER BY w.id) AS n, w.id FROM {table} w WHERE w.locale = %s "
+                f"AND NOT EXISTS (SELECT 1 FROM {STAGING_TABLE} s WHERE s.word = w.word)",
+                [locale],
+            )
+            added = cls._create_diff_table(
+                cursor,
+                ADDED_TABLE,
+                "SELECT row_number() OVER (ORDER BY s.word) AS n, s.word "
+                f"FROM (SELECT DISTINCT word FROM {STAGING_TABLE}) s "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {table} w WHERE w.locale = %s AND w.word = s.word)",
+                [locale],
+            )
+            deleted = inserted = 0
+            for start in range(0, removed, SYNC_BATCH_SIZE):
+                cursor.execute(
+                    f"DELETE FROM {table} w USING {REMOVED_TABLE} r WHERE w.id = r.id AND r.n > %s AND r.n <= %s",
+                    [start, start + SYNC_BATCH_SIZE],
                 )
+                deleted += cursor.rowcount
+            for start in range(0, added, SYNC_BATCH_SIZE):
+                cursor.execute(
+                    f"INSERT INTO {table} (word, locale) SELECT a.word, %s FROM {ADDED_TABLE} a "
+                    "WHERE a.n > %s AND a.n <= %s ON CONFLICT DO NOTHING",
+                    [locale, start, start + SYNC_BATCH_SIZE],
+                )
+                inserted += cursor.rowcount
+        return inserted, deleted
+
+    @staticmethod
+    def _create_diff_table(cursor, name: str, query: str, params: list) -> int:
+        """Store the rows of a query numbered by `n` in a temporary table, and count them."""
+        cursor.execute(f"CREATE TEMPORARY TABLE {name} ON COMMIT DROP AS {query}", params)
+        cursor.execute(f"CREATE INDEX ON {name} (n)")
+        cursor.execute(f"SELECT count(*) FROM {name}")
+        return cursor.fetchone()[0]
+
+    @classmethod
+    def _batch_sync_dictionary(cls, locale: str, words: Iterable[str]) -> tuple[int, int]:
+        missing = set(words)
+        removed_ids = []
+        for word_id, word in cls.objects.filter(locale=locale).values_list("id", "word").iterator(SYNC_BATCH_SIZE):
+            if word in missing:
+                missing.discard(word)
+            else:
+                removed_ids.append(word_id)
+        deleted = 0
+        for chunk in chunk_list(removed_ids, SYNC_BATCH_SIZE):
+            deleted += cls.objects.filter(id__in=chunk).delete()[0]
+        for chunk in chunk_list(sorted(missing), SYNC_BATCH_SIZE):
+            cls.objects.bulk_create([cls(word=word, locale=locale) for word in chunk], ignore_conflicts=True)
+        return len(missing), deleted
+
+    @classmethod
+    def _copy_dictionary(cls, locale: str, words: Iterable[str]) -> DictionaryLoadResult:
+        with transaction.atomic(), connection.cursor() as cursor:
+            read = cls._copy_to_staging(cursor, words)
+            cursor.execute(
+                f"INSERT INTO {cls._meta.db_table} (word, locale) "
+                f"SELECT DISTINCT word, %s FROM {STAGING_TABLE} "
+                "ON CONFLICT DO NOTHING",
+                [locale],
             )
-        return created_words
+            inserted = cursor.rowcount
+        return DictionaryLoadResult(locale, read, inserted)
+
+    @classmethod
+    def _bulk_create_dictionary(cls, locale: str, words: Iterable[str]) -> DictionaryLoadResult:
+        read = 0
+        existing = cls.objects.filter(locale=locale).count()
+        # Batch insert the words into the database in chunks of 1000
+        for chunk in chunk_list(words, 1000):
+            read += len(chunk)
+            cls.objects.bulk_create([cls(word=word, locale=locale) for word in chunk], ignore_conflicts=True)
+        inserted = cls.objects.filter(locale=locale).count() - existing
+        return DictionaryLoadResult(locale, read, inserted)
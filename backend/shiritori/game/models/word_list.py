@@ -0,0 +1,106 @@
+import typing
+from collections.abc import Iterable
+
+from django.db import models, transaction
+from django.db.models import F
+
+from shiritori.game.models.text_choices import GameLocales
+from shiritori.game.utils import normalize_word
+from shiritori.utils.abstract_model import NanoIdModel
+
+
+class WordOverlay(typing.NamedTuple):
+    """The words a word list adds to and removes from its locale's dictionary."""
+
+    additions: frozenset[str]
+    removals: frozenset[str]
+
+
+# Overlays loaded by this process by word list id, with the version they were loaded at.
+# Every game using a list shares the same overlay, a list is only read again after it changed.
+_overlays: dict[str, tuple[int, WordOverlay]] = {}
+
+
+class WordList(NanoIdModel):
+    """
+    A named set of house rules on top of a locale's dictionary, games pick the lists they use in their settings.
+    Lists only store the words they add or remove, so a game's cost grows with its lists, not with the dictionary.
+    """
+
+    name = models.SlugField(max_length=50, unique=True)
+    locale = models.CharField(max_length=10, choices=GameLocales.choices, default=GameLocales.EN)
+    # Bumped whenever the words change, so processes know their cached overlay is stale.
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        db_table = "word_list"
+
+    def __str__(self):
+        return f"{self.name} ({self.locale})"
+
+    @classmethod
+    def get_overlays(cls, versions: Iterable[tuple[str, int]]) -> list[WordOverlay]:
+        """
+        Get the overlays of the given word lists, from memory unless a list changed since it was loaded.
+        :param versions: Iterable[tuple[str, int]] - The id and current version of each list.
+        :return: list[WordOverlay] - The overlays, in the order of the lists.
+        """
+        versions = list(versions)
+        stale = [list_id for list_id, version in versions if _overlays.get(list_id, (None,))[0] != version]
+        if stale:
+            words = {list_id: ([], []) for list_id in stale}
+            entries = WordListEntry.objects.filter(word_list_id__in=stale)
+            for list_id, word, is_removal in entries.values_list("word_list_id", "word", "is_removal").iterator():
+                words[list_id][is_removal].append(word)
+            for list_id, version in versions:
+                if list_id in words:
+                    additions, removals = words[list_id]
+                    _overlays[list_id] = (version, WordOverlay(frozenset(additions), frozenset(removals)))
+        return [_overlays[list_id][1] for list_id, _ in versions]
+
+    def add_words(self, words: Iterable[str], *, removal: bool = False) -> int:
+        """
+        Add words to the list, moving them over if they were in the other set.
+        :param words: Iterable[str] - The words to add.
+        :param removal: bool - Remove the words from the dictionary instead of allowing them.
+        :return: int - The number of words written.
+        """
+        words = {normalized for word in words if (normalized := normalize_word(word, self.locale))}
+        with transaction.atomic():
+            self.entries.filter(word__in=words).delete()
+            WordListEntry.objects.bulk_create(
+                WordListEntry(word_list=self, word=word, is_removal=removal) for word in words
+            )
+            self._bump_version()
+        return len(words)
+
+    def discard_words(self, words: Iterable[str]) -> int:
+        """
+        Take words out of the list, the dictionary decides whether they are valid again.
+        :param words: Iterable[str] - The words to discard.
+        :return: int - The number of words that were in the list.
+        """
+        words = {normalized for word in words if (normalized := normalize_word(word, self.locale))}
+        with transaction.atomic():
+            deleted, _ = self.entries.filter(word__in=words).delete()
+            self._bump_version()
+        return deleted
+
+    def _bump_version(self) -> None:
+        WordList.objects.filter(pk=self.pk).update(version=F("version") + 1)
+        self.refresh_from_db(fields=["version"])
+
+
+class WordListEntry(models.Model):
+    word_list = models.ForeignKey(WordList, on_delete=models.CASCADE, related_name="entries")
+    word = models.CharField(max_length=255)
+    is_removal = models.BooleanField(default=False)
+
+    class Meta:
+        db_table = "word_list_entry"
+        constraints = [
+            models.UniqueConstraint(name="unique_word_list_word", fields=["word_list", "word"]),
+        ]
+
+    def __str__(self):
+        return f"{'-' if self.is_removal else '+'}{self.word} ({self.word_list_id})"
@@ -1,7 +1,8 @@
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from shiritori.game.models import Game, GameSettings, GameWord, Player
+from shiritori.game.models import BotDifficulty, Game, GameLocales, GameSettings, GameWord, Player, WordList
+from shiritori.game.models.game_settings import MIN_WORD_LENGTH
 
 __all__ = (
     "EmptySerializer",
@@ -12,6 +13,9 @@ __all__ = (
     "ShiritoriGameSerializer",
     "ShiritoriTurnSerializer",
     "CreateStartGameSerializer",
+    "AddBotSerializer",
+    "PrefixHintQuerySerializer",
+    "PrefixHintSerializer",
 )
 
 
@@ -44,6 +48,10 @@ class ShiritoriGameWordSerializer(serializers.ModelSerializer):
 
 
 class ShiritoriGameSettingsSerializer(serializers.ModelSerializer):
+    word_lists = serializers.SlugRelatedField(
+        slug_field="name", queryset=WordList.objects.all(), many=True, required=False
+    )
+
     class Meta:
         model = GameSettings
         exclude = ("id",)
@@ -52,6 +60,14 @@ class ShiritoriGameSettingsSerializer(serializers.ModelSerializer):
         kwargs.setdefault("data", GameSettings.get_default_settings())
         super().__init__(*args, **kwargs)
 
+    def validate(self, attrs):
+        locale = attrs.get("locale", GameLocales.EN)
+        if any(word_list.locale != locale for word_list in attrs.get("word_lists", [])):
+            raise serializers.ValidationError({"word_lists": "Word lists must use the game's locale."})
+        if attrs.get("word_length", MIN_WORD_LENGTH) < (min_length := GameSettings.min_word_length(locale)):
+            raise serializers.ValidationError({"word_length": f"Words must be at least {min_length} characters long."})
+        return attrs
+
 
 class ShiritoriPlayerSerializer(serializers.ModelSerializer):
     score = serializers.IntegerField(read_only=True)
@@ -77,24 +93,25 @@ class JoinGameSerializer(serializers.ModelSerializer):
 
 class ShiritoriGameSerializer(serializers.ModelSerializer):
     settings = ShiritoriGameSettingsSerializer()
-    words = ShiritoriGameWordSerializer(many=True, read_only=True)
-    players = ShiritoriPlayerSerializer(many=True, read_only=True)
-    longest_word = StringPrimaryKeyRelatedField(read_only=True, allow_null=True)
-    winner = StringPrimaryKeyRelatedField(read_only=True, allow_null=True)
-    current_player = StringPrimaryKeyRelatedField(read_only=True, allow_null=True)
+    # Players and words come from the game's snapshot, the whole game is serialized in the same few queries.
+    words = ShiritoriGameWordSerializer(source="state.words", many=True, read_only=True)
+    players = ShiritoriPlayerSerializer(source="state.players", many=True, read_only=True)
+    longest_word = StringPrimaryKeyRelatedField(source="state.longest_word", read_only=True, allow_null=True)
+    winner = StringPrimaryKeyRelatedField(source="state.winner", read_only=True, allow_null=True)
+    current_player = StringPrimaryKeyRelatedField(source="state.current_player", read_only=True, allow_null=True)
     is_finished = serializers.BooleanField(read_only=True)
-    max_turns = serializers.IntegerField(read_only=True)
-    player_count = serializers.IntegerField(read_only=True)
-    word_count = serializers.IntegerField(read_only=True)
-    used_letters = serializers.ListField(child=serializers.CharField(), read_only=True)
+    max_turns = serializers.IntegerField(source="state.max_turns", read_only=True)
+    player_count = serializers.IntegerField(source="state.player_count", read_only=True)
+    word_count = serializers.IntegerField(source="state.word_count", read_only=True)
+    used_letters = serializers.ListField(source="state.used_letters", child=serializers.CharField(), read_only=True)
+    turn_time_left = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Game
-        exclude = ("task_id",)
+        exclude = ("lease_owner", "lease_expires_at")
 
     def create(self, validated_data):  # noqa
-        settings = validated_data.pop("settings")
-        settings = GameSettings.objects.create(**settings)
+        settings = self.fields["settings"].create(validated_data.pop("settings"))
         return Game.objects.create(**validated_data, settings=settings)
 
 
@@ -108,4 +125,21 @@ class CreateStartGameSerializer(serializers.Serializer):
     def save(self):
         if "settings" not in self.validated_data:
             return None
-        return GameSettings.objects.create(**self.validated_data["settings"])
+        return self.fields["settings"].create(self.validated_data["settings"])
+
+
+class AddBotSerializer(serializers.Serializer):
+    difficulty = serializers.ChoiceField(choices=BotDifficulty.choices, default=BotDifficulty.MEDIUM)
+
+
+class PrefixHintQuerySerializer(serializers.Serializer):
+    prefix = serializers.CharField(max_length=50)
+    limit = serializers.IntegerField(min_value=0, max_value=20, default=5)
+
+
+class PrefixHintSerializer(serializers.Serializer):
+    prefix = serializers.CharField()
+    valid = serializers.BooleanField()
+    count = serializers.IntegerField()
+    is_word = serializers.BooleanField()
+    words = serializers.ListField(child=serializers.CharField())
@@ -2,18 +2,22 @@ from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from shiritori.game.events import (
+    send_game_timer_sync,
     send_game_updated,
     send_player_joined,
     send_player_left,
     send_player_updated,
     send_turn_taken,
 )
-from shiritori.game.models import Game, GameWord, Player
+from shiritori.game.models import Game, GameStatus, GameWord, Player
 
 
 @receiver(post_save, sender=Game)
-def game_post_save(sender, instance: Game, created, **kwargs):
+def game_post_save(sender, instance: Game, created, update_fields=None, **kwargs):
     send_game_updated(instance)
+    # The deadline only moves when a turn starts, which is the only time clients are told about it.
+    if instance.status == GameStatus.PLAYING and (update_fields is None or "turn_deadline" in update_fields):
+        send_game_timer_sync(instance.id, instance.turn_deadline)
 
 
 @receiver(post_save, sender=Player)
@@ -27,7 +31,7 @@ def player_post_save(sender, instance: Player, created, **kwargs):
 
 @receiver(post_delete, sender=Player)
 def player_post_delete(sender, instance: Player, **kwargs):
-    instance.game.leave(instance)
+    # Players are deleted by `Game.leave`, or along with their game, there is nothing left to recalculate.
     send_player_left(instance.game_id, instance.id)
 
 
@@ -1,20 +1,23 @@
-import time
-
-from celery import Task, shared_task
+from celery import current_app, group, shared_task
+from celery.utils import uuid
 from django.conf import settings
-from django.core.exceptions import ValidationError
-from django.db import OperationalError
-from django.db.models import Q
-
-from shiritori.game.events import (
-    send_game_start_countdown,
-    send_game_start_countdown_end,
-    send_game_start_countdown_start,
-)
+from django.utils.dateparse import parse_datetime
+
+from shiritori.game.dictionary import announce_dictionary_reload
+from shiritori.game.events import send_game_start_countdown_start
 from shiritori.game.models import Game, GameStatus, Player, Word
-from shiritori.game.utils import mock_stream_closer
 
-__all__ = ("game_worker_task", "load_dictionary_task", "player_disconnect_task", "start_game_task")
+__all__ = (
+    "load_dictionary_task",
+    "load_dictionaries_task",
+    "player_disconnect_task",
+    "schedule_player_disconnect",
+    "cancel_player_disconnect",
+    "start_game_task",
+    "schedule_game_start",
+    "finish_idle_games_task",
+    "end_correspondence_turns_task",
+)
 
 TASK_TIME_LIMIT = 60 * 60 * 24  # 24 hours
 
@@ -23,54 +26,83 @@ TASK_TIME_LIMIT = 60 * 60 * 24  # 24 hours
     time_limit=TASK_TIME_LIMIT,
     soft_time_limit=TASK_TIME_LIMIT,
     ignore_result=True,
-    bind=True,
 )
-def game_worker_task(self: Task, game_id):
-    mock_stream_closer()
-    Game.objects.filter(~Q(task_id=self.request.id), id=game_id).update(task_id=self.request.id)
-    try:
-        Game.run_turn_loop(game_id, self.request.id)
-        Game.objects.filter(id=game_id, task_id=self.request.id).update(task_id=None)
-    except ValidationError:
-        pass
-    except OperationalError:
-        self.retry(countdown=5)
+def load_dictionary_task(locale: str = "en", sync: bool = False):
+    if sync:
+        result = Word.sync_dictionary(locale)
+        if result.changed:
+            announce_dictionary_reload(locale)
+        return {
+            "status": "success",
+            "version": result.version,
+            "inserted": result.inserted,
+            "deleted": result.deleted,
+            "locale": locale,
+        }
+    result = Word.load_dictionary(locale)
+    announce_dictionary_reload(locale)
+    return {"status": "success", "word_count": result.read, "inserted": result.inserted, "locale": locale}
 
 
-@shared_task(
-    time_limit=TASK_TIME_LIMIT,
-    soft_time_limit=TASK_TIME_LIMIT,
-    ignore_result=True,
-)
-def load_dictionary_task(locale: str = "en"):
-    words = Word.load_dictionary(locale)
-    return {"status": "success", "word_count": len(words), "locale": locale}
+@shared_task(ignore_result=True)
+def load_dictionaries_task(locales: list[str], sync: bool = False):
+    """Import several locales in parallel, one task per locale."""
+    group(load_dictionary_task.s(locale, sync) for locale in locales).apply_async()
 
 
-@shared_task(
-    time_limit=TASK_TIME_LIMIT,
-    soft_time_limit=TASK_TIME_LIMIT,
-    ignore_result=True,
-)
-def player_disconnect_task(player_id: str):
-    time.sleep(5 if settings.DEBUG else 60)
-    if player := Player.objects.filter(id=player_id, is_connected=False).first():
+@shared_task(bind=True, ignore_result=True)
+def player_disconnect_task(self, player_id: str):
+    """Remove a player whose disconnect grace period is over, unless they came back in the meantime."""
+    # A job that was not revoked in time is stale once the player reconnected, its id is no longer theirs.
+    qs = Player.objects.filter(id=player_id, is_connected=False, disconnect_task_id=self.request.id)
+    if player := qs.first():
         player.leave()
 
 
-@shared_task(
-    time_limit=TASK_TIME_LIMIT,
-    soft_time_limit=TASK_TIME_LIMIT,
-    ignore_result=True,
-)
-def start_game_task(game_id: str):
-    game = Game.objects.filter(id=game_id, status=GameStatus.WAITING).first()
-    if not game:
-        return
-    send_game_start_countdown_start(game_id)
-    for timer in range(3, 0, -1):
-        send_game_start_countdown(game_id, timer)
-        time.sleep(1.25)
-    send_game_start_countdown_end(game_id)
-    game.start()
-    game_worker_task.delay(game_id)
+def schedule_player_disconnect(player_id: str) -> str:
+    """
+    Remove a disconnected player once the grace period is over, without holding a worker while waiting.
+    :param player_id: str - The id of the disconnected player.
+    :return: str - The id of the scheduled job.
+    """
+    task_id = uuid()
+    # Stored before the job is sent, so it can be cancelled as soon as it exists.
+    Player.objects.filter(id=player_id).update(disconnect_task_id=task_id)
+    player_disconnect_task.apply_async((player_id,), task_id=task_id, countdown=5 if settings.DEBUG else 60)
+    return task_id
+
+
+def cancel_player_disconnect(task_id: str) -> None:
+    """Cancel the grace period of a player that reconnected, see `schedule_player_disconnect`."""
+    current_app.control.revoke(task_id)
+
+
+@shared_task(ignore_result=True)
+def start_game_task(game_id: str, starts_at: str):
+    """Start a game once its countdown is over, unless the countdown was cancelled or started over."""
+    qs = Game.objects.filter(id=game_id, status=GameStatus.WAITING, starts_at=parse_datetime(starts_at))
+    if game := qs.first():
+        # The turn timer service picks the game up, see `shiritori.game.timers`.
+        game.start()
+
+
+def schedule_game_start(game: Game) -> None:
+    """
+    Start a game when its countdown is over, see `Game.prepare_start`.
+    Players are told when it starts once and count down themselves, no worker waits for it.
+    :param game: Game - The game to start, already prepared.
+    """
+    send_game_start_countdown_start(game.id, game.starts_at)
+    start_game_task.apply_async((game.id, game.starts_at.isoformat()), eta=game.starts_at)
+
+
+@shared_task(ignore_result=True)
+def finish_idle_games_task():
+    """Finish the games nobody came back to, run periodically by celery beat."""
+    return Game.finish_idle_games(settings.IDLE_GAME_TIMEOUT)
+
+
+@shared_task(ignore_result=True)
+def end_correspondence_turns_task():
+    """End the correspondence turns that ran out, run periodically by celery beat."""
+    return Game.end_expired_correspondence_turns()
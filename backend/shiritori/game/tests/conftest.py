@@ -14,6 +14,7 @@ from pytest_mock import MockerFixture
 from rest_framework.test import APIClient
 
 from shiritori.game.consumers import GameConsumer, GameLobbyConsumer
+from shiritori.game.dictionary import blocklist_registry, registry
 from shiritori.game.models import Game, GameSettings, GameStatus
 from shiritori.game.tests.factories import GameFactory, PlayerFactory, WordFactory
 
@@ -69,6 +70,38 @@ def sample_words():
     yield SAMPLE_WORDS
 
 
+@pytest.fixture()
+def dictionary_files(settings, tmp_path):
+    """Write word lists to a temporary dictionary directory and enable the in-memory indexes."""
+    settings.DICTIONARY_DIR = tmp_path / "dictionaries"
+    settings.DICTIONARY_INDEX_DIR = tmp_path / "index"
+    settings.DICTIONARY_INDEX_ENABLED = True
+    settings.DICTIONARY_DIR.mkdir()
+    registry.clear()
+
+    def write(words: list[str], locale: str = "en"):
+        (settings.DICTIONARY_DIR / f"{locale}.txt").write_text("\n".join(words), encoding="utf-8")
+        return settings
+
+    yield write
+    registry.clear()
+
+
+@pytest.fixture()
+def blocklist_files(settings, tmp_path):
+    """Write blocklists to a temporary directory."""
+    settings.BLOCKLIST_DIR = tmp_path / "blocklists"
+    settings.BLOCKLIST_DIR.mkdir()
+    blocklist_registry.clear()
+
+    def write(terms: list[str], locale: str = "en"):
+        (settings.BLOCKLIST_DIR / f"{locale}.txt").write_text("\n".join(terms), encoding="utf-8")
+        return settings
+
+    yield write
+    blocklist_registry.clear()
+
+
 @pytest.fixture()
 def default_game_settings():
     yield GameSettings.get_default_settings()
@@ -3,7 +3,17 @@ import random
 import factory
 from pytest_factoryboy import register
 
-from shiritori.game.models import Game, GameLocales, GameSettings, GameStatus, GameWord, Player, PlayerType, Word
+from shiritori.game.models import (
+    BotDifficulty,
+    Game,
+    GameLocales,
+    GameSettings,
+    GameStatus,
+    GameWord,
+    Player,
+    PlayerType,
+    Word,
+)
 from shiritori.utils import generate_id
 
 __all__ = (
@@ -36,6 +46,8 @@ class PlayerFactory(factory.django.DjangoModelFactory):
         )
         bot = factory.Trait(
             type=PlayerType.BOT,
+            bot_difficulty=BotDifficulty.MEDIUM,
+            session_key=None,
         )
         spectator = factory.Trait(
             type=PlayerType.SPECTATOR,
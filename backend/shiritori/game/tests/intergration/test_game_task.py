@@ -1,18 +1,69 @@
-from unittest.mock import MagicMock
+from datetime import timedelta
 
 import pytest
+from django.utils import timezone
 
-from shiritori.game.models import Game
+from shiritori.game import tasks
+from shiritori.game.models import Game, GameStatus
 
 
 @pytest.mark.django_db
-def test_game_turn_loop(mocker, started_game, sample_words):
+def test_game_turn_ticks(mocker, started_game, sample_words):
     game: Game = started_game
-    game.task_id = "test_task_id"
+    game.lease_owner = "timers:test"
+    game.turn_time_left = game.settings.turn_time
     game.save(force_update=True)
-    sleep_mock: MagicMock = mocker.patch("shiritori.game.models.game.wait", return_value=None)
-    mocker.patch("shiritori.game.events.send_game_timer_updated", return_value=None)
-    game.run_turn_loop(game_id=game.id, task_id="test_task_id")
-    game.is_finished = False
-    game.save(update_fields=["status"])
-    assert sleep_mock.call_count == game.settings.turn_time * game.max_turns
+    start, elapsed, ticks = timezone.now(), 0.0, 0
+    mocker.patch("django.utils.timezone.now", side_effect=lambda: start + timedelta(seconds=elapsed))
+    # Each tick asks to be ticked again when the turn runs out, jump the clock there instead of sleeping.
+    while (delay := Game.tick_turn(game.id, "timers:test")) is not None:
+        ticks += 1
+        assert ticks <= game.max_turns * 2, "The game never finished"
+        if not delay:
+            continue
+        assert delay == pytest.approx(game.settings.turn_time, abs=0.01)
+        elapsed += delay
+    game.refresh_from_db()
+    assert game.is_finished
+    # Every turn ran out its full time, one tick each, without the database counting it down.
+    assert elapsed == pytest.approx(game.settings.turn_time * game.current_turn, abs=0.01)
+
+
+@pytest.mark.django_db
+def test_player_disconnect_task_skips_reconnected_players(mocker, started_game):
+    mocker.patch("shiritori.game.tasks.player_disconnect_task.apply_async")
+    player = started_game.players.first()
+    player.is_connected = False
+    player.save(update_fields=["is_connected"])
+    task_id = tasks.schedule_player_disconnect(player.id)
+    # The player came back and left again, only the latest job may remove them.
+    tasks.schedule_player_disconnect(player.id)
+    tasks.player_disconnect_task.apply(args=(player.id,), task_id=task_id)
+    assert started_game.players.filter(id=player.id).exists()
+
+
+@pytest.mark.django_db
+def test_player_disconnect_task_removes_player(mocker, started_game):
+    mocker.patch("shiritori.game.tasks.player_disconnect_task.apply_async")
+    leave = mocker.patch("shiritori.game.models.Player.leave")
+    player = started_game.players.first()
+    player.is_connected = False
+    player.save(update_fields=["is_connected"])
+    task_id = tasks.schedule_player_disconnect(player.id)
+    tasks.player_disconnect_task.apply(args=(player.id,), task_id=task_id)
+    leave.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_start_game_task_skips_cancelled_countdown(mocker, unstarted_game):
+    mocker.patch("shiritori.game.events.send_game_start_countdown_cancel")
+    unstarted_game.prepare_start()
+    starts_at = unstarted_game.starts_at.isoformat()
+    unstarted_game.cancel_start()
+    tasks.start_game_task.apply(args=(unstarted_game.id, starts_at))
+    assert Game.objects.get(id=unstarted_game.id).status == GameStatus.WAITING
+    unstarted_game.prepare_start()
+    tasks.start_game_task.apply(args=(unstarted_game.id, unstarted_game.starts_at.isoformat()))
+    game = Game.objects.get(id=unstarted_game.id)
+    assert game.status == GameStatus.PLAYING
+    assert game.starts_at is None
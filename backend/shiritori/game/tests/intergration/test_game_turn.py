@@ -17,7 +17,7 @@ def test_play_game(game: Game, sample_words: list[str]) -> None:
     turn_orders = [player, player2, player, player2]
     expected_score = [(13, 0), (13, 33), (29, 33)]  # Expected score after each turn
     for index, (turn_word, turn_player) in enumerate(zip(sample_words, turn_orders)):
-        game.turn_time_left = game.settings.turn_time - 5
+        game.turn_time_left = game.settings.turn_time - 4.5
         game.take_turn(turn_player.session_key, turn_word)
         assert game.current_player == turn_orders[index + 1]
         assert game.last_word == turn_word
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from pytest_mock import MockerFixture
+
+from shiritori.game.bot import bot_think_time, choose_bot_word
+from shiritori.game.models import BotDifficulty, Game, GameStatus, PlayerType
+
+pytestmark = pytest.mark.django_db
+
+DICTIONARY_WORDS = ["tap", "taps", "tea", "team", "toothbrush", "tree", "apple", "eat", "hat"]
+
+
+@pytest.fixture
+def bot_game(started_game: Game, dictionary_files):
+    dictionary_files(DICTIONARY_WORDS)
+    started_game.settings.word_length = 3
+    started_game.settings.save()
+    started_game.turn_time_left = started_game.settings.turn_time
+    started_game.save()
+    return started_game
+
+
+def make_current_player_bot(game: Game, difficulty: str = BotDifficulty.HARD):
+    bot = game.current_player
+    bot.type = PlayerType.BOT
+    bot.bot_difficulty = difficulty
+    bot.save()
+    return bot
+
+
+def test_bot_chooses_unused_word(bot_game: Game):
+    bot_game.gameword_set.create(word="tap", player=bot_game.players.last())
+    for difficulty in BotDifficulty.values:
+        word = choose_bot_word(bot_game, difficulty)
+        if bot_think_time(difficulty, bot_game.id, bot_game.current_turn) is None:
+            assert word is None
+            continue
+        assert word in DICTIONARY_WORDS
+        assert word.startswith("t")
+        assert word != "tap"
+
+
+def test_hard_bot_prefers_rare_last_letters(bot_game: Game, mocker: MockerFixture):
+    mocker.patch("shiritori.game.bot.bot_random", return_value=random.Random(42))
+    # The hard bot leaves the next player a letter no word starts with, and the longest word among those.
+    assert choose_bot_word(bot_game, BotDifficulty.HARD) in {"taps", "team"}
+
+
+def test_bot_does_not_choose_blocked_words(bot_game: Game, blocklist_files, mocker: MockerFixture):
+    blocklist_files(["aps", "ea", "oo", "=tree"])
+    mocker.patch("shiritori.game.bot.bot_random", return_value=random.Random(42))
+    # Every word starting with the letter but "tap" is blocked.
+    assert choose_bot_word(bot_game, BotDifficulty.HARD) == "tap"
+
+
+def test_bot_without_dictionary_index(started_game: Game):
+    assert choose_bot_word(started_game, BotDifficulty.HARD) is None
+
+
+def test_bot_turn_costs_no_more_queries_than_human_turn(bot_game: Game):
+    human = bot_game.current_player
+    bot_game.refresh_from_db()
+    with CaptureQueriesContext(connection) as human_queries:
+        bot_game.take_turn(human.session_key, "tea")
+
+    bot = make_current_player_bot(bot_game)
+    bot_game.refresh_from_db()
+    with CaptureQueriesContext(connection) as bot_queries:
+        assert bot_game.play_bot_turn(bot.bot_difficulty)
+    assert len(bot_queries) <= len(human_queries)
+    assert bot_game.words.get(player=bot).word == "apple"
+    assert bot_game.current_player == human
+
+
+def test_bot_plays_after_thinking(bot_game: Game):
+    make_current_player_bot(bot_game)
+    think_time = bot_think_time(BotDifficulty.HARD, bot_game.id, bot_game.current_turn)
+    difficulty, until_ready = bot_game._bot_turn()
+    assert difficulty == BotDifficulty.HARD
+    assert until_ready > 0
+    bot_game.turn_time_left = bot_game.settings.turn_time - think_time - 0.5
+    _, until_ready = bot_game._bot_turn()
+    assert until_ready <= 0
+
+
+def test_single_player_game_with_bot_can_start(game: Game):
+    game.join("Solo")
+    game.add_bot(BotDifficulty.EASY)
+    assert Game.get_startable_game_by_id(game.id).exists()
+    assert game.status == GameStatus.WAITING
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from shiritori.game.models import BotDifficulty, Game, GameMode, GameStatus, Player
+from shiritori.game.timers import claim_games
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def correspondence_game(started_game: Game) -> Game:
+    started_game.settings.mode = GameMode.CORRESPONDENCE
+    started_game.settings.correspondence_turn_hours = 24
+    started_game.settings.save()
+    started_game.reset_turn_time()
+    started_game.save(update_fields=["turn_deadline"])
+    return started_game
+
+
+def test_correspondence_turns_last_hours(correspondence_game: Game):
+    assert correspondence_game.turn_seconds_left == pytest.approx(24 * 60 * 60, abs=5)
+
+
+def test_correspondence_games_have_no_turn_timer(correspondence_game: Game):
+    assert claim_games("timers:test") == {}
+    correspondence_game.players.update(is_connected=False)
+    assert not Game.suspend_if_idle(correspondence_game.id)
+
+
+def test_end_expired_correspondence_turns(correspondence_game: Game):
+    assert Game.end_expired_correspondence_turns() == 0
+    Game.objects.filter(id=correspondence_game.id).update(turn_deadline=timezone.now() - timedelta(seconds=1))
+    assert Game.end_expired_correspondence_turns() == 1
+    game = Game.objects.get(id=correspondence_game.id)
+    assert game.current_turn == correspondence_game.current_turn + 1
+    assert game.turn_seconds_left > 60 * 60
+    # The missed turn costs what a missed real time turn does.
+    assert game.gameword_set.get().score == pytest.approx(-0.25 * game.settings.turn_time)
+
+
+def test_bots_cannot_play_correspondence_games(unstarted_game: Game):
+    unstarted_game.add_bot(BotDifficulty.EASY)
+    unstarted_game.settings.mode = GameMode.CORRESPONDENCE
+    with pytest.raises(ValidationError, match="Bots"):
+        unstarted_game.prepare_start()
+
+
+def expire_turn(game: Game) -> None:
+    Game.objects.filter(id=game.id).update(turn_deadline=timezone.now() - timedelta(seconds=1))
+
+
+def test_offline_players_keep_their_correspondence_turns(correspondence_game: Game):
+    current, offline = correspondence_game.current_player, correspondence_game.players.exclude(is_current=True).get()
+    Player.objects.filter(id=offline.id).update(is_connected=False)
+    expire_turn(correspondence_game)
+    assert Game.end_expired_correspondence_turns() == 1
+    game = Game.objects.get(id=correspondence_game.id)
+    assert game.current_player == offline
+    expire_turn(game)
+    assert Game.end_expired_correspondence_turns() == 1
+    assert Game.objects.get(id=correspondence_game.id).current_player == current
+
+
+def test_correspondence_turns_end_with_every_player_offline(correspondence_game: Game):
+    correspondence_game.players.update(is_connected=False)
+    expire_turn(correspondence_game)
+    assert Game.end_expired_correspondence_turns() == 1
+    assert Game.objects.get(id=correspondence_game.id).current_turn == correspondence_game.current_turn + 1
+
+
+def test_failing_correspondence_game_does_not_stop_the_others(mocker, correspondence_game: Game, game_factory):
+    other = game_factory(status=GameStatus.PLAYING, with_players=2)
+    other.settings = correspondence_game.settings
+    other.save(update_fields=["settings"])
+    expire_turn(correspondence_game)
+    expire_turn(other)
+    end_turn = mocker.patch.object(Game, "end_turn", autospec=True, side_effect=[ValidationError("broken"), None])
+    assert Game.end_expired_correspondence_turns() == 1
+    assert end_turn.call_count == 2
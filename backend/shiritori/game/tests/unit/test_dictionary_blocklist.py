@@ -0,0 +1,59 @@
+import pytest
+
+from shiritori.game.dictionary import Blocklist, BlocklistRegistry, announce_blocklist_reload, get_blocklist
+
+
+@pytest.fixture
+def blocklist():
+    return Blocklist("en", "0" * 64, ["he", "she", "his", "hers", "=hell"])
+
+
+@pytest.mark.parametrize(
+    "text, term",
+    [
+        ("ushers", "she"),
+        ("ahishers", "his"),
+        ("hers", "he"),
+        ("Hell", "hell"),
+        ("hello", "he"),
+        ("h1s", "his"),
+        ("ＳＨＥ", "she"),
+        ("abc", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_blocklist_find(blocklist: Blocklist, text, term):
+    assert blocklist.find(text) == term
+
+
+def test_blocklist_exact_terms():
+    blocklist = Blocklist("en", "0" * 64, ["=ass"])
+    assert "ass" in blocklist
+    assert "class" not in blocklist
+    assert len(blocklist) == 1
+
+
+def test_blocklist_build_skips_comments(blocklist_files):
+    blocklist_files(["# blocked words", "", "darn", "=heck"])
+    blocklist = Blocklist.build("en")
+    assert len(blocklist) == 2
+    assert "darned" in blocklist
+    assert "blocked" not in blocklist
+
+
+def test_blocklist_registry_without_file(blocklist_files):
+    assert get_blocklist("en") is None
+
+
+def test_blocklist_reload(blocklist_files):
+    settings = blocklist_files(["darn"])
+    settings.DICTIONARY_RELOAD_CHECK_INTERVAL = 0
+    other_process = BlocklistRegistry()
+    old = other_process.get("en")
+    blocklist_files(["darn", "heck"])
+    announce_blocklist_reload("en", background=False)
+    assert "heck" in get_blocklist("en")
+    other_process.reload("en", background=False)
+    assert other_process.get("en") is not old
+    assert "heck" in other_process.get("en")
@@ -0,0 +1,41 @@
+import pytest
+
+from shiritori.game.dictionary import BloomFilter
+from shiritori.game.dictionary.bloom import BLOOM_HEADER, BLOOM_MAGIC
+
+DICTIONARY_WORDS = ["tap", "taps", "top", "tops", "toothbrush", "hello", "help", "apple", "éclair"]
+
+
+@pytest.fixture
+def bloom(tmp_path):
+    path = tmp_path / "en.bloom"
+    assert BloomFilter.write(DICTIONARY_WORDS + ["tap"], path) == len(DICTIONARY_WORDS)
+    instance = BloomFilter(path)
+    yield instance
+    instance.close()
+
+
+def test_bloom_filter_contains_every_word(bloom):
+    assert len(bloom) == len(DICTIONARY_WORDS)
+    for word in DICTIONARY_WORDS:
+        assert word in bloom
+    assert "" not in bloom
+    assert None not in bloom
+
+
+def test_bloom_filter_false_positive_rate(tmp_path):
+    path = tmp_path / "large.bloom"
+    words = [f"word{number}" for number in range(5000)]
+    BloomFilter.write(words, path)
+    bloom = BloomFilter(path)
+    false_positives = sum(f"other{number}" in bloom for number in range(5000))
+    assert false_positives < 5000 * 0.03
+    bloom.close()
+
+
+def test_bloom_filter_bundle_layout(bloom):
+    data = bloom.to_bytes()
+    magic, _, bit_count, hash_count, word_count = BLOOM_HEADER.unpack_from(data)
+    assert magic == BLOOM_MAGIC
+    assert (bit_count, hash_count, word_count) == (bloom.bit_count, bloom.hash_count, len(DICTIONARY_WORDS))
+    assert len(data) == BLOOM_HEADER.size + bit_count // 8
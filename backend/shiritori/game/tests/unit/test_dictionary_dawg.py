@@ -0,0 +1,69 @@
+import pytest
+
+from shiritori.game.dictionary import Dawg
+
+DICTIONARY_WORDS = ["tap", "taps", "top", "tops", "toothbrush", "hello", "help", "apple", "éclair"]
+
+
+@pytest.fixture
+def dawg(tmp_path):
+    path = tmp_path / "en.dawg"
+    assert Dawg.write(DICTIONARY_WORDS + ["tap"], path) == len(DICTIONARY_WORDS)
+    instance = Dawg(path)
+    yield instance
+    instance.close()
+
+
+def test_dawg_membership(dawg):
+    assert len(dawg) == len(DICTIONARY_WORDS)
+    for word in DICTIONARY_WORDS:
+        assert word in dawg
+    assert "ta" not in dawg
+    assert "tapss" not in dawg
+    assert "" not in dawg
+
+
+def test_dawg_is_minimal(dawg):
+    # "tap"/"top" and "taps"/"tops" share their suffix nodes
+    assert dawg.node_count < sum(len(word) for word in DICTIONARY_WORDS)
+
+
+def test_dawg_iterates_in_sorted_order(dawg):
+    assert list(dawg) == sorted(DICTIONARY_WORDS)
+
+
+def test_dawg_prefix_queries(dawg):
+    assert dawg.has_prefix("too")
+    assert not dawg.has_prefix("tx")
+    assert dawg.count_prefix("t") == 5
+    assert dawg.count_prefix("hel") == 2
+    assert dawg.count_prefix("z") == 0
+    assert list(dawg.iter_prefix("ta")) == ["tap", "taps"]
+    assert list(dawg.words_starting_with("h")) == ["hello", "help"]
+    assert list(dawg.iter_prefix("zz")) == []
+
+
+def test_dawg_word_positions(dawg):
+    for position, word in enumerate(sorted(DICTIONARY_WORDS)):
+        assert dawg.word_at(position) == word
+        assert dawg.index(word) == position
+    assert dawg.word_at(1, prefix="t") == "taps"
+    with pytest.raises(IndexError):
+        dawg.word_at(len(DICTIONARY_WORDS))
+    with pytest.raises(ValueError):
+        dawg.index("ta")
+
+
+def test_dawg_rejects_other_files(tmp_path):
+    path = tmp_path / "en.dawg"
+    path.write_bytes(b"not a dawg, not even close")
+    with pytest.raises(ValueError):
+        Dawg(path)
+
+
+def test_dawg_count_prefix_with_min_length(dawg):
+    assert dawg.count_prefix("t", min_length=4) == 3
+    assert dawg.count_prefix("t", min_length=5) == 1
+    assert dawg.count_prefix("ta", min_length=2) == 2
+    assert dawg.count_prefix("", min_length=6) == 2
+    assert dawg.count_prefix("x", min_length=4) == 0
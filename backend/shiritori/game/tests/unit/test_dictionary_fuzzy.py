@@ -0,0 +1,54 @@
+import pytest
+
+from shiritori.game.dictionary import Dawg, FuzzyIndex
+
+DICTIONARY_WORDS = ["tap", "taps", "tape", "top", "toothbrush", "hello", "help", "hero", "halo", "apple", "éclair"]
+
+
+@pytest.fixture
+def dawg(tmp_path):
+    path = tmp_path / "en.dawg"
+    Dawg.write(DICTIONARY_WORDS, path)
+    instance = Dawg(path)
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def fuzzy(tmp_path):
+    path = tmp_path / "en.fuzzy"
+    assert FuzzyIndex.write(DICTIONARY_WORDS + ["tap"], path) > len(DICTIONARY_WORDS)
+    instance = FuzzyIndex(path)
+    yield instance
+    instance.close()
+
+
+@pytest.mark.parametrize(
+    "typo,expected",
+    [
+        ("tpa", ["tap"]),  # transposition
+        ("tip", ["tap", "top"]),  # substitution
+        ("tapss", ["taps"]),  # insertion
+        ("toothbrsh", ["toothbrush"]),  # deletion
+        ("eclair", ["éclair"]),
+        ("xyz", []),
+    ],
+)
+def test_fuzzy_suggestions(fuzzy, dawg, typo, expected):
+    assert fuzzy.suggest(typo, dawg) == expected
+
+
+def test_fuzzy_suggestions_rank_by_edit(fuzzy, dawg):
+    assert fuzzy.suggest("tapx", dawg) == ["tap", "tape", "taps"]
+    assert fuzzy.suggest("tapx", dawg, limit=1) == ["tap"]
+    # A doubled letter typed once is a likelier typo than a wrong letter.
+    assert fuzzy.suggest("helo", dawg) == ["hello", "halo", "help"]
+
+
+def test_fuzzy_suggestions_filter(fuzzy, dawg):
+    assert fuzzy.suggest("tapx", dawg, accept=lambda word: word != "tap") == ["tape", "taps"]
+
+
+def test_fuzzy_does_not_suggest_the_word_itself(fuzzy, dawg):
+    assert "help" not in fuzzy.suggest("help", dawg)
+    assert fuzzy.suggest("help", dawg) == []
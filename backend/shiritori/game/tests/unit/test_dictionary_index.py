@@ -0,0 +1,48 @@
+import pytest
+
+from shiritori.game.dictionary import WordIndex, get_word_index
+from shiritori.game.models import Word
+
+pytestmark = pytest.mark.django_db
+
+DICTIONARY_WORDS = ["toothbrush", "hello", "test", "apple", "éclair"]
+
+
+@pytest.fixture
+def word_index(tmp_path):
+    path = tmp_path / "en.idx"
+    assert WordIndex.write(DICTIONARY_WORDS + ["test"], path) == len(DICTIONARY_WORDS)
+    index = WordIndex(path)
+    yield index
+    index.close()
+
+
+def test_word_index_lookup(word_index):
+    assert len(word_index) == len(DICTIONARY_WORDS)
+    assert list(word_index) == sorted(DICTIONARY_WORDS, key=lambda word: word.encode("utf-8"))
+    for word in DICTIONARY_WORDS:
+        assert word in word_index
+    assert "tes" not in word_index
+    assert "zebra" not in word_index
+    assert "" not in word_index
+
+
+def test_word_index_rejects_other_files(tmp_path):
+    path = tmp_path / "en.idx"
+    path.write_bytes(b"not an index at all")
+    with pytest.raises(ValueError):
+        WordIndex(path)
+
+
+def test_word_validate_uses_index(dictionary_files, django_assert_num_queries):
+    dictionary_files(DICTIONARY_WORDS)
+    assert get_word_index("en") is not None
+    with django_assert_num_queries(0):
+        assert Word.validate("Hello") is True
+        assert Word.validate("invalid") is False
+
+
+def test_word_validate_falls_back_to_database(dictionary_files, sample_words):
+    dictionary_files(DICTIONARY_WORDS).DICTIONARY_INDEX_ENABLED = False
+    assert Word.validate("hello") is True
+    assert Word.validate("apple") is False
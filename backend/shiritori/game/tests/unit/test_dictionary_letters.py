@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from shiritori.game.dictionary import LetterIndex, get_letter_index
+from shiritori.game.utils import generate_random_letter
+
+DICTIONARY_WORDS = ["tap", "taps", "top", "toothbrush", "hello", "help", "apple", "éclair"]
+
+
+@pytest.fixture
+def letters(tmp_path):
+    path = tmp_path / "en.letters"
+    assert LetterIndex.write(DICTIONARY_WORDS + ["tap"], path) == len(DICTIONARY_WORDS)
+    yield LetterIndex(path)
+
+
+def test_letter_counts(letters):
+    assert len(letters) == len(DICTIONARY_WORDS)
+    assert letters.count("t") == 4
+    assert letters.count("t", min_length=4) == 2
+    assert letters.count("é") == 1
+    assert letters.count("z") == 0
+    assert "r" not in letters
+    assert letters.count("r") == 0
+
+
+def test_remaining_words(letters):
+    assert letters.remaining("t", ["tap", None, "hello", "tap"]) == 3
+    assert letters.remaining("t", ["tap", "toothbrush"], min_length=4) == 1
+    assert letters.remaining("h", ["hello", "help"]) == 0
+
+
+def test_random_letter_is_weighted(letters):
+    rng = random.Random(42)
+    picks = {letters.random_letter(rng=rng) for _ in range(200)}
+    assert picks <= {"t", "h", "a", "é"}
+    assert letters.random_letter(min_length=6, rng=rng) in {"t", "é"}
+    assert letters.random_letter(min_length=20) is None
+
+
+def test_generate_random_letter_uses_index(dictionary_files):
+    dictionary_files(["queen", "quiet"])
+    assert get_letter_index("en").count("q") == 2
+    assert generate_random_letter("en") == "q"
+    assert generate_random_letter("en", min_length=6) in "abcdefghijklmnopqrstuvwxyz"
@@ -0,0 +1,90 @@
+import gzip
+import lzma
+
+import pytest
+
+from shiritori.game.models import DictionaryVersion, Word
+from shiritori.game.models.word import WordCopyStream
+
+pytestmark = pytest.mark.django_db
+
+DICTIONARY_WORDS = ["apple", "Banana", "cherry", "", "apple"]
+
+
+@pytest.fixture
+def dictionary_dir(settings, tmp_path):
+    settings.DICTIONARY_DIR = tmp_path
+    yield tmp_path
+
+
+def test_load_dictionary_returns_counts(dictionary_dir):
+    (dictionary_dir / "en.txt").write_text("\n".join(DICTIONARY_WORDS), encoding="utf-8")
+    result = Word.load_dictionary("en")
+    assert result.locale == "en"
+    assert result.read == 4
+    assert result.inserted == 3
+    assert set(Word.objects.filter(locale="en").values_list("word", flat=True)) == {"apple", "banana", "cherry"}
+
+
+def test_load_dictionary_twice_inserts_nothing(dictionary_dir):
+    (dictionary_dir / "en.txt").write_text("\n".join(DICTIONARY_WORDS), encoding="utf-8")
+    Word.load_dictionary("en")
+    assert Word.load_dictionary("en").inserted == 0
+
+
+@pytest.mark.parametrize("extension, opener", [(".txt.gz", gzip.open), (".txt.xz", lzma.open)])
+def test_load_compressed_dictionary(dictionary_dir, extension, opener):
+    with opener(dictionary_dir / f"en{extension}", "wt", encoding="utf-8") as f:
+        f.write("\n".join(DICTIONARY_WORDS))
+    assert Word.load_dictionary("en").inserted == 3
+
+
+def test_word_copy_stream_escapes_and_buffers():
+    stream = WordCopyStream(["apple", "back\\slash", "tab\tbed"])
+    data = ""
+    while chunk := stream.read(4):
+        assert len(chunk) <= 4
+        data += chunk
+    assert data == "apple\nback\\\\slash\ntab\\tbed\n"
+    assert stream.count == 3
+
+
+def test_sync_dictionary_creates_version(dictionary_dir):
+    (dictionary_dir / "en.txt").write_text("\n".join(DICTIONARY_WORDS), encoding="utf-8")
+    result = Word.sync_dictionary("en")
+    assert result.changed is True
+    assert result.version == 1
+    assert result.inserted == 3
+    assert result.deleted == 0
+    version = DictionaryVersion.objects.get(locale="en")
+    assert version.word_count == 3
+    assert len(version.checksum) == 64
+
+
+def test_sync_unchanged_dictionary_is_noop(dictionary_dir, django_assert_num_queries):
+    (dictionary_dir / "en.txt").write_text("\n".join(DICTIONARY_WORDS), encoding="utf-8")
+    Word.sync_dictionary("en")
+    with django_assert_num_queries(1):
+        result = Word.sync_dictionary("en")
+    assert result.changed is False
+    assert result.version == 1
+
+
+def test_sync_dictionary_applies_only_differences(dictionary_dir):
+    (dictionary_dir / "en.txt").write_text("apple\nbanana\ncherry", encoding="utf-8")
+    Word.sync_dictionary("en")
+    banana_id = Word.objects.get(word="banana").id
+    (dictionary_dir / "en.txt").write_text("banana\ncherry\ndate", encoding="utf-8")
+    result = Word.sync_dictionary("en")
+    assert (result.version, result.inserted, result.deleted) == (2, 1, 1)
+    assert set(Word.objects.filter(locale="en").values_list("word", flat=True)) == {"banana", "cherry", "date"}
+    # Unchanged rows are left alone
+    assert Word.objects.get(word="banana").id == banana_id
+    assert DictionaryVersion.objects.get(locale="en").word_count == 3
+
+
+def test_sync_dictionary_removes_words_loaded_earlier(dictionary_dir, sample_words):
+    (dictionary_dir / "en.txt").write_text("apple", encoding="utf-8")
+    result = Word.sync_dictionary("en")
+    assert result.deleted == len(sample_words)
+    assert list(Word.objects.values_list("word", flat=True)) == ["apple"]
@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+from shiritori.game.dictionary import (
+    DictionaryRegistry,
+    announce_dictionary_reload,
+    get_dawg,
+    get_dictionary,
+    get_index_path,
+    registry,
+)
+
+
+def test_registry_loads_dictionary(dictionary_files):
+    dictionary_files(["apple", "banana"])
+    dictionary = get_dictionary("en")
+    assert dictionary is not None
+    assert get_dictionary("en") is dictionary
+    assert "apple" in dictionary.index
+    assert get_dawg("en").count_prefix("b") == 1
+    assert get_index_path("en", f"{dictionary.version}.idx").exists()
+    assert get_index_path("en", f"{dictionary.version}.dawg").exists()
+    assert get_index_path("en", f"{dictionary.version}.letters").exists()
+
+
+def test_registry_without_dictionary(dictionary_files):
+    assert get_dictionary("xx") is None
+
+
+def test_registry_disabled(dictionary_files):
+    dictionary_files(["apple"]).DICTIONARY_INDEX_ENABLED = False
+    assert get_dictionary("en") is None
+
+
+def test_registry_reuses_files_built_by_other_processes(dictionary_files):
+    dictionary_files(["apple"])
+    first = DictionaryRegistry().get("en")
+    second = DictionaryRegistry().get("en")
+    assert first is not second
+    assert first.index.path == second.index.path
+
+
+def test_reload_swaps_new_version(dictionary_files):
+    dictionary_files(["apple"])
+    old = get_dictionary("en")
+    dictionary_files(["apple", "cherry"])
+    registry.reload("en", background=False)
+    new = get_dictionary("en")
+    assert new is not old
+    assert "cherry" in new.index
+    # The old version stays usable for lookups that already hold it
+    assert "apple" in old.index
+    assert not get_index_path("en", f"{old.version}.idx").exists()
+
+
+def test_reload_of_unchanged_dictionary_keeps_it(dictionary_files):
+    dictionary_files(["apple"])
+    dictionary = get_dictionary("en")
+    registry.reload("en", background=False)
+    assert get_dictionary("en") is dictionary
+
+
+@pytest.mark.parametrize("interval, reloaded", [(0, True), (60, False)])
+def test_announcements_are_picked_up(dictionary_files, interval, reloaded):
+    settings = dictionary_files(["apple"])
+    settings.DICTIONARY_RELOAD_CHECK_INTERVAL = interval
+    other_process = DictionaryRegistry()
+    old = other_process.get("en")
+    dictionary_files(["apple", "cherry"])
+    announce_dictionary_reload("en")
+    other_process.get("en")
+    for thread in threading.enumerate():
+        if thread.name.startswith("dictionary-reload-"):
+            thread.join()
+    assert (other_process.get("en") is not old) is reloaded
+
+
+def test_announce_reloads_on_the_calling_thread(dictionary_files):
+    dictionary_files(["apple"])
+    old = get_dictionary("en")
+    dictionary_files(["apple", "cherry"])
+    # Commands exit right after announcing, the new version must be built by then.
+    announce_dictionary_reload("en", background=False)
+    assert get_dictionary("en") is not old
+    assert "cherry" in get_dictionary("en").index
+
+
+def test_first_lookup_builds_in_the_background(dictionary_files, mocker):
+    settings = dictionary_files(["apple"])
+    settings.DICTIONARY_BACKGROUND_LOAD = True
+    building, done = threading.Event(), threading.Event()
+    build = registry.build
+
+    def slow_build(locale, checksum):
+        building.set()
+        done.wait(timeout=5)
+        return build(locale, checksum)
+
+    mocker.patch.object(registry, "build", side_effect=slow_build)
+    # Lookups fall back to the database while the build runs, other locales are not held up by it.
+    assert get_dictionary("en") is None
+    assert building.wait(timeout=5)
+    assert get_dictionary("en") is None
+    assert get_dictionary("xx") is None
+    done.set()
+    for thread in threading.enumerate():
+        if thread.name.startswith("dictionary-reload-"):
+            thread.join()
+    assert "apple" in get_dictionary("en").index
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
+from rest_framework.test import APIClient
+
+from shiritori.game.dictionary import BloomFilter, registry
+
+pytestmark = pytest.mark.django_db
+
+
+def read_ndjson(response: StreamingHttpResponse) -> list[dict]:
+    assert response.is_async
+
+    async def read() -> bytes:
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    return [json.loads(line) for line in async_to_sync(read)().decode().splitlines()]
+
+
+def test_dictionary_bundle_view(drf: APIClient, dictionary_files, tmp_path):
+    dictionary_files(["apple", "banana"])
+    response = drf.get("/api/dictionary/en/bundle/")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/octet-stream"
+    assert "max-age" in response["Cache-Control"]
+
+    path = tmp_path / "downloaded.bloom"
+    path.write_bytes(response.content)
+    bloom = BloomFilter(path)
+    assert "apple" in bloom
+    assert len(bloom) == 2
+    bloom.close()
+
+
+def test_dictionary_bundle_view_not_modified(drf: APIClient, dictionary_files):
+    dictionary_files(["apple"])
+    etag = drf.get("/api/dictionary/en/bundle/")["ETag"]
+    response = drf.get("/api/dictionary/en/bundle/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert not response.content
+
+
+def test_dictionary_bundle_view_changes_on_reload(drf: APIClient, dictionary_files):
+    dictionary_files(["apple"])
+    etag = drf.get("/api/dictionary/en/bundle/")["ETag"]
+    dictionary_files(["apple", "cherry"])
+    registry.reload("en", background=False)
+    response = drf.get("/api/dictionary/en/bundle/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_dictionary_bundle_view_unknown_locale(drf: APIClient, dictionary_files):
+    assert drf.get("/api/dictionary/xx/bundle/").status_code == 404
+    assert drf.get("/api/dictionary/en/bundle/").status_code == 404
+
+
+@pytest.fixture
+def tooling(drf: APIClient, settings) -> APIClient:
+    drf.credentials(HTTP_X_DICTIONARY_KEY=settings.LOAD_DICTIONARY_KEY)
+    return drf
+
+
+def test_dictionary_validate_view(tooling: APIClient, dictionary_files):
+    dictionary_files(["apple", "banana"])
+    response = tooling.post("/api/dictionary/en/validate/", "Apple\ncherry\n\nbanana\n", content_type="text/plain")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert read_ndjson(response) == [
+        {"word": "Apple", "valid": True},
+        {"word": "cherry", "valid": False},
+        {"word": "banana", "valid": True},
+    ]
+
+
+def test_dictionary_validate_view_without_index(tooling: APIClient, sample_words):
+    response = tooling.post("/api/dictionary/en/validate/", "hello\nnope", content_type="text/plain")
+    assert [line["valid"] for line in read_ndjson(response)] == [True, False]
+    assert tooling.post("/api/dictionary/xx/validate/", "hello", content_type="text/plain").status_code == 404
+
+
+def test_dictionary_validate_view_requires_staff_or_key(drf: APIClient, sample_words):
+    assert drf.post("/api/dictionary/en/validate/", "hello", content_type="text/plain").status_code == 403
+    drf.credentials(HTTP_X_DICTIONARY_KEY="wrong")
+    assert drf.post("/api/dictionary/en/validate/", "hello", content_type="text/plain").status_code == 403
+    drf.credentials()
+    drf.force_authenticate(get_user_model().objects.create_user("moderator", is_staff=True))
+    response = drf.post("/api/dictionary/en/validate/", "hello", content_type="text/plain")
+    assert read_ndjson(response) == [{"word": "hello", "valid": True}]
+
+
+def test_dictionary_validate_view_limits_the_body(tooling: APIClient, sample_words, settings):
+    settings.BULK_VALIDATE_MAX_BYTES = 32
+    settings.BULK_VALIDATE_MAX_WORDS = 2
+    response = tooling.post("/api/dictionary/en/validate/", "hello\n" * 4, content_type="text/plain")
+    assert [line["word"] for line in read_ndjson(response)] == ["hello", "hello"]
+    response = tooling.post("/api/dictionary/en/validate/", "hello\n" * 10, content_type="text/plain")
+    assert response.status_code == 413
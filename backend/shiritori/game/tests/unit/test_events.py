@@ -5,7 +5,7 @@ import pytest_asyncio
 from asgiref.sync import sync_to_async
 
 from shiritori.game.events import (
-    send_game_timer_updated,
+    send_game_timer_sync,
     send_game_updated,
     send_lobby_update,
     send_player_joined,
@@ -46,14 +46,13 @@ async def test_send_game_updated(event_consumer):
     assert data["type"] == "game_updated"
 
 
-async def test_send_game_timer_updated(event_consumer):
+async def test_send_game_timer_sync(event_consumer):
     consumer, game, player_1 = event_consumer
-    await sync_to_async(send_game_timer_updated)(game.id, 10)
+    game.turn_time_left = 10
+    await sync_to_async(send_game_timer_sync)(game.id, game.turn_deadline)
     data = await consumer.receive_json_from()
-    assert data == {
-        "type": "game_timer_updated",
-        "data": 10,
-    }
+    assert data["type"] == "game_timer_sync"
+    assert data["data"]["turnDeadline"] - data["data"]["serverTime"] == pytest.approx(10_000, abs=1_000)
 
 
 async def test_send_player_joined(event_consumer):
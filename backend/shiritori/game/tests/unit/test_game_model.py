@@ -13,8 +13,9 @@ def test_create_game(un_saved_game):
     assert un_saved_game.settings is not None
 
 
-def test_join_game(game, player):
-    game.join(player)
+def test_join_game(game, player, django_assert_num_queries):
+    with django_assert_num_queries(3):
+        game.join(player)
     assert game.player_count == 1
     assert game.players.count() == 1
     assert game.host == player
@@ -35,9 +36,10 @@ def test_join_started_game(started_game):
         started_game.join("John")
 
 
-def test_leave_game(game, player):
+def test_leave_game(game, player, django_assert_num_queries):
     game.join(player)
-    game.leave(player)
+    with django_assert_num_queries(9):
+        game.leave(player)
     assert game.id is None  # Instance is deleted
 
 
@@ -47,11 +49,12 @@ def test_leave_game_by_session_key(game, player):
     assert game.id is None  # Instance is deleted
 
 
-def test_host_leaving_properly_deletes_and_recalculates(started_game):
+def test_host_leaving_properly_deletes_and_recalculates(started_game, django_assert_num_queries):
     player = started_game.players.first()
     player2 = started_game.players.last()
     player.delete()
-    started_game.leave(player)
+    with django_assert_num_queries(6):
+        started_game.leave(player, was_deleted=True)
     assert started_game.host == player2
     assert started_game.player_count == 1
     assert started_game.players.first() == player2
@@ -65,11 +68,13 @@ def test_start_game_with_one_player(game, player):
         game.prepare_start()
 
 
-def test_start_game_with_two_players(game, player, human_player_2):
+def test_start_game_with_two_players(game, player, human_player_2, django_assert_num_queries):
     game.join(player)
     game.join(human_player_2)
-    game.prepare_start()
-    game.start()
+    with django_assert_num_queries(7):
+        game.prepare_start()
+    with django_assert_num_queries(1):
+        game.start()
     assert game.status == GameStatus.PLAYING
     assert game.current_player == player
     assert game.current_turn == 0
@@ -81,6 +86,25 @@ def test_start_started_game(started_game):
         started_game.prepare_start()
 
 
+def test_start_starting_game(game, player, human_player_2):
+    game.join(player)
+    game.join(human_player_2)
+    game.prepare_start()
+    assert game.starts_at is not None
+    with pytest.raises(ValidationError):
+        game.prepare_start()
+
+
+def test_leaving_cancels_start(mocker, game, player, human_player_2):
+    cancel = mocker.patch("shiritori.game.events.send_game_start_countdown_cancel")
+    game.join(player)
+    game.join(human_player_2)
+    game.prepare_start()
+    game.leave(human_player_2)
+    assert Game.objects.get(id=game.id).starts_at is None
+    cancel.assert_called_once_with(game.id)
+
+
 def test_calculate_current_player(game, player, human_player_2):
     game.join(player)
     game.join(human_player_2)
@@ -221,8 +245,9 @@ def test_skip_turn_updates_current_player_and_turn(started_game):
     assert started_game.current_player == next_player
 
 
-def test_restart_game(started_game):
-    started_game.restart()
+def test_restart_game(started_game, django_assert_num_queries):
+    with django_assert_num_queries(3):
+        started_game.restart()
     assert started_game.status == GameStatus.WAITING
     assert started_game.current_turn == 0
     assert started_game.current_player is None
@@ -245,10 +270,11 @@ def test_max_turns_calculation(started_game, player_factory):
 
 
 @pytest.mark.real_shuffle
-def test_shuffle_player_order(started_game):
+def test_shuffle_player_order(started_game, django_assert_num_queries):
     started_game.status = GameStatus.WAITING
     first_player, next_player = started_game.players
-    started_game.shuffle_player_order()
+    with django_assert_num_queries(4):
+        started_game.shuffle_player_order()
     started_game.status = GameStatus.PLAYING
     assert started_game.players.first() == next_player
     assert started_game.players.last() == first_player
@@ -276,10 +302,26 @@ def test_shuffle_player_order_with_less_than_two_players(game_factory, player_fa
         game.shuffle_player_order()
 
 
-def test_player_delete_updates_current_player(started_game):
+@pytest.mark.parametrize("player_count", [2, 6])
+def test_lifecycle_queries_do_not_grow_with_players(game_factory, player_count, django_assert_num_queries):
+    game = game_factory(status=GameStatus.WAITING, with_players=player_count)
+    with django_assert_num_queries(3):
+        game.join("John")
+    with django_assert_num_queries(7):
+        game.prepare_start()
+    game.start()
+    player = game.players.last()
+    with django_assert_num_queries(9):
+        game.leave(player)
+    with django_assert_num_queries(3):
+        game.restart()
+
+
+def test_player_delete_updates_current_player(started_game, django_assert_num_queries):
     first_player, next_player = started_game.players
     started_game.current_player = next_player
-    started_game.leave(first_player)
+    with django_assert_num_queries(8):
+        started_game.leave(first_player)
     assert started_game.current_player == next_player
     assert started_game.players.count() == 1
     assert started_game.players.first() == next_player
@@ -287,7 +329,7 @@ def test_player_delete_updates_current_player(started_game):
 
 def test_used_letters_returns_empty_list_when_no_words(started_game):
     # assert an empty queryset is returned
-    assert started_game.used_letters.exists() is False
+    assert started_game.used_letters == []
 
 
 def test_used_letters_returns_list_of_used_letters(started_game, sample_words):
@@ -296,3 +338,83 @@ def test_used_letters_returns_list_of_used_letters(started_game, sample_words):
     started_game.take_turn(session_key, sample_words[0])
     assert "t" in started_game.used_letters
     assert list(started_game.used_letters) == ["t"]
+
+
+def test_take_turn_finishes_game_on_dead_end(started_game: Game, dictionary_files):
+    dictionary_files(["test", "toothbrush"])
+    started_game.turn_time_left = 10
+    started_game.take_turn(started_game.current_player.session_key, "test")
+    assert started_game.remaining_word_count == 1
+    assert started_game.status == GameStatus.PLAYING
+    started_game.turn_time_left = 10
+    started_game.take_turn(started_game.current_player.session_key, "toothbrush")
+    assert started_game.is_dead_end
+    assert started_game.status == GameStatus.FINISHED
+
+
+def test_remaining_word_count_without_index(started_game: Game):
+    assert started_game.remaining_word_count is None
+    assert not started_game.is_dead_end
+
+
+def test_take_turn_with_typo_suggests_words(started_game: Game, dictionary_files):
+    dictionary_files(["test", "text", "toothbrush"])
+    started_game.settings.word_length = 3
+    started_game.turn_time_left = 10
+    started_game.gameword_set.create(word="text")
+    with pytest.raises(ValidationError) as error:
+        started_game.take_turn(started_game.current_player.session_key, "tezt")
+    assert error.value.code == "not_in_dictionary"
+    assert error.value.params["suggestions"] == ["test"]
+
+
+def test_join_game_with_blocked_name(game, blocklist_files):
+    blocklist_files(["heck"])
+    with pytest.raises(ValidationError, match="Name is not allowed."):
+        game.join("H3ckler")
+    assert game.join("Hello").name == "Hello"
+
+
+def test_take_turn_with_blocked_word(started_game: Game, dictionary_files, blocklist_files):
+    dictionary_files(["test", "text", "toothbrush"])
+    blocklist_files(["=test"])
+    started_game.settings.word_length = 3
+    started_game.turn_time_left = 10
+    with pytest.raises(ValidationError) as error:
+        started_game.take_turn(started_game.current_player.session_key, "test")
+    assert error.value.code == "blocked"
+    with pytest.raises(ValidationError) as error:
+        started_game.take_turn(started_game.current_player.session_key, "tezt")
+    assert error.value.params["suggestions"] == ["text"]
+
+
+def test_suspend_idle_game(started_game):
+    started_game.players.update(is_connected=False)
+    assert Game.suspend_if_idle(started_game.id)
+    started_game.refresh_from_db()
+    assert started_game.suspended_at is not None
+    assert started_game.lease_owner is None
+    assert not Game.suspend_if_idle(started_game.id)
+
+
+def test_connected_game_is_not_suspended(started_game):
+    started_game.players.filter(id=started_game.host.id).update(is_connected=False)
+    assert not Game.suspend_if_idle(started_game.id)
+
+
+def test_resume_suspended_game(started_game):
+    started_game.players.update(is_connected=False)
+    Game.suspend_if_idle(started_game.id)
+    started_game.refresh_from_db()
+    assert started_game.resume()
+    assert started_game.suspended_at is None
+    assert started_game.turn_time_left == started_game.settings.turn_time
+    assert not started_game.resume()
+
+
+def test_finish_idle_games(started_game):
+    started_game.players.update(is_connected=False)
+    Game.suspend_if_idle(started_game.id)
+    assert Game.finish_idle_games(60) == 0
+    assert Game.finish_idle_games(0) == 1
+    assert Game.objects.get(id=started_game.id).is_finished
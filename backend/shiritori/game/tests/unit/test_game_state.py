@@ -0,0 +1,66 @@
+import pytest
+
+from shiritori.game.converters import convert_game_to_json
+from shiritori.game.models import Game, GameWord
+
+pytestmark = pytest.mark.django_db
+
+
+def fetch_game(game: Game) -> Game:
+    return Game.objects.select_related("settings").get(pk=game.pk)
+
+
+def test_state_loads_in_two_queries(finished_game: Game, django_assert_num_queries):
+    game = fetch_game(finished_game)
+    with django_assert_num_queries(2):
+        state = game.state
+    with django_assert_num_queries(0):
+        assert state.player_count == 2
+        assert state.word_count == 3
+        assert state.host is not None
+        assert state.winner is not None
+        assert state.longest_word.word == "toothbrush"
+        assert state.used_letters == ["h", "o", "t"]
+        assert state.max_turns == game.settings.max_turns * 2
+        assert state.leaderboard[0].total_score >= state.leaderboard[1].total_score
+
+
+def test_state_matches_game(finished_game: Game):
+    game = fetch_game(finished_game)
+    state = game.state
+    assert state.host == game.host
+    assert state.winner == game.winner
+    assert state.longest_word.id == game.longest_word.id
+    assert state.used_letters == list(game.used_letters)
+    assert state.max_turns == game.max_turns
+    assert [player.score for player in state.players] == [player.score for player in game.players]
+
+
+def test_serializing_game_does_not_grow_with_words(finished_game: Game, django_assert_num_queries):
+    # The game with its settings, the snapshot and the settings' word lists.
+    with django_assert_num_queries(4):
+        convert_game_to_json(fetch_game(finished_game))
+    for word in ("otter", "rabbit", "tiger"):
+        GameWord.objects.create(game=finished_game, player=finished_game.players.first(), word=word, score=5)
+    with django_assert_num_queries(4):
+        data = convert_game_to_json(fetch_game(finished_game))
+    assert data["word_count"] == 6
+
+
+def test_take_turn_updates_state(started_game: Game, sample_words, django_assert_num_queries):
+    started_game.turn_time_left = 10
+    player = started_game.current_player
+    started_game.take_turn(player.session_key, sample_words[0])
+    score = started_game.words.get().score
+    with django_assert_num_queries(0):
+        assert started_game.state.word_count == 1
+        assert started_game.state.used_letters == ["t"]
+        assert started_game.state.current_player != player
+        assert started_game.state.get_player(player.id).total_score == score
+
+
+def test_state_is_dropped_when_player_joins(game: Game):
+    assert game.state.player_count == 0
+    game.join("John")
+    assert game.state.player_count == 1
+    assert game.state.host.name == "John"
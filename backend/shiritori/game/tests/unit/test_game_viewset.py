@@ -1,16 +1,19 @@
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
+from pytest_mock import MockerFixture
 from rest_framework.test import APIClient
+from rest_framework.throttling import ScopedRateThrottle
 
-from shiritori.game.models import Game, GameStatus, Player
+from shiritori.game.models import BotDifficulty, Game, GameStatus, Player, PlayerType, WordList
 
 pytestmark = pytest.mark.django_db
 
 
 @pytest.fixture(scope="module", autouse=True)
 def mock_game_worker_task():
-    with patch("shiritori.game.tasks.start_game_task") as mock:
+    with patch("shiritori.game.views.game.schedule_game_start") as mock:
         yield mock
 
 
@@ -26,6 +29,18 @@ def test_game_create_view(drf: APIClient, default_game_settings):
     assert response.data["id"] is not None
 
 
+def test_game_create_view_with_word_lists(drf: APIClient, default_game_settings):
+    WordList.objects.create(name="house-rules")
+    WordList.objects.create(name="hausregeln", locale="de")
+    settings = {**default_game_settings, "word_lists": ["house-rules"]}
+    response = drf.post("/api/game/", {"settings": settings}, format="json")
+    assert response.status_code == 201
+    assert response.data["settings"]["word_lists"] == ["house-rules"]
+    settings["word_lists"] = ["hausregeln"]
+    response = drf.post("/api/game/", {"settings": settings}, format="json")
+    assert response.status_code == 400
+
+
 def test_join_game_view(drf: APIClient, game: Game):
     assert game.player_count == 0
 
@@ -56,7 +71,7 @@ def test_leave_game_view(drf: APIClient, game: Game, player: Player):
 
 def test_take_turn_game_view(drf: APIClient, started_game: Game, sample_words: list[str]):
     game = started_game
-    game.turn_time_left = game.settings.turn_time - 5
+    game.turn_time_left = game.settings.turn_time - 4.5
     game.save()
     player = game.players.first()
     player2 = game.players.last()
@@ -169,6 +184,9 @@ def test_get_game_view(drf: APIClient, finished_game: Game):
             "word_length": game.settings.word_length,
             "turn_time": game.settings.turn_time,
             "max_turns": game.settings.max_turns,
+            "word_lists": [],
+            "mode": game.settings.mode,
+            "correspondence_turn_hours": game.settings.correspondence_turn_hours,
         },
         "player_count": game.player_count,
         "word_count": game.word_count,
@@ -180,6 +198,9 @@ def test_get_game_view(drf: APIClient, finished_game: Game):
         "current_round": game.current_round,
         "max_turns": game.max_turns,
         "turn_time_left": game.turn_time_left,
+        "turn_deadline": game.turn_deadline,
+        "starts_at": game.starts_at,
+        "suspended_at": game.suspended_at,
         "players": [
             {
                 "id": player.id,
@@ -224,3 +245,90 @@ def test_restart_game_as_non_host(drf: APIClient, finished_game: Game):
     assert response.status_code == 400
     game.refresh_from_db()
     assert game.status == GameStatus.FINISHED
+
+
+def test_add_bot(drf: APIClient, unstarted_game: Game):
+    host = unstarted_game.host
+    host.session_key = drf.session.session_key
+    host.save()
+    response = drf.post(f"/api/game/{unstarted_game.id}/add-bot/", {"difficulty": "EASY"}, format="json")
+    assert response.status_code == 201
+    bot = unstarted_game.player_set.get(id=response.data["id"])
+    assert bot.type == PlayerType.BOT
+    assert bot.is_bot
+    assert bot.name == "EasyBot1"
+    assert unstarted_game.add_bot(BotDifficulty.EASY).name == "EasyBot2"
+
+
+def test_add_bot_requires_host(drf: APIClient, unstarted_game: Game):
+    drf.session._set_session_key(unstarted_game.players.exclude(is_host=True).first().session_key)
+    response = drf.post(f"/api/game/{unstarted_game.id}/add-bot/", format="json")
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def prefix_game(started_game: Game, dictionary_files):
+    dictionary_files(["tap", "taps", "tea", "team", "toothbrush", "to", "apple"])
+    started_game.settings.word_length = 3
+    started_game.settings.save()
+    started_game.gameword_set.create(word="tea")
+    cache.clear()
+    return started_game
+
+
+def test_prefix_hint_view(drf: APIClient, prefix_game: Game):
+    response = drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "Te"})
+    assert response.status_code == 200
+    assert response.data == {"prefix": "te", "valid": True, "count": 1, "is_word": False, "words": ["team"]}
+
+    response = drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "ta", "limit": 1})
+    assert response.data == {"prefix": "ta", "valid": True, "count": 2, "is_word": False, "words": ["tap"]}
+
+
+def test_prefix_hint_view_excludes_used_and_short_words(drf: APIClient, prefix_game: Game):
+    response = drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "tea"})
+    assert response.data["is_word"] is False
+    assert response.data["count"] == 1
+    response = drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "to"})
+    assert response.data["words"] == ["toothbrush"]
+    assert response.data["is_word"] is False
+
+
+def test_prefix_hint_view_excludes_blocked_words(drf: APIClient, prefix_game: Game, blocklist_files):
+    blocklist_files(["=team", "aps"])
+    response = drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "t"})
+    assert response.data["count"] == 2
+    assert response.data["words"] == ["tap", "toothbrush"]
+    response = drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "team"})
+    assert response.data["is_word"] is False
+    assert response.data["count"] == 0
+
+
+def test_prefix_hint_view_requires_last_letter(drf: APIClient, prefix_game: Game):
+    response = drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "ap"})
+    assert response.data["valid"] is False
+    assert response.data["words"] == []
+
+
+def test_prefix_hint_view_without_index(drf: APIClient, started_game: Game):
+    response = drf.get(f"/api/game/{started_game.id}/prefix/", {"prefix": "t"})
+    assert response.status_code == 503
+
+
+def test_prefix_hint_view_is_throttled(drf: APIClient, prefix_game: Game, mocker: MockerFixture):
+    mocker.patch.object(ScopedRateThrottle, "timer", return_value=1000.0)
+    num_requests, _ = ScopedRateThrottle().parse_rate(ScopedRateThrottle.THROTTLE_RATES["prefix"])
+    for _ in range(num_requests):
+        assert drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "t"}).status_code == 200
+    assert drf.get(f"/api/game/{prefix_game.id}/prefix/", {"prefix": "t"}).status_code == 429
+
+
+def test_take_turn_game_view_suggests_words(drf: APIClient, prefix_game: Game):
+    player = prefix_game.current_player
+    player.session_key = drf.session.session_key
+    player.save()
+    prefix_game.turn_time_left = 10
+    prefix_game.save()
+    response = drf.post(f"/api/game/{prefix_game.id}/turn/", {"word": "tapz"}, format="json")
+    assert response.status_code == 400
+    assert response.data == {"detail": "Word not found in dictionary.", "suggestions": ["tap", "taps"]}
@@ -1,8 +1,10 @@
 from unittest.mock import patch
 
 import pytest
+from django.utils import timezone
 
 from shiritori.game.converters import aconvert_game_to_json, convert_to_camel
+from shiritori.game.models import Game, GameStatus, Player
 
 pytestmark = [pytest.mark.django_db, pytest.mark.asyncio]
 
@@ -24,3 +26,38 @@ async def test_consumer_sends_payload_on_connect(game_consumer):
             "selfPlayer": player_1.id,
         },
     }
+
+
+async def test_consumer_answers_timer_sync(game_consumer):
+    consumer, game, _player_1 = game_consumer
+    game.turn_time_left = 10
+    await game.asave(update_fields=["turn_deadline"])
+    await consumer.connect()
+    await consumer.receive_json_from()  # consume connected message
+    await consumer.receive_json_from()  # consume player connected message
+    await consumer.send_json_to({"type": "timer_sync"})
+    result = await consumer.receive_json_from()
+    assert result["type"] == "game_timer_sync"
+    assert result["data"]["turnDeadline"] == round(game.turn_deadline.timestamp() * 1000)
+
+
+async def test_consumer_cancels_disconnect_on_reconnect(mocker, game_consumer):
+    consumer, _game, player_1 = game_consumer
+    current_app = mocker.patch("shiritori.game.tasks.current_app")
+    await Player.objects.filter(id=player_1.id).aupdate(is_connected=False, disconnect_task_id="grace-period")
+    await consumer.connect()
+    await consumer.receive_json_from()  # consume connected message
+    current_app.control.revoke.assert_called_once_with("grace-period")
+    player = await Player.objects.aget(id=player_1.id)
+    assert player.is_connected
+    assert player.disconnect_task_id is None
+
+
+async def test_consumer_resumes_suspended_game(game_consumer):
+    consumer, game, _player_1 = game_consumer
+    await Game.objects.filter(id=game.id).aupdate(status=GameStatus.PLAYING, suspended_at=timezone.now())
+    await consumer.connect()
+    await consumer.receive_json_from()  # consume connected message
+    game = await Game.objects.aget(id=game.id)
+    assert game.suspended_at is None
+    assert game.turn_deadline is not None
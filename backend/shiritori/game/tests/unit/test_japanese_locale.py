@@ -0,0 +1,100 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from shiritori.game.dictionary import iter_dictionary_words
+from shiritori.game.models import Game, GameLocales, GameSettings, GameStatus, Word
+from shiritori.game.serializers import ShiritoriGameSettingsSerializer
+from shiritori.game.utils import calculate_score, generate_random_letter, last_letter, loses_game, normalize_word
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    "word, normalized, letter",
+    [
+        ("ネコ", "ねこ", "こ"),
+        ("ｺｰﾋｰ", "こーひー", "ひ"),
+        ("キシャ", "きしゃ", "や"),
+        ("きって", "きって", "て"),
+        ("みかん", "みかん", "ん"),
+    ],
+)
+def test_kana_normalization(word, normalized, letter):
+    assert normalize_word(word, GameLocales.JA) == normalized
+    assert last_letter(normalized, GameLocales.JA) == letter
+
+
+def test_english_is_unchanged():
+    assert normalize_word("ネコ", GameLocales.EN) == "ネコ"
+    assert last_letter("hello", GameLocales.EN) == "o"
+    assert not loses_game("kitten", GameLocales.EN)
+    assert generate_random_letter().isascii()
+
+
+@pytest.mark.parametrize("word, loses", [("みかん", True), ("らーめん", True), ("かんじ", False), (None, False)])
+def test_moraic_nasal_loses(word, loses):
+    assert loses_game(word, GameLocales.JA) is loses
+
+
+def test_dictionary_stores_readings(dictionary_files):
+    dictionary_files(["ネコ", "珈琲\tコーヒー", "りんご"], locale=GameLocales.JA)
+    assert sorted(iter_dictionary_words(GameLocales.JA)) == ["こーひー", "ねこ", "りんご"]
+    assert Word.validate("ｺｰﾋｰ", GameLocales.JA)
+    assert not Word.validate("珈琲", GameLocales.JA)
+    assert generate_random_letter(GameLocales.JA) in "こねり"
+
+
+def test_playing_moraic_nasal_loses_the_game(started_game: Game, dictionary_files):
+    dictionary_files(["きしゃ", "やかん", "やま"], locale=GameLocales.JA)
+    started_game.settings.locale = GameLocales.JA
+    started_game.settings.word_length = 3
+    started_game.settings.save()
+    started_game.last_word = "き"
+    started_game.turn_time_left = 10
+    first = started_game.current_player
+    started_game.take_turn(first.session_key, "キシャ")
+    assert started_game.last_word == "きしゃ"
+    assert started_game.status == GameStatus.PLAYING
+    second = started_game.current_player
+    started_game.turn_time_left = 10
+    started_game.take_turn(second.session_key, "ヤカン")
+    assert started_game.status == GameStatus.FINISHED
+    assert started_game.winner == first
+
+
+def test_two_kana_words_use_their_reading_letters(started_game: Game, dictionary_files):
+    dictionary_files(["やしゃ", "やや"], locale=GameLocales.JA)
+    started_game.settings.locale = GameLocales.JA
+    started_game.settings.word_length = 2
+    started_game.settings.save()
+    started_game.last_word = "や"
+    started_game.turn_time_left = 10
+    started_game.take_turn(started_game.current_player.session_key, "やや")
+    started_game.turn_time_left = 10
+    started_game.take_turn(started_game.current_player.session_key, "ヤシャ")
+    assert started_game.state.used_letters == started_game.used_letters == ["や"]
+    # やや already ended on や, so やしゃ gets no new letter bonus.
+    word = started_game.words.get(word="やしゃ")
+    assert word.score == calculate_score("やしゃ", word.duration, unused_letter=False)
+
+
+@pytest.mark.parametrize("locale, is_valid", [(GameLocales.JA, True), (GameLocales.EN, False)])
+def test_minimum_word_length_depends_on_locale(locale, is_valid):
+    data = {**GameSettings.get_default_settings(), "locale": locale, "word_length": 2}
+    serializer = ShiritoriGameSettingsSerializer(data=data)
+    assert serializer.is_valid() is is_valid
+    assert is_valid or "word_length" in serializer.errors
+
+
+@pytest.mark.parametrize("locale, is_valid", [(GameLocales.JA, True), (GameLocales.EN, False)])
+def test_minimum_word_length_is_enforced_by_the_model(locale, is_valid):
+    settings = GameSettings(locale=locale, word_length=2)
+    if is_valid:
+        settings.full_clean()
+        settings.save()
+        return
+    with pytest.raises(ValidationError, match="Words must be at least 3 characters long."):
+        settings.full_clean()
+    with pytest.raises(IntegrityError), transaction.atomic():
+        settings.save()
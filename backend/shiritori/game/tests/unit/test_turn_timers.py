@@ -0,0 +1,109 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from shiritori.game.models import Game, GameStatus
+from shiritori.game.timers import TurnTimerService, claim_games, release_games, tick_game
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def timed_game(started_game: Game):
+    started_game.settings.turn_time = 2
+    started_game.settings.max_turns = 1
+    started_game.settings.save()
+    started_game.turn_time_left = 2
+    started_game.save(update_fields=["turn_deadline"])
+    return started_game
+
+
+def test_claim_games(timed_game: Game, unstarted_game: Game):
+    taken = Game.objects.create(
+        status=GameStatus.PLAYING, lease_owner="timers:other", lease_expires_at=timezone.now() + timedelta(seconds=5)
+    )
+    Game.objects.create(status=GameStatus.PLAYING, suspended_at=timezone.now())
+    assert claim_games("timers:test") == {timed_game.id: timed_game.turn_deadline}
+    assert Game.objects.get(id=taken.id).lease_owner == "timers:other"
+    assert Game.objects.get(id=unstarted_game.id).lease_owner is None
+
+
+def test_claim_games_takes_over_expired_leases(timed_game: Game):
+    Game.objects.filter(id=timed_game.id).update(
+        lease_owner="timers:other", lease_expires_at=timezone.now() - timedelta(seconds=1)
+    )
+    assert list(claim_games("timers:test")) == [timed_game.id]
+    # The service that lost the game stops ticking it.
+    assert tick_game(timed_game.id, "timers:other") is None
+    assert Game.objects.get(id=timed_game.id).lease_owner == "timers:test"
+
+
+def test_claim_games_renews_leases(timed_game: Game):
+    claim_games("timers:test", lease_duration=1)
+    expires_at = Game.objects.get(id=timed_game.id).lease_expires_at
+    claim_games("timers:test", lease_duration=10)
+    assert Game.objects.get(id=timed_game.id).lease_expires_at > expires_at
+    assert claim_games("timers:other") == {}
+    assert release_games("timers:test") == 1
+    assert list(claim_games("timers:other")) == [timed_game.id]
+
+
+def test_tick_game_releases_finished_games(timed_game: Game):
+    claim_games("timers:test")
+    assert tick_game(timed_game.id, "timers:other") is None
+    # The next tick is when the turn runs out.
+    assert tick_game(timed_game.id, "timers:test") == pytest.approx(2, abs=0.1)
+    # Ticks only read the deadline, it is written when the turn changes.
+    assert Game.objects.get(id=timed_game.id).turn_deadline == timed_game.turn_deadline
+    Game.objects.filter(id=timed_game.id).update(status=GameStatus.FINISHED)
+    assert tick_game(timed_game.id, "timers:test") is None
+    assert Game.objects.get(id=timed_game.id).lease_owner is None
+
+
+def test_tick_game_finishes_games_whose_turn_can_not_end(timed_game: Game, mocker):
+    mocker.patch.object(Game, "end_turn", autospec=True, side_effect=ValidationError("broken"))
+    timed_game.turn_time_left = 0
+    timed_game.save(update_fields=["turn_deadline"])
+    claim_games("timers:test")
+    assert tick_game(timed_game.id, "timers:test") is None
+    game = Game.objects.get(id=timed_game.id)
+    assert game.is_finished
+    # The game is not claimed again to fail on every claim.
+    assert claim_games("timers:test") == {}
+
+
+@pytest.mark.asyncio
+async def test_service_plays_games_to_the_end(timed_game: Game):
+    # Turns end on their deadline, let every turn run out at once.
+    timed_game.settings.turn_time = 0
+    await timed_game.settings.asave(update_fields=["turn_time"])
+    timed_game.turn_time_left = 0
+    await timed_game.asave(update_fields=["turn_deadline"])
+    # One tick at a time, the in-memory test database locks tables across threads.
+    service = TurnTimerService("timers:test", concurrency=1, claim_interval=0.05)
+    runner = asyncio.create_task(service.run())
+    await asyncio.sleep(1)
+    service.stop()
+    await asyncio.wait_for(runner, timeout=5)
+    game = await Game.objects.aget(id=timed_game.id)
+    assert game.is_finished
+    assert game.lease_owner is None
+    assert len(service) == 0
+
+
+@pytest.mark.asyncio
+async def test_service_wakes_games_when_a_word_is_played(timed_game: Game):
+    service = TurnTimerService("timers:test")
+    await service.claim()
+    loop = asyncio.get_running_loop()
+    service.schedule(timed_game.id, 60)
+    await service.claim()
+    assert service._scheduled[timed_game.id] > loop.time() + 30
+    # Playing a word starts the next turn, the next player may be a bot that is ready before the game was due.
+    timed_game.turn_time_left = 10
+    await timed_game.asave(update_fields=["turn_deadline"])
+    await service.claim()
+    assert service._scheduled[timed_game.id] <= loop.time()
@@ -0,0 +1,99 @@
+import pytest
+
+from shiritori.game.models import Game, GameSettings, GameWord, WordList
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def house_rules():
+    word_list = WordList.objects.create(name="house-rules")
+    word_list.add_words(["Pokemon", "zzz"])
+    word_list.add_words(["toothbrush"], removal=True)
+    return word_list
+
+
+def test_add_words_moves_between_sets(house_rules: WordList):
+    assert house_rules.version == 3
+    house_rules.add_words(["zzz"], removal=True)
+    assert house_rules.version == 4
+    (overlay,) = WordList.get_overlays([(house_rules.id, house_rules.version)])
+    assert overlay.additions == {"pokemon"}
+    assert overlay.removals == {"toothbrush", "zzz"}
+
+
+def test_overlays_are_shared_until_changed(house_rules: WordList, django_assert_num_queries):
+    versions = [(house_rules.id, house_rules.version)]
+    with django_assert_num_queries(1):
+        (overlay,) = WordList.get_overlays(versions)
+    with django_assert_num_queries(0):
+        assert WordList.get_overlays(versions) == [overlay]
+        assert WordList.get_overlays(versions)[0] is overlay
+    house_rules.discard_words(["pokemon"])
+    (changed,) = WordList.get_overlays([(house_rules.id, house_rules.version)])
+    assert changed is not overlay
+    assert "pokemon" not in changed.additions
+
+
+def test_settings_validate_with_word_lists(house_rules: WordList, sample_words, django_assert_num_queries):
+    settings = GameSettings.from_defaults()
+    assert settings.is_valid_word("toothbrush")
+    assert not settings.is_valid_word("pokemon")
+    settings.word_lists.add(house_rules)
+    settings = GameSettings.objects.get(pk=settings.pk)
+    assert settings.is_valid_word("POKEMON")
+    assert not settings.is_valid_word("toothbrush")
+    assert settings.is_valid_word("hello")
+    # Removals win over additions of another list
+    banned = WordList.objects.create(name="no-pokemon")
+    banned.add_words(["pokemon"], removal=True)
+    settings.word_lists.add(banned)
+    settings = GameSettings.objects.get(pk=settings.pk)
+    assert not settings.is_valid_word("pokemon")
+    # The lists are only read once per settings, the dictionary is still queried without an index
+    with django_assert_num_queries(2):
+        settings.is_valid_word("hello")
+        settings.is_valid_word("pokemon")
+
+
+def test_game_with_word_lists(started_game: Game, house_rules: WordList, dictionary_files):
+    dictionary_files(["test", "toothbrush", "tent"])
+    started_game.settings.word_lists.add(house_rules)
+    started_game.settings = GameSettings.objects.get(pk=started_game.settings.pk)
+    started_game.last_word = "t"
+    assert started_game.remaining_word_count == 2
+    assert started_game.gameword_set.model(game=started_game, word="toothbrush").validate() is False
+    assert started_game.prefix_hint("to").count == 0
+    assert started_game.prefix_hint("te").words == ["tent", "test"]
+
+
+def test_used_words_of_word_lists_are_counted_once(started_game: Game, dictionary_files):
+    dictionary_files(["top", "pit"])
+    word_list = WordList.objects.create(name="pots")
+    word_list.add_words(["pot", "pat"])
+    started_game.settings.word_lists.add(word_list)
+    started_game.settings = GameSettings.objects.get(pk=started_game.settings.pk)
+    GameWord.objects.create(game=started_game, player=started_game.current_player, word="pot", score=1)
+    started_game.last_word = "top"
+    assert started_game.remaining_word_count == 2
+    assert not started_game.is_dead_end
+    assert started_game.prefix_hint("p").count == 2
+
+
+def test_prefix_hint_checks_word_lists_once(started_game: Game, dictionary_files, django_assert_num_queries):
+    dictionary_files(["top", "pit", "pin"])
+    word_list = WordList.objects.create(name="pots")
+    word_list.add_words(["pot", "pat"])
+    word_list.add_words(["pit"], removal=True)
+    started_game.settings.word_lists.add(word_list)
+    started_game.settings = GameSettings.objects.get(pk=started_game.settings.pk)
+    started_game.last_word = "top"
+    assert started_game.prefix_hint("p").count == 3
+    # Another request's settings only query the lists' versions, the used words come from the game's state
+    started_game.settings = GameSettings.objects.get(pk=started_game.settings.pk)
+    with django_assert_num_queries(1):
+        assert started_game.prefix_hint("p").count == 3
+        assert started_game.remaining_word_count == 3
+    word_list.add_words(["pup"])
+    started_game.settings = GameSettings.objects.get(pk=started_game.settings.pk)
+    assert started_game.prefix_hint("p").count == 4
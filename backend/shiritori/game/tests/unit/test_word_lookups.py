@@ -0,0 +1,57 @@
+import math
+
+import pytest
+from django.db import connection
+
+from shiritori.game.models import Game, GameWord, Word
+from shiritori.game.models.word import VALIDATE_BATCH_SIZE
+
+pytestmark = pytest.mark.django_db
+
+
+def assert_index_only(plan: str) -> None:
+    if connection.vendor == "postgresql":
+        assert "Index Only Scan" in plan
+    else:
+        assert "USING COVERING INDEX" in plan
+    assert "SCAN" not in plan.replace("Index Only Scan", "")
+
+
+def test_words_are_stored_normalized():
+    word = Word.objects.create(word="Ｔest")
+    assert word.word == "test"
+
+
+def test_word_validate_is_case_insensitive(sample_words):
+    assert Word.validate("TEST") is True
+    assert Word.validate("Ｔｅｓｔ") is True
+
+
+def test_word_lookup_is_index_only(sample_words):
+    plan = Word.objects.filter(locale="en", word="test").values_list("word").explain()
+    assert_index_only(plan)
+
+
+def test_used_word_lookup_is_index_only(started_game: Game):
+    GameWord.objects.create(word="test", game=started_game)
+    plan = started_game.gameword_set.filter(word="test").values_list("word").explain()
+    assert_index_only(plan)
+
+
+def test_validate_many_uses_one_query_per_batch(sample_words, django_assert_num_queries):
+    words = ["Hello", "nope", *sample_words] * 300
+    with django_assert_num_queries(math.ceil(len(words) / VALIDATE_BATCH_SIZE)):
+        results = list(Word.validate_many(words))
+    assert len(results) == len(words)
+    assert results[:2] == [("Hello", True), ("nope", False)]
+
+
+def test_validate_many_with_index(dictionary_files, django_assert_num_queries):
+    dictionary_files(["apple"])
+    with django_assert_num_queries(0):
+        assert list(Word.validate_many(iter(["apple", "APPLE", "", "pear"]))) == [
+            ("apple", True),
+            ("APPLE", True),
+            ("", False),
+            ("pear", False),
+        ]
@@ -0,0 +1,210 @@
+import asyncio
+import heapq
+import logging
+import socket
+from datetime import datetime, timedelta
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from shiritori.game.models import Game, GameMode, GameStatus
+
+__all__ = (
+    "TurnTimerService",
+    "default_owner",
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two looks for newly started games, each look also renews the service's leases.
+CLAIM_INTERVAL = 1.0
+# Seconds a claim holds a game, a service that stops renewing its leases loses its games to the others after this.
+LEASE_DURATION = 5.0
+# Ticks running at once, each one holds a database connection on a worker thread.
+DEFAULT_CONCURRENCY = 32
+# A tick that failed is retried after this many seconds.
+RETRY_DELAY = 5.0
+
+
+def default_owner() -> str:
+    """The id a timer service stores on the games it drives, stable across restarts on the same host."""
+    return f"timers:{socket.gethostname()}"
+
+
+def claim_games(owner: str, lease_duration: float = LEASE_DURATION) -> dict[str, datetime | None]:
+    """
+    Renew the service's leases and take over the playing games no timer holds, either because they were never
+    claimed or because their owner stopped renewing them. Suspended games are left until they resume,
+    correspondence games have no timer, see `Game.end_expired_correspondence_turns`.
+    :param owner: str - The id of the timer service.
+    :param lease_duration: float - The seconds the leases last.
+    :return: dict[str, Optional[datetime]] - The turn deadline of every playing game the service drives,
+        including the ones it already had, by game id.
+    """
+    close_old_connections()
+    now = timezone.now()
+    claimable = Q(lease_owner=owner) | Q(lease_owner__isnull=True) | Q(lease_expires_at__lt=now)
+    games = Game.objects.filter(
+        claimable, status=GameStatus.PLAYING, suspended_at__isnull=True, settings__mode=GameMode.REALTIME
+    )
+    games.update(lease_owner=owner, lease_expires_at=now + timedelta(seconds=lease_duration))
+    return dict(Game.objects.filter(status=GameStatus.PLAYING, lease_owner=owner).values_list("id", "turn_deadline"))
+
+
+def release_games(owner: str) -> int:
+    """
+    Give up the service's games, so the other services take them over on their next claim instead of
+    waiting for the leases to expire.
+    :param owner: str - The id of the timer service.
+    :return: int - The number of games released.
+    """
+    close_old_connections()
+    return Game.objects.filter(lease_owner=owner).update(lease_owner=None, lease_expires_at=None)
+
+
+def tick_game(game_id: str, owner: str) -> float | None:
+    """
+    Run one tick of a game's turn timer, see `Game.tick_turn`.
+    A game that stopped playing is released, so a restarted game can be claimed again.
+    A game whose lease was taken over by another service is left to it.
+    A game whose turn can not be ended is finished, released it would be claimed and fail again.
+    """
+    close_old_connections()
+    try:
+        delay = Game.tick_turn(game_id, owner)
+    except ValidationError:
+        logger.exception("Could not end the turn of game %s, finishing it", game_id)
+        games = Game.objects.select_related("settings").filter(id=game_id, status=GameStatus.PLAYING, lease_owner=owner)
+        if game := games.first():
+            game.finish()
+        delay = None
+    if delay is None:
+        Game.objects.filter(id=game_id, lease_owner=owner).update(lease_owner=None, lease_expires_at=None)
+    return delay
+
+
+class TurnTimerService:
+    """
+    Drives the turn timers of every playing game from one event loop.
+
+    Each game has one entry in a heap ordered by the time of its next tick, the loop sleeps until the
+    earliest one is due. A game is only ticked when its turn runs out or its bot is ready, a word played in
+    between moves the deadline and the next claim wakes the game, see `claim`. Ticks and claims touch the
+    database, so they run on worker threads, at most `concurrency` at a time. Games are claimed by writing the
+    service's id to their `lease_owner`, a game is only ever ticked by the service holding its lease. Claiming
+    also renews the leases, a game whose service died is taken over by another one `lease_duration` seconds later.
+    """
+
+    def __init__(
+        self,
+        owner: str | None = None,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        claim_interval: float = CLAIM_INTERVAL,
+        lease_duration: float = LEASE_DURATION,
+    ):
+        if lease_duration <= claim_interval:
+            raise ValueError("Leases must last longer than the claim interval, or they expire before being renewed.")
+        self.owner = owner or default_owner()
+        self.claim_interval = claim_interval
+        self.lease_duration = lease_duration
+        self._heap: list[tuple[float, str]] = []
+        # When each game is due, an entry of the heap that does not match it was rescheduled and is skipped.
+        self._scheduled: dict[str, float] = {}
+        # The games being ticked, and the ones among them that were woken meanwhile.
+        self._ticking: set[str] = set()
+        self._woken: set[str] = set()
+        # The turn deadline of each game when it was last claimed.
+        self._deadlines: dict[str, datetime | None] = {}
+        self._running: set[asyncio.Task] = set()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._scheduled) + len(self._ticking)
+
+    def schedule(self, game_id: str, delay: float = 0) -> None:
+        """Tick the game after the given number of seconds, instead of when it was due."""
+        due = asyncio.get_running_loop().time() + delay
+        self._scheduled[game_id] = due
+        heapq.heappush(self._heap, (due, game_id))
+        self._wakeup.set()
+
+    def wake(self, game_id: str) -> None:
+        """Tick the game now, or right after the tick that is running, its turn changed since it was scheduled."""
+        if game_id in self._ticking:
+            self._woken.add(game_id)
+        elif game_id in self._scheduled:
+            self.schedule(game_id)
+
+    def stop(self) -> None:
+        """Stop after the ticks already running, the games are released for the other services to take over."""
+        self._stopping.set()
+        self._wakeup.set()
+
+    async def claim(self) -> None:
+        async with self._semaphore:
+            deadlines = await sync_to_async(claim_games, thread_sensitive=False)(self.owner, self.lease_duration)
+        for game_id, deadline in deadlines.items():
+            if game_id not in self._scheduled and game_id not in self._ticking:
+                self.schedule(game_id)
+            elif self._deadlines.get(game_id, deadline) != deadline:
+                # The turn changed, after a word was played the next bot may be ready before the game is due.
+                self.wake(game_id)
+        self._deadlines = deadlines
+
+    async def run(self) -> None:
+        """Run until `stop` is called."""
+        loop = asyncio.get_running_loop()
+        logger.info("Turn timers started as %s", self.owner)
+        next_claim = loop.time()
+        while not self._stopping.is_set():
+            now = loop.time()
+            if now >= next_claim:
+                try:
+                    await self.claim()
+                except DatabaseError:
+                    logger.exception("Could not claim new games")
+                next_claim = now + self.claim_interval
+            while self._heap and self._heap[0][0] <= loop.time():
+                due, game_id = heapq.heappop(self._heap)
+                if self._scheduled.get(game_id) != due:
+                    continue
+                del self._scheduled[game_id]
+                self._ticking.add(game_id)
+                await self._semaphore.acquire()
+                task = asyncio.create_task(self._tick(game_id))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            self._wakeup.clear()
+            due = self._heap[0][0] if self._heap else next_claim
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(min(due, next_claim) - loop.time(), 0))
+            except TimeoutError:
+                pass
+        if self._running:
+            await asyncio.wait(self._running)
+        try:
+            released = await sync_to_async(release_games, thread_sensitive=False)(self.owner)
+        except DatabaseError:
+            logger.exception("Could not release the games, they are taken over once their leases expire")
+        else:
+            logger.info("Turn timers stopped, released %s games", released)
+
+    async def _tick(self, game_id: str) -> None:
+        try:
+            delay = await sync_to_async(tick_game, thread_sensitive=False)(game_id, self.owner)
+        except Exception:  # One broken game must not stop the others.
+            logger.exception("Could not tick game %s, retrying", game_id)
+            delay = RETRY_DELAY
+        finally:
+            self._semaphore.release()
+            self._ticking.discard(game_id)
+        woken = game_id in self._woken
+        self._woken.discard(game_id)
+        if delay is not None:
+            self.schedule(game_id, 0 if woken else delay)
@@ -1,6 +1,6 @@
+import itertools
 import random
 import string
-import time
 import typing
 import unicodedata
 
@@ -17,6 +17,18 @@ MISSED_WORD_PENALTY = -0.25
 # The duration is in seconds. The score is multiplied by the modifier.
 DURATION_MODIFIERS = {5: 1.8, 10: 1.5, 15: 1.2}
 
+# Locales whose words are kana readings, played on the sound of the last mora.
+KANA_LOCALES = frozenset({"ja"})
+# Katakana are played as the hiragana with the same reading, the blocks are 0x60 apart.
+KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(ord("ァ"), ord("ヶ") + 1)}
+# A word ending in a small kana continues with the full-size one, きしゃ is followed by a word starting with や.
+SMALL_KANA = str.maketrans("ぁぃぅぇぉっゃゅょゎゕゖ", "あいうえおつやゆよわかけ")
+# The long vowel mark only stretches the mora before it, コーヒー is followed by a word starting with ひ.
+LONG_VOWEL_MARK = "ー"
+# No word starts with ん, so playing a word that ends with it loses the game.
+MORAIC_NASAL = "ん"
+HIRAGANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわ"
+
 
 def case_insensitive_equal(a: str, b: str) -> bool:
     """
@@ -29,15 +41,45 @@ def case_insensitive_equal(a: str, b: str) -> bool:
 
 
 def chunk_list(iterable, n):
-    for i in range(0, len(iterable), n):
-        yield iterable[i : i + n]
+    """
+    Split an iterable into lists of at most n items.
+    Works on iterators too, so only one chunk is held in memory at a time.
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, n)):
+        yield chunk
 
 
-def normalize_word(word: str | None) -> str:
+def normalize_word(word: str | None, locale: str | None = None) -> str:
     """
     Normalize a word. This will lowercase the word and normalize the unicode.
+    Words of kana locales are converted to hiragana, NFKC already widened half-width katakana.
+    """
+    if not word:
+        return None
+    word = unicodedata.normalize("NFKC", word.lower())
+    if locale in KANA_LOCALES:
+        word = word.translate(KATAKANA_TO_HIRAGANA)
+    return word
+
+
+def last_letter(word: str, locale: str | None = None) -> str:
+    """
+    Get the letter the next word has to start with.
+    For kana locales the long vowel mark is skipped and small kana count as their full-size kana.
+    :param word: str - A normalized word.
+    :param locale: str - The locale of the word.
+    :return: str - The letter, empty if the word is.
     """
-    return unicodedata.normalize("NFKC", word.lower()) if word else None
+    if locale in KANA_LOCALES:
+        word = word.rstrip(LONG_VOWEL_MARK)
+        return word[-1:].translate(SMALL_KANA)
+    return word[-1:]
+
+
+def loses_game(word: str | None, locale: str | None = None) -> bool:
+    """Check whether playing the normalized word loses the game, kana words ending with ん do."""
+    return bool(word) and locale in KANA_LOCALES and word.rstrip(LONG_VOWEL_MARK).endswith(MORAIC_NASAL)
 
 
 def calculate_score(word: str | None, duration: int | float, unused_letter: bool = False) -> float:
@@ -70,12 +112,21 @@ def calculate_score(word: str | None, duration: int | float, unused_letter: bool
     return int(round(score, 2))
 
 
-def generate_random_letter():
+def generate_random_letter(locale: str | None = None, min_length: int = 0) -> str:
     """
     Generate a random letter.
+    When the locale's letter index is available the letter is weighted by the number of words
+    that start with it, so games never start on a letter without words.
+    :param locale: str - The locale of the game.
+    :param min_length: int - The minimum word length of the game.
     :return: str - A random letter.
     """
-    return random.choice(string.ascii_lowercase)
+    if locale is not None:
+        from shiritori.game.dictionary import get_letter_index
+
+        if (letters := get_letter_index(locale)) and (letter := letters.random_letter(min_length)):
+            return letter
+    return random.choice(HIRAGANA if locale in KANA_LOCALES else string.ascii_lowercase)
 
 
 def send_message_to_layer(channel_name: str, message: "EventDict"):
@@ -99,21 +150,3 @@ async def asend_message_to_layer(channel_name: str, message: "EventDict"):
             # await channel_layer.close_pools()
         except Exception as error:
             print(f"Error sending message to channel layer: {error}")
-
-
-def wait():
-    time.sleep(1.25)
-
-
-def mock_stream_closer():
-    """
-    Quites the closing error in relation to redis.
-    """
-    from asyncio.streams import StreamWriter
-
-    StreamWriter.close = lambda self: None
-
-    async def mock_wait_closed(self):
-        pass
-
-    StreamWriter.wait_closed = mock_wait_closed
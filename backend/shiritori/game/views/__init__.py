@@ -1 +1,2 @@
-from .game import GameViewSet  # noqa: 401
+from .dictionary import DictionaryViewSet  # noqa: F401
+from .game import GameViewSet  # noqa: F401
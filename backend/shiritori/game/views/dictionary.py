@@ -0,0 +1,121 @@
+import contextlib
+import itertools
+import json
+from collections.abc import AsyncIterator, Iterable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.wsgi import LimitedStream
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.crypto import constant_time_compare
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import action
+from rest_framework.permissions import BasePermission
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.viewsets import ViewSet
+
+from shiritori.game.dictionary import get_dictionary
+from shiritori.game.dictionary.bloom import BLOOM_FORMAT_VERSION
+from shiritori.game.models import GameLocales, Word
+from shiritori.game.models.word import VALIDATE_BATCH_SIZE
+from shiritori.game.utils import chunk_list
+
+__all__ = ("DictionaryViewSet",)
+
+# Bundles are versioned by their ETag, clients only need to revalidate them now and then.
+BUNDLE_MAX_AGE = 60 * 60
+
+
+async def _ndjson(results: Iterable[tuple[str, bool]]) -> AsyncIterator[str]:
+    # The ASGI handler buffers a sync iterator whole, each batch is validated in a thread and sent once it is ready.
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    next_batch = sync_to_async(next)
+    batches = chunk_list(results, VALIDATE_BATCH_SIZE)
+    while batch := await next_batch(batches, None):
+        # Only the word needs escaping, formatting the rest by hand is several times faster than dumping a dict.
+        yield "".join(f'{{"word": {encode(word)}, "valid": {"true" if valid else "false"}}}\n' for word, valid in batch)
+
+
+class IsStaffOrHasDictionaryKey(BasePermission):
+    """Staff users, or tooling sending the `LOAD_DICTIONARY_KEY` like `load_dictionary_view`."""
+
+    def has_permission(self, request, view) -> bool:
+        if request.user and request.user.is_staff:
+            return True
+        key = request.headers.get("X-Dictionary-Key") or request.query_params.get("key")
+        return bool(key) and constant_time_compare(key, settings.LOAD_DICTIONARY_KEY)
+
+
+class DictionaryViewSet(ViewSet):
+    authentication_classes = []
+    permission_classes = []
+    lookup_field = "locale"
+    lookup_value_regex = "[a-z]{2,10}"
+    # Set per action, see `validate`.
+    throttle_scope = None
+
+    @extend_schema(
+        responses={
+            200: OpenApiResponse(OpenApiTypes.BINARY, description="The Bloom filter bundle, see `BloomFilter`."),
+            304: OpenApiResponse(description="The bundle matching the If-None-Match header is still current."),
+            404: OpenApiResponse(description="The locale has no dictionary."),
+        }
+    )
+    @action(detail=True, methods=["get"])
+    def bundle(self, request, locale=None):
+        """
+        Download a Bloom filter of the locale's dictionary to check words before submitting them.
+        A new bundle, with a new ETag, is built whenever the dictionary is reloaded.
+        """
+        if locale not in GameLocales.values or (dictionary := get_dictionary(locale)) is None:
+            return Response(status=status.HTTP_404_NOT_FOUND, data={"detail": "Dictionary not found."})
+        etag = f'"{locale}-{dictionary.version}-{BLOOM_FORMAT_VERSION}"'
+        if (response := get_conditional_response(request, etag=etag)) is None:
+            # Served from the mapping, which stays valid even if a reload already removed the file.
+            response = HttpResponse(dictionary.bloom.to_bytes(), content_type="application/octet-stream")
+        response.headers["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=BUNDLE_MAX_AGE)
+        return response
+
+    @extend_schema(
+        request={"text/plain": OpenApiTypes.STR},
+        responses={
+            200: OpenApiResponse(OpenApiTypes.STR, description='One `{"word": ..., "valid": ...}` object per line.'),
+            403: OpenApiResponse(description="Neither a staff user nor the dictionary key."),
+            404: OpenApiResponse(description="The locale does not exist."),
+            413: OpenApiResponse(description="The body is larger than `BULK_VALIDATE_MAX_BYTES`."),
+        },
+    )
+    @action(
+        detail=True,
+        methods=["post"],
+        authentication_classes=[SessionAuthentication],
+        permission_classes=[IsStaffOrHasDictionaryKey],
+        throttle_classes=[ScopedRateThrottle],
+        throttle_scope="validate",
+    )
+    def validate(self, request, locale=None):
+        """
+        Validate many words at once, one word per line of the request body, for moderation and content tooling.
+        The body is read and the results are written as NDJSON while the words are validated.
+        At most `BULK_VALIDATE_MAX_WORDS` words are validated, the ones after them are left out of the results.
+        """
+        if locale not in GameLocales.values:
+            return Response(status=status.HTTP_404_NOT_FOUND, data={"detail": "Dictionary not found."})
+        max_bytes = settings.BULK_VALIDATE_MAX_BYTES
+        with contextlib.suppress(ValueError):
+            if int(request.headers.get("Content-Length") or 0) > max_bytes:
+                return Response(
+                    status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    data={"detail": f"The body may be at most {max_bytes} bytes."},
+                )
+        # Bodies sent without a length are cut off at the same size.
+        lines = LimitedStream(request.stream, max_bytes) if request.stream else ()
+        words = (word for line in lines if (word := line.decode("utf-8", errors="replace").strip()))
+        words = itertools.islice(words, settings.BULK_VALIDATE_MAX_WORDS)
+        return StreamingHttpResponse(_ndjson(Word.validate_many(words, locale)), content_type="application/x-ndjson")
@@ -6,31 +6,42 @@ from rest_framework.decorators import action
 from rest_framework.fields import CharField
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
 from shiritori.game.auth import RequiresSessionAuth
 from shiritori.game.models import Game
 from shiritori.game.serializers import (
+    AddBotSerializer,
     CreateStartGameSerializer,
     EmptySerializer,
     JoinGameSerializer,
+    PrefixHintQuerySerializer,
+    PrefixHintSerializer,
     ShiritoriGameSerializer,
     ShiritoriTurnSerializer,
 )
-from shiritori.game.tasks import start_game_task
+from shiritori.game.tasks import schedule_game_start
 
 __all__ = ("GameViewSet",)
 
 
 class GameViewSet(ReadOnlyModelViewSet):
-    queryset = Game.objects.all()
+    # Every action reads the settings, the serializer for the nested settings and the snapshot's max turns,
+    # prefix hints on every keystroke.
+    queryset = Game.objects.select_related("settings")
     serializer_class = ShiritoriGameSerializer
     authentication_classes = []
     permission_classes = []
+    # Set per action, see `prefix`.
+    throttle_scope = None
 
     def handle_exception(self, exc: Exception) -> Response:
         if isinstance(exc, ValidationError):
-            return Response(status=status.HTTP_400_BAD_REQUEST, data={"detail": exc.message})
+            data = {"detail": exc.message}
+            if exc.code == "not_in_dictionary":
+                data["suggestions"] = exc.params["suggestions"]
+            return Response(status=status.HTTP_400_BAD_REQUEST, data=data)
         return super().handle_exception(exc)
 
     @staticmethod
@@ -52,6 +63,8 @@ class GameViewSet(ReadOnlyModelViewSet):
                 return JoinGameSerializer
             case "leave":
                 return EmptySerializer
+            case "add_bot":
+                return AddBotSerializer
             case _:
                 return super().get_serializer_class()
 
@@ -70,7 +83,7 @@ class GameViewSet(ReadOnlyModelViewSet):
         serializer.is_valid(raise_exception=True)
         game_settings = serializer.save()
         game.prepare_start(session_key, game_settings=game_settings)
-        start_game_task.delay(game.id)
+        schedule_game_start(game)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=True, methods=["post"], authentication_classes=[SessionAuthentication])
@@ -98,6 +111,27 @@ class GameViewSet(ReadOnlyModelViewSet):
             headers=headers,
         )
 
+    @extend_schema(responses={201: inline_serializer("Bot", {"id": CharField(read_only=True)})})
+    @action(detail=True, methods=["post"], url_path="add-bot", authentication_classes=[RequiresSessionAuth])
+    def add_bot(self, request, pk=None):
+        game = self.get_object()
+        serializer: AddBotSerializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        bot = game.add_bot(serializer.validated_data["difficulty"], session_key=request.session.session_key)
+        return Response(data={"id": bot.id}, status=status.HTTP_201_CREATED)
+
+    @extend_schema(parameters=[PrefixHintQuerySerializer], responses={200: PrefixHintSerializer})
+    @action(detail=True, methods=["get"], throttle_classes=[ScopedRateThrottle], throttle_scope="prefix")
+    def prefix(self, request, pk=None):
+        game = self.get_object()
+        serializer = PrefixHintQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        if (hint := game.prefix_hint(**serializer.validated_data)) is None:
+            return Response(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE, data={"detail": "Prefix hints are unavailable."}
+            )
+        return Response(data=PrefixHintSerializer(hint).data)
+
     @action(detail=True, methods=["post"], authentication_classes=[RequiresSessionAuth])
     def turn(self, request, pk=None):
         game = self.get_object()
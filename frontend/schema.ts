@@ -68,6 +68,12 @@ export interface components {
             winner: string | null;
             currentPlayer: string | null;
             turnTimeLeft: number;
+            /** Format: date-time */
+            turnDeadline: string | null;
+            /** Format: date-time */
+            startsAt: string | null;
+            /** Format: date-time */
+            suspendedAt: string | null;
             words: components["schemas"]["ShiritoriGameWord"][];
             players: components["schemas"]["ShiritoriPlayer"][];
             currentRound: number;
@@ -95,6 +101,13 @@ export interface components {
             wordLength: number;
             turnTime: number;
             maxTurns: number;
+            /**
+             * @description * `REALTIME` - Real time
+             * * `CORRESPONDENCE` - Correspondence
+             * @enum {string}
+             */
+            mode?: "REALTIME" | "CORRESPONDENCE";
+            correspondenceTurnHours?: number;
         };
         ShiritoriGameWord: {
             word?: string | null;
@@ -24,6 +24,9 @@ export const useGameStore = defineStore("game", () => {
     const myId = ref<string>();
     const isJoining = ref<boolean | undefined>();
     const gameTurnTimeLeft = ref<number>(0);
+    // When the current turn runs out, on this browser's clock.
+    const turnDeadline = ref<number | null>(null);
+    let turnCountdown: ReturnType<typeof setInterval> | undefined;
     const initialSettings =
         ref<components["schemas"]["ShiritoriGameSettings"]>();
     const isGameStarting = ref<boolean>(false);
@@ -275,18 +278,90 @@ export const useGameStore = defineStore("game", () => {
         }
     };
 
+    const countDownTurn = () => {
+        if (turnDeadline.value === null) {
+            return;
+        }
+        const secondsLeft = Math.ceil((turnDeadline.value - Date.now()) / 1000);
+        gameTurnTimeLeft.value = Math.max(secondsLeft, 0);
+        if (secondsLeft <= 0) {
+            clearInterval(turnCountdown);
+        }
+    };
+
+    const syncTurnTimer = (sync: {
+        turnDeadline: number | null;
+        serverTime: number;
+    }) => {
+        clearInterval(turnCountdown);
+        if (sync.turnDeadline === null) {
+            turnDeadline.value = null;
+            return;
+        }
+        // The server only sends the deadline when a turn starts, the countdown runs here.
+        // Moving the deadline onto our clock keeps a skewed clock from stretching or cutting turns.
+        turnDeadline.value = sync.turnDeadline - sync.serverTime + Date.now();
+        countDownTurn();
+        turnCountdown = setInterval(countDownTurn, 250);
+    };
+
+    let startCountdown: ReturnType<typeof setInterval> | undefined;
+
+    const stopStartCountdown = () => {
+        clearInterval(startCountdown);
+        isGameStarting.value = false;
+        gameStartCountdown.value = 3;
+    };
+
+    const countDownToStart = (countdown: {
+        startsAt: number;
+        serverTime: number;
+    }) => {
+        clearInterval(startCountdown);
+        // One message per start, the countdown runs on our clock from here.
+        const startsAt = countdown.startsAt - countdown.serverTime + Date.now();
+        const tick = () => {
+            const secondsLeft = Math.ceil((startsAt - Date.now()) / 1000);
+            if (secondsLeft <= 0) {
+                stopStartCountdown();
+                return;
+            }
+            gameStartCountdown.value = secondsLeft;
+        };
+        isGameStarting.value = true;
+        tick();
+        startCountdown = setInterval(tick, 250);
+    };
+
+    const requestTurnTimerSync = () => {
+        const { socket } = useSocketStore();
+        if (socket?.readyState === WebSocket.OPEN) {
+            socket.send(JSON.stringify({ type: "timer_sync" }));
+        }
+    };
+
+    if (typeof document !== "undefined") {
+        // Background tabs throttle timers, catch up with the server when coming back.
+        document.addEventListener("visibilitychange", () => {
+            if (document.visibilityState === "visible") {
+                requestTurnTimerSync();
+            }
+        });
+    }
+
     const onSocketEvent = (e: MessageEvent) => {
         const eventData = JSON.parse(e.data);
         switch (eventData.type) {
             case "game_updated":
                 setGame(eventData.data);
                 break;
-            case "game_timer_updated":
-                setTurnTimeLeft(eventData.data);
+            case "game_timer_sync":
+                syncTurnTimer(eventData.data);
                 break;
             case "connected":
                 setGame(eventData.data.game);
                 setMe(eventData.data.selfPlayer);
+                requestTurnTimerSync();
                 break;
             case "player_connected":
                 setPlayerConnected(eventData.data.playerId, true);
@@ -307,17 +382,10 @@ export const useGameStore = defineStore("game", () => {
                 addWord(eventData.data);
                 break;
             case "game_start_countdown_start":
-                isGameStarting.value = true;
-                break;
-            case "game_start_countdown":
-                gameStartCountdown.value = eventData.data;
+                countDownToStart(eventData.data);
                 break;
             case "game_start_countdown_cancel":
-                isGameStarting.value = false;
-                break;
-            case "game_start_countdown_end":
-                isGameStarting.value = false;
-                gameStartCountdown.value = 3;
+                stopStartCountdown();
                 break;
 
             default:
@@ -368,6 +436,7 @@ export const useGameStore = defineStore("game", () => {
         handleCreateGame,
         handleTakeTurn,
         joinGameWS,
+        requestTurnTimerSync,
         setGame,
         setMe,
         setIsJoining,